@@ -7,12 +7,13 @@ Módulo central con la lógica de la aplicación.
 """
 
 from .app import ChessWithKaelithApp
-from .settings import SettingsManager
+from .settings import SettingsManager, PlaylistConfigStore
 from .profile_manager import ProfileManager, PlayerProfile
 
 __all__ = [
     'ChessWithKaelithApp',
     'SettingsManager',
+    'PlaylistConfigStore',
     'ProfileManager',
     'PlayerProfile',
 ]
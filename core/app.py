@@ -7,17 +7,26 @@ Controlador central que maneja la ventana principal,
 navegación entre pantallas y estado global.
 """
 
+import hashlib
+import json
+import mmap
 import tkinter as tk
+import weakref
 from tkinter import ttk
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Type, Optional, Callable
-from PIL import Image
+from typing import Dict, Type, Optional, Callable, Set, Tuple
+from PIL import Image, ImageTk
 
-from core.settings import SettingsManager
+from core.settings import SettingsManager, PlaylistConfigStore
 from core.profile_manager import ProfileManager
 from core.audio_manager import AudioManager
 from localization.i18n import I18nManager
 
+# Image.Resampling solo existe desde Pillow 9.1; Pillow-SIMD sigue en la
+# serie 9.x antigua y expone las constantes directamente en Image
+_Resampling = getattr(Image, 'Resampling', Image)
+
 
 class ChessWithKaelithApp:
     """
@@ -31,37 +40,60 @@ class ChessWithKaelithApp:
     MIN_WIDTH = 960
     MIN_HEIGHT = 540
     
+    # Número de fondos redimensionados que se mantienen en caché
+    BG_CACHE_SIZE = 4
+    
     def __init__(self):
         """Inicializa la aplicación y todos sus componentes."""
+        # Rutas importantes
+        self.root_path = Path(__file__).parent.parent
+        self.assets_path = self.root_path / "assets"
+        self.data_path = self.root_path / "data"
+        self.bg_cache_path = self.data_path / "bgcache"
+        
+        # Las traducciones se leen en segundo plano desde ya: la lectura se
+        # solapa con la creación de la ventana y del resto de managers
+        self.i18n = I18nManager(self.root_path / "localization")
+        
         # Crear ventana principal
         self.root = tk.Tk()
         self.root.title("Chess with Kaelith")
         self.root.geometry(f"{self.DEFAULT_WIDTH}x{self.DEFAULT_HEIGHT}")
         self.root.minsize(self.MIN_WIDTH, self.MIN_HEIGHT)
+        # Cerrar con la X también debe pasar por quit() para guardar lo pendiente
+        self.root.protocol("WM_DELETE_WINDOW", self.quit)
         
         # Centrar ventana
         self._center_window()
         
-        # Rutas importantes
-        self.root_path = Path(__file__).parent.parent
-        self.assets_path = self.root_path / "assets"
-        self.data_path = self.root_path / "data"
-        
         # Asegurar que existe el directorio de datos
         self.data_path.mkdir(exist_ok=True)
         
         # Inicializar managers
-        self.settings = SettingsManager(self.data_path / "settings.json")
-        self.profiles = ProfileManager(self.data_path / "profiles.json")
-        self.i18n = I18nManager(self.root_path / "localization")
-        self.audio = AudioManager(self.assets_path, self.settings)
+        self.settings = SettingsManager(self.data_path / "settings.json", scheduler=self.root.after)
+        self.profiles = ProfileManager(self.data_path / "profiles.json", scheduler=self.root.after)
+        # Las playlists viven en su propio archivo (migradas desde settings.json)
+        self.playlist_store = PlaylistConfigStore(
+            self.data_path / "playlists.json",
+            legacy_config=self.settings.pop("playlist_config"),
+        )
+        self.audio = AudioManager(
+            self.assets_path,
+            self.playlist_store,
+            scheduler=self.root.after,
+            effects_cache_path=(
+                self.data_path / "audiocache"
+                if self.settings.get("cache_effects_pcm", True) else None
+            )
+        )
         
         # Aplicar volúmenes guardados
         self.audio.set_master_volume(self.settings.get("volume", 0.7))
         self.audio.set_music_volume(self.settings.get("music_volume", 0.7))
         self.audio.set_effects_volume(self.settings.get("effects_volume", 0.8))
         
-        # Cargar idioma guardado
+        # Cargar idioma guardado (no espera a los archivos de traducción:
+        # la espera pasa al primer texto que se pida)
         saved_language = self.settings.get("language", "es")
         self.i18n.set_language(saved_language)
         
@@ -69,11 +101,26 @@ class ChessWithKaelithApp:
         self.current_screen: Optional[tk.Frame] = None
         self.screens: Dict[str, Type] = {}
         
-        # Referencia a imagen de fondo original (usada por las pantallas)
+        # Pantallas ya construidas (se ocultan/muestran en lugar de recrearse)
+        self._screen_pool: Dict[str, tk.Frame] = {}
+        
+        # Referencia a imagen de fondo original (usada por las pantallas).
+        # Se decodifica de forma diferida en _get_background_image()
+        self._bg_path: Optional[Path] = None
         self._original_bg: Optional[Image.Image] = None
+        # Resolución de pantalla para la que se redujo _original_bg
+        self._bg_screen_size: Optional[Tuple[int, int]] = None
+        
+        # Caché LRU de fondos ya redimensionados, indexada por (ancho, alto).
+        # Las entradas obsoletas (tras recargar el fondo) se repintan in situ.
+        self._bg_cache: 'OrderedDict[Tuple[int, int], ImageTk.PhotoImage]' = OrderedDict()
+        self._bg_stale: Set[Tuple[int, int]] = set()
+        # PhotoImage reutilizable para los tamaños de paso (arrastre del borde)
+        self._bg_fast_photo: Optional[ImageTk.PhotoImage] = None
         
-        # Callbacks para actualización de idioma
-        self._language_callbacks: list[Callable] = []
+        # Callbacks para actualización de idioma (referencias débiles, para
+        # no mantener vivas pantallas que olviden desregistrarse)
+        self._language_callbacks: list[weakref.ref] = []
         
         # Configurar estilo
         self._setup_styles()
@@ -81,8 +128,8 @@ class ChessWithKaelithApp:
         # Configurar fondo de la ventana (color de fallback)
         self.root.configure(bg='#1a2318')
         
-        # Cargar imagen de fondo original (se usará en cada pantalla)
-        self._load_background_image()
+        # Localizar imagen de fondo (se decodifica al primer uso)
+        self._resolve_background_path()
         
         # El contenedor principal es el root directamente
         self.main_container = self.root
@@ -122,32 +169,360 @@ class ChessWithKaelithApp:
             'bg_dark': '#1a2318',
             'button_hover': '#5a7751',
         }
+        
+        # Estilos de etiqueta compartidos: Tk interpreta colores y fuentes
+        # una vez por estilo en lugar de una vez por widget
+        bg = self.colors['bg_dark']
+        self.style.configure(
+            'Kaelith.Title.TLabel', background=bg, foreground=self.colors['accent'],
+            font=('Palatino Linotype', 36, 'bold')
+        )
+        self.style.configure(
+            'Kaelith.Subtitle.TLabel', background=bg, foreground=self.colors['primary_light'],
+            font=('Garamond', 18)
+        )
+        self.style.configure(
+            'Kaelith.Small.TLabel', background=bg, foreground=self.colors['secondary'],
+            font=('Garamond', 11)
+        )
+        self.style.configure(
+            'Kaelith.Version.TLabel', background=bg, foreground='#555555',
+            font=('Garamond', 9)
+        )
+        
+        # Etiquetas de las pestañas de opciones (sobre el panel de cada fila)
+        panel = '#2a3328'
+        self.style.configure(
+            'Kaelith.Heading.TLabel', background=bg, foreground=self.colors['accent'],
+            font=('Palatino Linotype', 28, 'bold')
+        )
+        self.style.configure(
+            'Kaelith.Row.TLabel', background=panel, foreground=self.colors['accent'],
+            font=('Garamond', 13)
+        )
+        self.style.configure(
+            'Kaelith.Section.TLabel', background=panel, foreground=self.colors['accent'],
+            font=('Garamond', 12, 'bold')
+        )
+        self.style.configure(
+            'Kaelith.Caption.TLabel', background=panel, foreground=self.colors['secondary'],
+            font=('Garamond', 10)
+        )
+        self.style.configure(
+            'Kaelith.Value.TLabel', background=panel, foreground=self.colors['text_light'],
+            font=('Garamond', 10, 'bold')
+        )
+        
+        # Pantallas de perfiles (textos sueltos y tarjetas de perfil)
+        self.style.configure(
+            'Kaelith.Prompt.TLabel', background=bg, foreground=self.colors['secondary'],
+            font=('Garamond', 14)
+        )
+        self.style.configure(
+            'Kaelith.Error.TLabel', background=bg, foreground='#cc4444',
+            font=('Garamond', 11)
+        )
+        self.style.configure(
+            'Kaelith.CardName.TLabel', background=panel, foreground=self.colors['text_light'],
+            font=('Garamond', 16, 'bold')
+        )
+        self.style.configure(
+            'Kaelith.CardStats.TLabel', background=panel, foreground=self.colors['secondary'],
+            font=('Garamond', 11)
+        )
+        self.style.configure(
+            'Kaelith.CardGames.TLabel', background=panel,
+            foreground=self.colors['primary_light'], font=('Garamond', 10)
+        )
+        self.style.configure(
+            'Kaelith.CardWins.TLabel', background=panel, foreground=self.colors['accent'],
+            font=('Garamond', 10)
+        )
+        
+        # Lista de pistas de las opciones de sonido: filas planas, sin borde
+        self.style.configure(
+            'Kaelith.Tracks.Treeview', background=panel, fieldbackground=panel,
+            foreground=self.colors['text_light'], font=('Garamond', 10),
+            borderwidth=0, rowheight=22
+        )
+        self.style.layout(
+            'Kaelith.Tracks.Treeview', [('Treeview.treearea', {'sticky': 'nswe'})]
+        )
     
-    def _load_background_image(self):
-        """Carga la imagen de fondo original (soporta png, jpg, webp)."""
+    def _resolve_background_path(self):
+        """Localiza la imagen de fondo sin decodificarla (soporta png, jpg, webp)."""
         # Buscar en orden de preferencia
         supported_formats = ['background.webp', 'background.png', 'background.jpg']
         
         for filename in supported_formats:
             bg_path = self.assets_path / filename
             if bg_path.exists():
-                try:
-                    # Abrir imagen
-                    img = Image.open(bg_path)
-                    # IMPORTANTE: Forzar carga completa de la imagen
-                    # (PIL hace lazy loading por defecto)
-                    img.load()
-                    # Convertir a RGBA para consistencia
-                    self._original_bg = img.convert('RGBA')
-                    print(f"Background cargado: {filename} ({img.width}x{img.height})")
-                    return
-                except Exception as e:
-                    print(f"Error cargando {filename}: {e}")
-                    import traceback
-                    traceback.print_exc()
+                self._bg_path = bg_path
+                return
         
         print(f"Background no encontrado en: {self.assets_path}")
+        self._bg_path = None
+    
+    def _get_background_image(self) -> Optional[Image.Image]:
+        """
+        Obtiene la imagen de fondo original, decodificándola en el primer uso.
+        
+        Returns:
+            Imagen original (RGB si es opaca, si no RGBA), o None si no
+            está disponible
+        """
+        screen_size = (self.root.winfo_screenwidth(), self.root.winfo_screenheight())
+        if self._original_bg is not None and screen_size != self._bg_screen_size:
+            # Cambió la resolución del monitor: el fondo reducido ya no sirve
+            self.reload_background()
+        
+        if self._original_bg is not None or self._bg_path is None:
+            return self._original_bg
+        
+        self._bg_screen_size = screen_size
+        
+        # Intentar primero la caché en disco (evita decodificar en cada arranque)
+        cache_key = self._background_cache_key()
+        cached = self._load_cached_background(cache_key) if cache_key else None
+        if cached is not None:
+            self._original_bg = self._drop_opaque_alpha(cached)
+            self._bg_stale = set(self._bg_cache)
+            return self._original_bg
+        
+        try:
+            # Abrir imagen
+            img = Image.open(self._bg_path)
+            # IMPORTANTE: Forzar carga completa de la imagen
+            # (PIL hace lazy loading por defecto)
+            img.load()
+            # Convertir a RGBA para consistencia
+            rgba = img.convert('RGBA')
+            # Limitar a la resolución de pantalla (sin dejar de cubrirla)
+            self._original_bg = self._cap_to_screen(rgba)
+            self._bg_stale = set(self._bg_cache)
+            print(f"Background cargado: {self._bg_path.name} ({img.width}x{img.height})")
+            
+            if cache_key:
+                self._store_cached_background(cache_key, self._original_bg)
+            self._original_bg = self._drop_opaque_alpha(self._original_bg)
+        except Exception as e:
+            print(f"Error cargando {self._bg_path.name}: {e}")
+            import traceback
+            traceback.print_exc()
+            # No reintentar en cada repintado
+            self._bg_path = None
+        
+        return self._original_bg
+    
+    def reload_background(self):
+        """
+        Vuelve a localizar y decodificar la imagen de fondo (p. ej. si el
+        archivo cambió). Los PhotoImage ya creados se reutilizan y se
+        repintan en la próxima petición de cada tamaño.
+        """
         self._original_bg = None
+        self._resolve_background_path()
+        self._bg_stale = set(self._bg_cache)
+    
+    def _background_cache_key(self) -> Optional[str]:
+        """
+        Calcula la clave de la caché en disco del fondo.
+        Cambia si cambia el archivo (ruta, fecha, tamaño) o la resolución.
+        
+        Returns:
+            Hash SHA-1 en hexadecimal, o None si no se puede leer el archivo
+        """
+        try:
+            stat = self._bg_path.stat()
+        except OSError:
+            return None
+        
+        screen = f"{self.root.winfo_screenwidth()}x{self.root.winfo_screenheight()}"
+        raw_key = f"{self._bg_path}|{stat.st_mtime_ns}|{stat.st_size}|{screen}"
+        return hashlib.sha1(raw_key.encode('utf-8')).hexdigest()
+    
+    def _load_cached_background(self, key: str) -> Optional[Image.Image]:
+        """
+        Carga el fondo ya procesado desde la caché en disco (vía mmap).
+        
+        Args:
+            key: Clave de caché
+            
+        Returns:
+            Imagen RGBA, o None si no está en caché o es inválida
+        """
+        raw_path = self.bg_cache_path / f"bg_{key}.raw"
+        meta_path = self.bg_cache_path / f"bg_{key}.json"
+        if not raw_path.exists() or not meta_path.exists():
+            return None
+        
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            size = (meta['width'], meta['height'])
+            
+            with open(raw_path, 'rb') as f:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            
+            if len(buffer) != size[0] * size[1] * 4:
+                buffer.close()
+                return None
+            
+            return Image.frombuffer('RGBA', size, buffer, 'raw', 'RGBA', 0, 1)
+        except (OSError, ValueError, KeyError, json.JSONDecodeError) as e:
+            print(f"Error leyendo caché de background: {e}")
+            return None
+    
+    def _store_cached_background(self, key: str, img: Image.Image):
+        """
+        Guarda el fondo procesado en la caché en disco, eliminando entradas
+        obsoletas.
+        
+        Args:
+            key: Clave de caché
+            img: Imagen RGBA a guardar
+        """
+        try:
+            self.bg_cache_path.mkdir(parents=True, exist_ok=True)
+            
+            # Eliminar entradas de otras versiones del fondo
+            for old_entry in self.bg_cache_path.glob('bg_*'):
+                if old_entry.stem != f"bg_{key}":
+                    old_entry.unlink()
+            
+            with open(self.bg_cache_path / f"bg_{key}.raw", 'wb') as f:
+                f.write(img.tobytes())
+            
+            # Los metadatos se escriben al final: marcan la entrada como completa
+            with open(self.bg_cache_path / f"bg_{key}.json", 'w', encoding='utf-8') as f:
+                json.dump({'width': img.width, 'height': img.height}, f)
+        except OSError as e:
+            print(f"Error guardando caché de background: {e}")
+    
+    def _drop_opaque_alpha(self, img: Image.Image) -> Image.Image:
+        """
+        Descarta el canal alfa si la imagen es totalmente opaca.
+        Los PhotoImage sin alfa se suben y se componen más rápido en Tk.
+        
+        Args:
+            img: Imagen RGBA
+            
+        Returns:
+            Imagen RGB si no había transparencia, o la misma imagen
+        """
+        if img.mode == 'RGBA' and img.getextrema()[3][0] == 255:
+            return img.convert('RGB')
+        return img
+    
+    def _cap_to_screen(self, img: Image.Image) -> Image.Image:
+        """
+        Reduce una imagen al menor tamaño que aún cubre la pantalla completa.
+        Evita mantener en memoria (y re-escalar) píxeles que nunca se verán.
+        
+        Args:
+            img: Imagen original
+            
+        Returns:
+            Imagen reducida, o la original si ya es suficientemente pequeña
+        """
+        screen_width = self.root.winfo_screenwidth()
+        screen_height = self.root.winfo_screenheight()
+        
+        # Escala de "cover": el lado más ajustado debe llenar la pantalla
+        scale = max(screen_width / img.width, screen_height / img.height)
+        if scale >= 1:
+            return img
+        
+        new_size = (
+            max(screen_width, round(img.width * scale)),
+            max(screen_height, round(img.height * scale)),
+        )
+        return img.resize(new_size, _Resampling.LANCZOS)
+    
+    def get_background_for_size(
+        self, width: int, height: int, fast: bool = False
+    ) -> Optional[ImageTk.PhotoImage]:
+        """
+        Obtiene el fondo escalado en modo "cover" para un tamaño dado.
+        Los resultados se cachean para evitar re-escalar en cada navegación.
+        
+        Args:
+            width: Ancho destino
+            height: Alto destino
+            fast: Usar BILINEAR sin cachear el resultado (tamaños
+                intermedios mientras se arrastra el borde de la ventana)
+            
+        Returns:
+            PhotoImage listo para usar, o None si no hay fondo
+        """
+        key = (width, height)
+        photo = self._bg_cache.get(key)
+        if photo is not None and key not in self._bg_stale:
+            self._bg_cache.move_to_end(key)
+            return photo
+        
+        img = self._get_background_image()
+        if img is None:
+            return None
+        
+        # Calcular dimensiones manteniendo aspecto (modo "cover")
+        img_ratio = img.width / img.height
+        win_ratio = width / height
+        
+        if win_ratio > img_ratio:
+            # Ventana más ancha que imagen
+            new_width = width
+            new_height = int(width / img_ratio)
+        else:
+            # Ventana más alta que imagen
+            new_height = height
+            new_width = int(height * img_ratio)
+        
+        # Reducción entera previa (box en C, muy rápida) si el factor lo permite
+        factor = min(img.width // new_width, img.height // new_height)
+        if factor >= 2:
+            img = img.reduce(factor)
+        
+        # Redimensionar imagen
+        resample = _Resampling.BILINEAR if fast else _Resampling.LANCZOS
+        resized = img.resize((new_width, new_height), resample)
+        
+        # Centrar y recortar para cubrir exactamente el área
+        left = (new_width - width) // 2
+        top = (new_height - height) // 2
+        cropped = resized.crop((left, top, left + width, top + height))
+        
+        if fast:
+            # Tamaño de paso: no desplazar de la caché a los definitivos.
+            # Se reutiliza un único PhotoImage: se ajusta su tamaño en Tk y
+            # se re-suben los píxeles en lugar de crear una imagen por evento
+            if self._bg_fast_photo is None:
+                self._bg_fast_photo = ImageTk.PhotoImage(cropped)
+            else:
+                self.root.tk.call(
+                    str(self._bg_fast_photo), 'configure',
+                    '-width', width, '-height', height
+                )
+                self._bg_fast_photo.paste(cropped)
+            return self._bg_fast_photo
+        
+        if photo is not None:
+            # Mismo tamaño: re-subir los píxeles sobre el PhotoImage existente
+            # (los labels que ya lo muestran se actualizan solos)
+            photo.paste(cropped)
+            self._bg_stale.discard(key)
+            self._bg_cache.move_to_end(key)
+            return photo
+        
+        photo = ImageTk.PhotoImage(cropped)
+        self._bg_cache[key] = photo
+        
+        # Descartar la entrada menos usada si se excede el tamaño
+        if len(self._bg_cache) > self.BG_CACHE_SIZE:
+            evicted, _ = self._bg_cache.popitem(last=False)
+            self._bg_stale.discard(evicted)
+        
+        return photo
     
     def _register_screens(self):
         """Registra todas las pantallas disponibles."""
@@ -163,9 +538,20 @@ class ChessWithKaelithApp:
             'options': OptionsMenuScreen,
         }
     
+    def _prewarm_screens(self):
+        """Ejecuta el precalentamiento de las pantallas aún no construidas."""
+        for name, screen_class in self.screens.items():
+            if name not in self._screen_pool:
+                try:
+                    screen_class.prewarm(self)
+                except Exception as e:
+                    print(f"Error precargando la pantalla '{name}': {e}")
+    
     def navigate_to(self, screen_name: str, **kwargs):
         """
         Navega a una pantalla específica.
+        Cada pantalla se construye una sola vez y luego se reutiliza;
+        al volver a mostrarla se invoca su método `on_show`.
         
         Args:
             screen_name: Nombre de la pantalla destino
@@ -175,24 +561,38 @@ class ChessWithKaelithApp:
             print(f"Pantalla '{screen_name}' no encontrada")
             return
         
-        # Destruir pantalla actual si existe
+        # Ocultar pantalla actual si existe (sin destruirla)
         if self.current_screen is not None:
-            self.current_screen.destroy()
+            self.current_screen.on_hide()
+            self.current_screen.place_forget()
+        
+        screen = self._screen_pool.get(screen_name)
+        if screen is None:
+            # Crear nueva pantalla (sobre el background)
+            screen = self.screens[screen_name](self.main_container, self, **kwargs)
+            self._screen_pool[screen_name] = screen
+        else:
+            screen.on_show(**kwargs)
         
-        # Crear nueva pantalla (sobre el background)
-        new_screen = self.screens[screen_name](self.main_container, self, **kwargs)
-        self.current_screen = new_screen
+        self.current_screen = screen
         # Usar place() para que la pantalla se coloque sobre el background
-        new_screen.place(relx=0, rely=0, relwidth=1, relheight=1)
+        screen.place(relx=0, rely=0, relwidth=1, relheight=1)
     
     def register_language_callback(self, callback: Callable):
         """Registra un callback para actualización de idioma."""
-        self._language_callbacks.append(callback)
+        if hasattr(callback, '__self__'):
+            self._language_callbacks.append(weakref.WeakMethod(callback))
+        else:
+            self._language_callbacks.append(weakref.ref(callback))
     
     def unregister_language_callback(self, callback: Callable):
-        """Elimina un callback de actualización de idioma."""
-        if callback in self._language_callbacks:
-            self._language_callbacks.remove(callback)
+        """Elimina un callback de actualización de idioma (y las referencias muertas)."""
+        remaining = []
+        for ref in self._language_callbacks:
+            registered = ref()
+            if registered is not None and registered != callback:
+                remaining.append(ref)
+        self._language_callbacks = remaining
     
     def change_language(self, language: str):
         """
@@ -204,21 +604,38 @@ class ChessWithKaelithApp:
         self.i18n.set_language(language)
         self.settings.set("language", language)
         
-        # Notificar a todos los callbacks
-        for callback in self._language_callbacks:
+        # Notificar a todos los callbacks (sobre una copia: pueden re-registrarse)
+        for ref in tuple(self._language_callbacks):
+            callback = ref()
+            if callback is None:
+                continue
             try:
                 callback()
             except Exception as e:
                 print(f"Error en callback de idioma: {e}")
+        
+        # Purgar referencias muertas
+        self._language_callbacks = [ref for ref in self._language_callbacks if ref() is not None]
     
     def get_text(self, key: str) -> str:
         """Obtiene un texto traducido."""
         return self.i18n.get(key)
     
+    def get_text_table(self) -> Dict[str, str]:
+        """Obtiene la tabla de textos del idioma actual (solo lectura)."""
+        return self.i18n.get_table()
+    
     def set_fullscreen(self, fullscreen: bool):
-        """Activa o desactiva pantalla completa."""
-        self.root.attributes("-fullscreen", fullscreen)
+        """Activa o desactiva pantalla completa y lo guarda."""
+        self.apply_fullscreen(fullscreen)
         self.settings.set("fullscreen", fullscreen)
+    
+    def apply_fullscreen(self, fullscreen: bool):
+        """
+        Activa o desactiva pantalla completa en la ventana, sin guardarlo
+        (vista previa de las opciones antes de Aplicar).
+        """
+        self.root.attributes("-fullscreen", fullscreen)
         # Actualizar background después del cambio
         self.root.after(100, self._update_background)
     
@@ -236,6 +653,12 @@ class ChessWithKaelithApp:
         # Mostrar menú principal
         self.navigate_to('main_menu')
         
+        # Precargar los efectos y la música del menú en segundo plano
+        # cuando la UI esté libre
+        self.root.after_idle(self.audio.preload_effects)
+        self.root.after_idle(lambda: self.audio.preload_music('menu'))
+        self.root.after_idle(self._prewarm_screens)
+        
         # Iniciar loop
         self.root.mainloop()
     
@@ -243,5 +666,7 @@ class ChessWithKaelithApp:
         """Cierra la aplicación de forma segura."""
         self.audio.stop_music()
         self.audio.cleanup()
-        self.settings.save()
+        # Persistir los guardados que aún estén agrupándose
+        self.settings.flush()
+        self.profiles.flush()
         self.root.quit()
\ No newline at end of file
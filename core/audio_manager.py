@@ -6,27 +6,81 @@ Gestiona música de fondo, playlists y efectos de sonido.
 Mantiene estado persistente entre navegaciones de pantalla.
 """
 
+import importlib.util
+import io
 import os
 import random
+import re
+import tempfile
+import threading
+import wave
+import weakref
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Callable, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Set, Callable, TYPE_CHECKING
 from dataclasses import dataclass, field
 
 if TYPE_CHECKING:
-    from core.settings import SettingsManager
+    from core.settings import PlaylistConfigStore
 
-# Intentar importar pygame para audio
-try:
-    os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "1"
-    import pygame
-    pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
-    AUDIO_AVAILABLE = True
-except ImportError:
-    AUDIO_AVAILABLE = False
+# Comprobar si pygame está instalado sin importarlo: tanto el import
+# como el mixer se inicializan de forma diferida en _init_mixer
+pygame = None
+AUDIO_AVAILABLE = importlib.util.find_spec('pygame') is not None
+if not AUDIO_AVAILABLE:
     print("⚠️ pygame no disponible - audio deshabilitado")
-except Exception as e:
-    AUDIO_AVAILABLE = False
-    print(f"⚠️ Error inicializando audio: {e}")
+
+_mixer_initialized = False
+
+# Canales de mezcla para efectos (SDL_mixer usa 8 por defecto)
+MIXER_CHANNELS = 32
+
+# Limpieza de nombres de pista: prefijo del juego y sufijos como "(Main Menu Song)"
+_TRACK_NAME_NOISE_RE = re.compile(r'Chess With Kaelith - |\(.*$')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=None)
+def _clean_track_name(filename: str) -> str:
+    """
+    Obtiene el nombre para mostrar de una pista a partir de su archivo.
+    Memorizado: el conjunto de archivos es pequeño y fijo.
+    
+    Args:
+        filename: Nombre del archivo de audio
+        
+    Returns:
+        Nombre limpio para mostrar
+    """
+    display_name = filename.rsplit('.', 1)[0].replace('_', ' ')
+    display_name = _TRACK_NAME_NOISE_RE.sub('', display_name)
+    return _WHITESPACE_RE.sub(' ', display_name).strip()  # Normalizar espacios
+
+
+def _init_mixer() -> bool:
+    """
+    Importa pygame e inicializa pygame.mixer la primera vez que se necesita.
+    
+    Returns:
+        True si el audio está disponible
+    """
+    global pygame, AUDIO_AVAILABLE, _mixer_initialized
+    
+    if _mixer_initialized or not AUDIO_AVAILABLE:
+        return AUDIO_AVAILABLE
+    
+    try:
+        os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "1"
+        import pygame
+        pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
+        # Evitar que clics rápidos agoten los canales y corten efectos
+        pygame.mixer.set_num_channels(MIXER_CHANNELS)
+        _mixer_initialized = True
+    except Exception as e:
+        AUDIO_AVAILABLE = False
+        print(f"⚠️ Error inicializando audio: {e}")
+    
+    return AUDIO_AVAILABLE
 
 
 @dataclass
@@ -42,18 +96,10 @@ class Track:
     def from_file(cls, filepath: Path, category: str) -> 'Track':
         """Crea un Track desde un archivo."""
         filename = filepath.name
-        # Limpiar nombre para mostrar
-        display_name = filename.rsplit('.', 1)[0]
-        display_name = display_name.replace('_', ' ')
-        display_name = display_name.replace('Chess With Kaelith - ', '')
-        # Quitar sufijos como "(Main Menu Song)"
-        if '(' in display_name:
-            display_name = display_name.split('(')[0].strip()
-        display_name = ' '.join(display_name.split())  # Normalizar espacios
         
         return cls(
             filename=filename,
-            display_name=display_name,
+            display_name=_clean_track_name(filename),
             path=filepath,
             category=category
         )
@@ -68,10 +114,34 @@ class Playlist:
     shuffle: bool = False
     repeat: bool = True
     _shuffled_order: List[int] = field(default_factory=list)
+    _enabled_cache: List[Track] = field(default_factory=list, repr=False)
+    _enabled_dirty: bool = field(default=True, repr=False)
+    
+    def invalidate(self):
+        """Marca como obsoleta la lista de pistas habilitadas.
+        Llamar tras modificar `tracks` o el estado `enabled` de una pista."""
+        self._enabled_dirty = True
+    
+    def reorder(self, order: List[str]):
+        """
+        Reordena las pistas según una lista de nombres de archivo.
+        Las pistas no mencionadas se mantienen al final en su orden actual.
+        
+        Args:
+            order: Nombres de archivo en el orden deseado
+        """
+        by_name = {t.filename: t for t in self.tracks}
+        ordered = [by_name.pop(fn) for fn in order if fn in by_name]
+        ordered.extend(by_name.values())
+        self.tracks = ordered
+        self.invalidate()
     
     def get_enabled_tracks(self) -> List[Track]:
-        """Obtiene solo las pistas habilitadas."""
-        return [t for t in self.tracks if t.enabled]
+        """Obtiene solo las pistas habilitadas (cacheadas hasta invalidate())."""
+        if self._enabled_dirty:
+            self._enabled_cache = [t for t in self.tracks if t.enabled]
+            self._enabled_dirty = False
+        return self._enabled_cache
     
     def get_current_track(self) -> Optional[Track]:
         """Obtiene la pista actual."""
@@ -119,8 +189,13 @@ class Playlist:
         """Regenera el orden aleatorio."""
         enabled = self.get_enabled_tracks()
         if enabled:
-            self._shuffled_order = list(range(len(enabled)))
-            random.shuffle(self._shuffled_order)
+            last = self._shuffled_order[-1] if self._shuffled_order else None
+            order = list(range(len(enabled)))
+            random.shuffle(order)
+            # No empezar el nuevo ciclo con la pista que acaba de sonar
+            if len(order) > 1 and order[0] == last:
+                order[0], order[-1] = order[-1], order[0]
+            self._shuffled_order = order
     
     def set_shuffle(self, enabled: bool):
         """Activa/desactiva el modo aleatorio."""
@@ -138,7 +213,7 @@ class AudioManager:
     - Estado persistente entre navegaciones
     - Detección automática de pistas
     - Configuración de playlist guardable
-    - Efectos de sonido precargados
+    - Efectos de sonido decodificados bajo demanda
     """
     
     # Categorías de música soportadas
@@ -149,23 +224,64 @@ class AudioManager:
         'defeat': 'Defeat',
     }
     
-    def __init__(self, assets_path: Path, settings: Optional['SettingsManager'] = None):
+    # Clasificador de categoría: un grupo con nombre por categoría
+    _CATEGORY_RE = re.compile(
+        '|'.join(f'(?P<{c}>{re.escape(p)})' for c, p in CATEGORIES.items())
+    )
+    
+    # Efectos de sonido disponibles
+    SOUND_EFFECTS = {
+        'button_play': 'Efecto_de_Sonido_Boton_Jugar.mp3',
+        'button_options': 'Efecto_Sonido_Opciones_y_Cambiar_Lenguaje.mp3',
+        'button_language': 'Efecto_Sonido_Opciones_y_Cambiar_Lenguaje.mp3',
+        'button_apply': 'Efecto_de_Sonido_Boton_Aplicar_Cambios.mp3',
+        'button_discard': 'Efecto_de_Sonido_Descartar_Cambios_En_Opciones.mp3',
+    }
+    
+    # Duración del fade out al cambiar de pista (ms)
+    TRACK_FADEOUT_MS = 300
+    
+    # Retardo para agrupar escrituras de la configuración de playlist (ms)
+    SAVE_DELAY_MS = 250
+    
+    def __init__(
+        self,
+        assets_path: Path,
+        playlist_store: Optional['PlaylistConfigStore'] = None,
+        scheduler: Optional[Callable[[int, Callable[[], None]], Any]] = None,
+        effects_cache_path: Optional[Path] = None
+    ):
         """
         Inicializa el motor de audio.
         
         Args:
             assets_path: Ruta a la carpeta de assets
-            settings: Gestor de configuraciones (opcional, para persistencia)
+            playlist_store: Almacén de configuración de playlists
+                (opcional, para persistencia)
+            scheduler: Función tipo `root.after(ms, func)` para diferir tareas
+                (opcional; sin ella los guardados son inmediatos)
+            effects_cache_path: Carpeta donde guardar los efectos ya
+                decodificados como WAV (opcional; sin ella se decodifica
+                el MP3 en cada ejecución)
         """
         self.assets_path = assets_path
         self.audio_path = assets_path / "audio"
-        self.settings = settings
+        self.effects_cache_path = effects_cache_path
+        self.playlist_store = playlist_store
+        self._scheduler = scheduler
+        self._save_pending = False
+        # Última configuración de playlist persistida (para omitir escrituras iguales)
+        self._last_playlist_config: Optional[Dict[str, Any]] = None
         
         # Volúmenes (0.0 - 1.0)
         self._master_volume = 0.7
         self._music_volume = 0.7
         self._effects_volume = 0.8
         
+        # Volúmenes efectivos (maestro × canal), precalculados
+        self._effective_music = self._master_volume * self._music_volume
+        self._effective_effects = self._master_volume * self._effects_volume
+        
         # Estado de reproducción
         self._current_category: Optional[str] = None
         self._current_track: Optional[Track] = None
@@ -174,18 +290,41 @@ class AudioManager:
         
         # Playlists por categoría
         self._playlists: Dict[str, Playlist] = {}
+        # Categorías que ya han sonado en esta sesión
+        self._started_categories: Set[str] = set()
+        
+        # Rutas de efectos y cache de los ya decodificados. La cache se indexa
+        # por ruta: varios efectos pueden compartir el mismo archivo
+        self._effects_paths: Dict[str, Path] = {}
+        self._effects_cache: Dict[Path, 'pygame.mixer.Sound'] = {}
+        # La cache se comparte con el hilo de precarga de efectos
+        self._effects_lock = threading.Lock()
         
-        # Cache de efectos de sonido
-        self._effects_cache: Dict[str, 'pygame.mixer.Sound'] = {}
+        # Pistas precargadas en memoria (MP3 sin decodificar), por ruta.
+        # Las escribe el hilo de precarga; cada asignación es atómica
+        self._music_data: Dict[Path, bytes] = {}
         
-        # Callbacks para notificaciones
-        self._on_track_change: List[Callable[[Track], None]] = []
+        # Callbacks para notificaciones (referencias débiles)
+        self._on_track_change: List[weakref.ref] = []
         
-        # Inicializar
-        if AUDIO_AVAILABLE:
-            self._scan_audio_files()
-            self._load_sound_effects()
-            self._load_playlist_settings()
+        # La inicialización real (mixer + escaneo) se difiere al primer uso
+        self._initialized = False
+    
+    def _ensure_initialized(self) -> bool:
+        """
+        Inicializa el mixer y escanea los archivos de audio en el primer uso.
+        
+        Returns:
+            True si el audio está disponible
+        """
+        if not self._initialized:
+            self._initialized = True
+            if _init_mixer():
+                self._scan_audio_files()
+                self._load_sound_effects()
+                self._load_playlist_settings()
+        
+        return AUDIO_AVAILABLE
     
     def _scan_audio_files(self):
         """Escanea la carpeta de audio y organiza las pistas por categoría."""
@@ -193,78 +332,179 @@ class AudioManager:
             return
         
         # Extensiones de audio soportadas
-        audio_extensions = ('*.mp3', '*.ogg', '*.wav')
-        
-        for category, pattern in self.CATEGORIES.items():
-            tracks = []
-            # Buscar en todas las extensiones soportadas
-            for ext in audio_extensions:
-                for filepath in self.audio_path.glob(ext):
-                    if pattern in filepath.name:
-                        track = Track.from_file(filepath, category)
-                        tracks.append(track)
-            
+        audio_extensions = {'.mp3', '.ogg', '.wav'}
+        
+        tracks_by_category: Dict[str, List[Track]] = {c: [] for c in self.CATEGORIES}
+        
+        # Un único recorrido del directorio, clasificando cada archivo
+        with os.scandir(self.audio_path) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                name = entry.name
+                if os.path.splitext(name)[1].lower() not in audio_extensions:
+                    continue
+                match = self._CATEGORY_RE.search(name)
+                if match:
+                    category = match.lastgroup
+                    tracks_by_category[category].append(
+                        Track.from_file(Path(entry.path), category)
+                    )
+        
+        for category, tracks in tracks_by_category.items():
             if tracks:
                 self._playlists[category] = Playlist(name=category, tracks=tracks)
     
     def _load_sound_effects(self):
-        """Precarga los efectos de sonido en memoria."""
+        """Registra las rutas de los efectos (se decodifican al primer uso)."""
         if not AUDIO_AVAILABLE:
             return
         
-        effects = {
-            'button_play': 'Efecto_de_Sonido_Boton_Jugar.mp3',
-            'button_options': 'Efecto_Sonido_Opciones_y_Cambiar_Lenguaje.mp3',
-            'button_language': 'Efecto_Sonido_Opciones_y_Cambiar_Lenguaje.mp3',
-            'button_apply': 'Efecto_de_Sonido_Boton_Aplicar_Cambios.mp3',
-            'button_discard': 'Efecto_de_Sonido_Descartar_Cambios_En_Opciones.mp3',
-        }
-        
-        for effect_name, filename in effects.items():
+        for effect_name, filename in self.SOUND_EFFECTS.items():
             filepath = self.audio_path / filename
             if filepath.exists():
+                self._effects_paths[effect_name] = filepath
+    
+    def _get_effect_sound(self, effect_name: str) -> Optional['pygame.mixer.Sound']:
+        """Obtiene un efecto, decodificándolo la primera vez que se pide."""
+        filepath = self._effects_paths.get(effect_name)
+        if filepath is None:
+            return None
+        
+        with self._effects_lock:
+            sound = self._effects_cache.get(filepath)
+        if sound is None:
+            # Decodificar fuera del lock para no bloquear al otro hilo
+            try:
+                sound = self._decode_effect(filepath)
+            except Exception as e:
+                print(f"Error cargando efecto {effect_name}: {e}")
+                # No reintentar la decodificación en cada clic
+                self._effects_paths.pop(effect_name, None)
+                return None
+            with self._effects_lock:
+                if filepath in self._effects_cache:
+                    sound = self._effects_cache[filepath]
+                else:
+                    # El volumen se fija al entrar en la cache; después solo
+                    # se actualiza cuando cambia (ver _apply_effects_volume)
+                    sound.set_volume(self._effective_effects)
+                    self._effects_cache[filepath] = sound
+        return sound
+    
+    def _decode_effect(self, filepath: Path) -> 'pygame.mixer.Sound':
+        """
+        Decodifica un efecto, usando su copia WAV en caché si existe.
+        La primera vez convierte el MP3 a WAV para que las siguientes
+        ejecuciones no tengan que decodificarlo.
+        
+        Args:
+            filepath: Ruta al archivo original del efecto
+            
+        Returns:
+            Sonido listo para reproducir
+        """
+        if self.effects_cache_path is None:
+            return pygame.mixer.Sound(str(filepath))
+        
+        cache_file = self.effects_cache_path / (filepath.stem + '.wav')
+        try:
+            if cache_file.stat().st_mtime_ns >= filepath.stat().st_mtime_ns:
+                return pygame.mixer.Sound(str(cache_file))
+        except (OSError, pygame.error):
+            pass
+        
+        sound = pygame.mixer.Sound(str(filepath))
+        self._store_cached_effect(cache_file, sound)
+        return sound
+    
+    def _store_cached_effect(self, cache_file: Path, sound: 'pygame.mixer.Sound'):
+        """
+        Guarda un efecto decodificado como WAV con el formato del mixer.
+        
+        Args:
+            cache_file: Ruta del WAV a escribir
+            sound: Sonido ya decodificado
+        """
+        frequency, size, channels = pygame.mixer.get_init()
+        # WAV de 8 bits es sin signo: solo se cachean formatos de 16+ bits
+        if abs(size) < 16:
+            return
+        
+        tmp_name = None
+        try:
+            self.effects_cache_path.mkdir(parents=True, exist_ok=True)
+            # Temporal con nombre único: dos hilos de precarga que escriban
+            # el mismo efecto no se pisan el archivo
+            with tempfile.NamedTemporaryFile(
+                dir=self.effects_cache_path,
+                prefix=f"{cache_file.stem}.",
+                suffix='.tmp',
+                delete=False
+            ) as tmp:
+                tmp_name = tmp.name
+                with wave.open(tmp, 'wb') as f:
+                    f.setnchannels(channels)
+                    f.setsampwidth(abs(size) // 8)
+                    f.setframerate(frequency)
+                    f.writeframes(sound.get_raw())
+            # Renombrar al final: el WAV nunca queda a medio escribir
+            os.replace(tmp_name, cache_file)
+        except (OSError, wave.Error) as e:
+            print(f"Error guardando caché de efecto {cache_file.name}: {e}")
+            if tmp_name is not None:
                 try:
-                    self._effects_cache[effect_name] = pygame.mixer.Sound(str(filepath))
-                except Exception as e:
-                    print(f"Error cargando efecto {effect_name}: {e}")
+                    os.remove(tmp_name)
+                except OSError:
+                    pass
     
     def _load_playlist_settings(self):
-        """Carga las preferencias de playlist desde settings."""
-        if not self.settings:
+        """Carga las preferencias de playlist desde su almacén."""
+        if not self.playlist_store:
             return
         
-        playlist_config = self.settings.get("playlist_config", {})
+        playlist_config = self.playlist_store.get()
+        self._last_playlist_config = playlist_config
         
         for category, config in playlist_config.items():
             if category in self._playlists:
                 playlist = self._playlists[category]
                 
                 # Restaurar estado de habilitación de pistas
-                enabled_tracks = config.get("enabled_tracks", [])
+                # (conjunto: comprobar cada pista es O(1))
+                enabled_tracks = set(config.get("enabled_tracks", ()))
                 if enabled_tracks:
                     for track in playlist.tracks:
                         track.enabled = track.filename in enabled_tracks
+                    playlist.invalidate()
                 
                 # Restaurar orden
                 track_order = config.get("track_order", [])
                 if track_order:
-                    ordered = []
-                    remaining = list(playlist.tracks)
-                    for filename in track_order:
-                        for track in remaining:
-                            if track.filename == filename:
-                                ordered.append(track)
-                                remaining.remove(track)
-                                break
-                    ordered.extend(remaining)
-                    playlist.tracks = ordered
+                    playlist.reorder(track_order)
                 
                 playlist.shuffle = config.get("shuffle", False)
                 playlist.repeat = config.get("repeat", True)
     
     def save_playlist_settings(self):
-        """Guarda las preferencias de playlist en settings."""
-        if not self.settings:
+        """
+        Solicita guardar las preferencias de playlist.
+        Las solicitudes en ráfaga se agrupan en una única escritura.
+        """
+        if self._scheduler is None:
+            self.flush_playlist_settings()
+            return
+        
+        if not self._save_pending:
+            self._save_pending = True
+            self._scheduler(self.SAVE_DELAY_MS, self.flush_playlist_settings)
+    
+    def flush_playlist_settings(self):
+        """Guarda inmediatamente las preferencias de playlist en su almacén."""
+        self._save_pending = False
+        
+        # Sin inicializar no hay playlists: no sobrescribir la configuración
+        if not self.playlist_store or not self._initialized:
             return
         
         playlist_config = {}
@@ -277,33 +517,59 @@ class AudioManager:
                 "repeat": playlist.repeat,
             }
         
-        self.settings.set("playlist_config", playlist_config)
+        # Omitir la escritura si nada cambió desde el último guardado
+        if playlist_config == self._last_playlist_config:
+            return
+        
+        self._last_playlist_config = playlist_config
+        self.playlist_store.set(playlist_config)
     
     # ==================== CONTROL DE VOLUMEN ====================
     
+    # Cambio mínimo de volumen de música que se envía a pygame
+    VOLUME_EPSILON = 1e-3
+    
     def set_master_volume(self, volume: float):
         """Establece el volumen maestro (0.0 - 1.0)."""
         self._master_volume = max(0.0, min(1.0, volume))
-        self._apply_music_volume()
+        self._update_effective_volumes()
     
     def set_music_volume(self, volume: float):
         """Establece el volumen de música (0.0 - 1.0)."""
         self._music_volume = max(0.0, min(1.0, volume))
-        self._apply_music_volume()
+        self._update_effective_volumes()
     
     def set_effects_volume(self, volume: float):
         """Establece el volumen de efectos (0.0 - 1.0)."""
         self._effects_volume = max(0.0, min(1.0, volume))
+        self._update_effective_volumes()
+    
+    def _update_effective_volumes(self):
+        """Recalcula los volúmenes efectivos y los aplica solo si cambiaron."""
+        effects = self._master_volume * self._effects_volume
+        if abs(effects - self._effective_effects) > self.VOLUME_EPSILON:
+            self._effective_effects = effects
+            self._apply_effects_volume()
+        
+        music = self._master_volume * self._music_volume
+        if abs(music - self._effective_music) > self.VOLUME_EPSILON:
+            self._effective_music = music
+            self._apply_music_volume()
     
     def _apply_music_volume(self):
         """Aplica el volumen actual a la música."""
         if AUDIO_AVAILABLE and self._is_playing:
-            effective_volume = self._master_volume * self._music_volume
-            pygame.mixer.music.set_volume(effective_volume)
+            pygame.mixer.music.set_volume(self._effective_music)
+    
+    def _apply_effects_volume(self):
+        """Aplica el volumen actual a todos los efectos ya decodificados."""
+        with self._effects_lock:
+            for sound in self._effects_cache.values():
+                sound.set_volume(self._effective_effects)
     
     def _get_effective_effects_volume(self) -> float:
         """Obtiene el volumen efectivo para efectos."""
-        return self._master_volume * self._effects_volume
+        return self._effective_effects
     
     # ==================== REPRODUCCIÓN DE MÚSICA ====================
     
@@ -321,15 +587,15 @@ class AudioManager:
         Returns:
             Nombre de la pista actual si hubo cambio, None si ya estaba sonando
         """
-        if not AUDIO_AVAILABLE:
+        if not self._ensure_initialized():
             return None
         
-        # Si ya está reproduciéndose la misma categoría, NO hacer nada
-        if (self._current_category == category and 
-            self._is_playing and 
-            not force_restart and
-            pygame.mixer.music.get_busy()):
-            return None  # Retorna None para indicar que NO hubo cambio
+        # Si ya está reproduciéndose la misma categoría, NO hacer nada.
+        # Las comprobaciones en Python van primero; get_busy() (llamada nativa)
+        # solo se consulta cuando realmente puede decidir el resultado
+        if self._current_category == category and self._is_playing and not force_restart:
+            if pygame.mixer.music.get_busy():
+                return None  # Retorna None para indicar que NO hubo cambio
         
         # Cambiar a nueva categoría o forzar reinicio
         return self._start_playlist(category)
@@ -347,11 +613,19 @@ class AudioManager:
         
         playlist = self._playlists[category]
         
-        # Si shuffle está activo, seleccionar pista aleatoria
+        # Si shuffle está activo, recorrer el orden ya barajado en lugar de
+        # sortear en cada entrada: no se repite pista hasta sonar todas
         if playlist.shuffle:
-            enabled = playlist.get_enabled_tracks()
-            if enabled:
-                playlist.current_index = random.randint(0, len(enabled) - 1)
+            if category in self._started_categories:
+                # Sin repeat, next_track() no da la vuelta al acabar el
+                # ciclo: empezar uno nuevo con otro orden, no el mismo
+                if playlist.next_track() is None:
+                    playlist._reshuffle()
+                    playlist.current_index = 0
+            else:
+                self._started_categories.add(category)
+                playlist._reshuffle()
+                playlist.current_index = 0
         
         track = playlist.get_current_track()
         
@@ -361,35 +635,110 @@ class AudioManager:
         return self._play_track(track, category)
     
     def _play_track(self, track: Track, category: str, fade_ms: int = 2000) -> Optional[str]:
-        """Reproduce una pista específica."""
+        """
+        Reproduce una pista específica.
+        Si ya hay música sonando, la carga de la nueva pista se difiere hasta
+        que termine el fade out (sin bloquear el loop de la interfaz). Sin
+        planificador no hay forma de diferirla: se corta la actual y listo.
+        """
         if not AUDIO_AVAILABLE or not track.path.exists():
             return None
         
         try:
-            # Detener música actual con fade out si hay
-            if self._is_playing and pygame.mixer.music.get_busy():
-                pygame.mixer.music.fadeout(300)
-                pygame.time.wait(300)
-            
-            # Cargar y reproducir
-            pygame.mixer.music.load(str(track.path))
-            pygame.mixer.music.set_volume(self._master_volume * self._music_volume)
-            pygame.mixer.music.play(loops=-1, fade_ms=fade_ms)  # loops=-1 para loop infinito
-            
-            # Actualizar estado
-            self._current_category = category
-            self._current_track = track
-            self._is_playing = True
-            self._is_paused = False
-            
-            # Notificar cambio de pista
-            self._notify_track_change(track)
-            
+            # Detener música actual con fade out si hay y se puede esperar
+            # a que acabe sin bloquear
+            fading = (
+                self._scheduler is not None
+                and self._is_playing
+                and pygame.mixer.music.get_busy()
+            )
+            if fading:
+                pygame.mixer.music.fadeout(self.TRACK_FADEOUT_MS)
+        except Exception as e:
+            print(f"Error reproduciendo música: {e}")
+            return None
+        
+        # Actualizar estado de inmediato (la carga puede diferirse)
+        self._current_category = category
+        self._current_track = track
+        self._is_playing = True
+        self._is_paused = False
+        
+        if fading:
+            self._scheduler(
+                self.TRACK_FADEOUT_MS,
+                lambda: self._finish_play_track(track, fade_ms)
+            )
+            return track.display_name
+        
+        if self._finish_play_track(track, fade_ms):
             return track.display_name
+        return None
+    
+    def _finish_play_track(self, track: Track, fade_ms: int) -> bool:
+        """
+        Carga y reproduce una pista ya seleccionada por _play_track.
+        
+        Returns:
+            True si la pista comenzó a sonar
+        """
+        # Descartar si otra pista (o un stop) llegó durante el fade out
+        if self._current_track is not track:
+            return False
+        
+        try:
+            # Un fade out aún en curso (p. ej. de stop_music) se corta de forma
+            # explícita: cargar durante el fade puede bloquear el callback de audio
+            if pygame.mixer.music.get_busy():
+                pygame.mixer.music.stop()
             
+            # Cargar (desde memoria si la pista está precargada) y reproducir
+            data = self._music_data.get(track.path)
+            if data is not None:
+                pygame.mixer.music.load(io.BytesIO(data), track.path.suffix[1:])
+            else:
+                pygame.mixer.music.load(str(track.path))
+            pygame.mixer.music.set_volume(self._effective_music)
+            pygame.mixer.music.play(loops=-1, fade_ms=fade_ms)  # loops=-1 para loop infinito
         except Exception as e:
             print(f"Error reproduciendo música: {e}")
-            return None
+            self._current_category = None
+            self._current_track = None
+            self._is_playing = False
+            return False
+        
+        # Notificar cambio de pista
+        self._notify_track_change(track)
+        return True
+    
+    def preload_music(self, category: str):
+        """
+        Lee en memoria, en un hilo en segundo plano, los archivos de las
+        pistas activas de una categoría. La música se sigue decodificando
+        en streaming; solo se evita volver a leer el disco en cada entrada.
+        
+        Args:
+            category: Categoría de música ('menu', 'battle', etc.)
+        """
+        if not self._ensure_initialized():
+            return
+        
+        playlist = self._playlists.get(category)
+        if playlist is None:
+            return
+        
+        paths = [track.path for track in playlist.get_enabled_tracks()]
+        
+        def load():
+            for path in paths:
+                if path in self._music_data:
+                    continue
+                try:
+                    self._music_data[path] = path.read_bytes()
+                except OSError as e:
+                    print(f"Error precargando pista {path.name}: {e}")
+        
+        threading.Thread(target=load, name="music-preload", daemon=True).start()
     
     def play_next(self) -> Optional[str]:
         """Reproduce la siguiente pista de la playlist actual."""
@@ -449,15 +798,33 @@ class AudioManager:
     
     # ==================== EFECTOS DE SONIDO ====================
     
+    def preload_effects(self, effect_names: Optional[List[str]] = None):
+        """
+        Decodifica efectos en un hilo en segundo plano para que su primer
+        uso no tenga latencia en el hilo de la interfaz.
+        
+        Args:
+            effect_names: Nombres de los efectos a precargar (todos si es None)
+        """
+        if not self._ensure_initialized():
+            return
+        
+        names = list(self._effects_paths) if effect_names is None else list(effect_names)
+        threading.Thread(
+            target=lambda: [self._get_effect_sound(name) for name in names],
+            name="effects-preload",
+            daemon=True
+        ).start()
+    
     def play_effect(self, effect_name: str):
         """Reproduce un efecto de sonido."""
-        if not AUDIO_AVAILABLE:
+        if not self._ensure_initialized():
             return
         
-        if effect_name in self._effects_cache:
+        sound = self._get_effect_sound(effect_name)
+        if sound is not None:
             try:
-                sound = self._effects_cache[effect_name]
-                sound.set_volume(self._get_effective_effects_volume())
+                # El volumen ya está aplicado: ver _apply_effects_volume
                 sound.play()
             except Exception as e:
                 print(f"Error reproduciendo efecto {effect_name}: {e}")
@@ -466,7 +833,7 @@ class AudioManager:
     
     def is_playing(self) -> bool:
         """Indica si hay música reproduciéndose."""
-        if AUDIO_AVAILABLE:
+        if AUDIO_AVAILABLE and _mixer_initialized:
             return pygame.mixer.music.get_busy() or self._is_paused
         return False
     
@@ -482,44 +849,51 @@ class AudioManager:
         """Obtiene la categoría de música actual."""
         return self._current_category
     
+    def is_playing_category(self, category: str) -> bool:
+        """
+        Indica si la música solicitada es de una categoría (sin consultar
+        al mixer: solo el estado en Python).
+        
+        Args:
+            category: Categoría de música ('menu', 'battle', etc.)
+        """
+        return self._is_playing and self._current_category == category
+    
     def get_playlist(self, category: str) -> Optional[Playlist]:
         """Obtiene una playlist por categoría."""
+        self._ensure_initialized()
         return self._playlists.get(category)
     
     def get_available_categories(self) -> List[str]:
         """Obtiene las categorías con música disponible."""
+        self._ensure_initialized()
         return list(self._playlists.keys())
     
     # ==================== CONFIGURACIÓN DE PLAYLIST ====================
     
     def set_track_enabled(self, category: str, filename: str, enabled: bool):
         """Habilita/deshabilita una pista en una playlist."""
+        self._ensure_initialized()
         playlist = self._playlists.get(category)
         if playlist:
             for track in playlist.tracks:
                 if track.filename == filename:
                     track.enabled = enabled
                     break
+            playlist.invalidate()
             self.save_playlist_settings()
     
     def reorder_tracks(self, category: str, new_order: List[str]):
         """Reordena las pistas de una playlist."""
+        self._ensure_initialized()
         playlist = self._playlists.get(category)
         if playlist:
-            ordered = []
-            remaining = list(playlist.tracks)
-            for filename in new_order:
-                for track in remaining:
-                    if track.filename == filename:
-                        ordered.append(track)
-                        remaining.remove(track)
-                        break
-            ordered.extend(remaining)
-            playlist.tracks = ordered
+            playlist.reorder(new_order)
             self.save_playlist_settings()
     
     def set_shuffle(self, category: str, enabled: bool):
         """Activa/desactiva modo aleatorio para una playlist."""
+        self._ensure_initialized()
         playlist = self._playlists.get(category)
         if playlist:
             playlist.set_shuffle(enabled)
@@ -527,6 +901,7 @@ class AudioManager:
     
     def set_repeat(self, category: str, enabled: bool):
         """Activa/desactiva repetición para una playlist."""
+        self._ensure_initialized()
         playlist = self._playlists.get(category)
         if playlist:
             playlist.repeat = enabled
@@ -536,25 +911,40 @@ class AudioManager:
     
     def register_track_change_callback(self, callback: Callable[[Track], None]):
         """Registra un callback para cuando cambie la pista."""
-        self._on_track_change.append(callback)
+        if hasattr(callback, '__self__'):
+            self._on_track_change.append(weakref.WeakMethod(callback))
+        else:
+            self._on_track_change.append(weakref.ref(callback))
     
     def unregister_track_change_callback(self, callback: Callable[[Track], None]):
         """Elimina un callback de cambio de pista."""
-        if callback in self._on_track_change:
-            self._on_track_change.remove(callback)
+        self._on_track_change = [
+            ref for ref in self._on_track_change
+            if ref() is not None and ref() != callback
+        ]
     
     def _notify_track_change(self, track: Track):
         """Notifica a los callbacks de un cambio de pista."""
-        for callback in self._on_track_change:
+        for ref in tuple(self._on_track_change):
+            callback = ref()
+            if callback is None:
+                continue
             try:
                 callback(track)
             except Exception as e:
                 print(f"Error en callback de cambio de pista: {e}")
+        
+        # Purgar referencias muertas
+        self._on_track_change = [ref for ref in self._on_track_change if ref() is not None]
     
     # ==================== LIMPIEZA ====================
     
     def cleanup(self):
         """Limpia recursos de audio."""
-        if AUDIO_AVAILABLE:
+        # Persistir cambios de playlist pendientes
+        if self._save_pending:
+            self.flush_playlist_settings()
+        
+        if AUDIO_AVAILABLE and _mixer_initialized:
             pygame.mixer.music.stop()
             pygame.mixer.quit()
\ No newline at end of file
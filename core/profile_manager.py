@@ -7,16 +7,37 @@ Gestiona la creación, almacenamiento y recuperación de perfiles de jugador.
 """
 
 import json
-import uuid
-from datetime import datetime
+import os
+import time
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Optional
-from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, List, Optional
+from dataclasses import dataclass, field
+
+# orjson (opcional) serializa y parsea varias veces más rápido que json.
+# Ambas variantes aceptan PlayerProfile directamente: orjson serializa los
+# dataclasses en C (omitiendo los campos con "_"), json usa to_dict()
+try:
+    import orjson
+    
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+    
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+    
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(
+            obj, indent=2, ensure_ascii=False, default=lambda o: o.to_dict()
+        ).encode('utf-8')
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerProfile:
-    """Representa un perfil de jugador."""
+    """Representa un perfil de jugador (con __slots__: sin __dict__ por instancia)."""
     id: str
     nickname: str
     created_at: str
@@ -27,10 +48,16 @@ class PlayerProfile:
     games_draw: int = 0
     current_level: int = 1
     experience: int = 0
+    # Marca de tiempo de la última partida aún sin formatear a ISO (0 = ninguna)
+    _last_played_ts: float = field(default=0.0, init=False, repr=False, compare=False)
     
     @classmethod
     def create_new(cls, nickname: str) -> 'PlayerProfile':
         """Crea un nuevo perfil con valores iniciales."""
+        # Imports diferidos: cargar perfiles al arrancar no los necesita
+        import uuid
+        from datetime import datetime
+        
         now = datetime.now().isoformat()
         return cls(
             id=str(uuid.uuid4()),
@@ -40,12 +67,35 @@ class PlayerProfile:
         )
     
     def update_last_played(self):
-        """Actualiza la fecha de última partida."""
-        self.last_played = datetime.now().isoformat()
+        """
+        Actualiza la fecha de última partida.
+        Solo guarda la marca de tiempo; el texto ISO se genera al leerlo.
+        """
+        self._last_played_ts = time.time()
+    
+    def _format_last_played(self):
+        """Vuelca a last_played (ISO) la marca de tiempo pendiente, si la hay."""
+        if self._last_played_ts:
+            from datetime import datetime
+            self.last_played = datetime.fromtimestamp(self._last_played_ts).isoformat()
+            self._last_played_ts = 0.0
     
     def to_dict(self) -> Dict:
         """Convierte el perfil a diccionario."""
-        return asdict(self)
+        self._format_last_played()
+        # Construcción directa: asdict() hace una copia profunda recursiva
+        return {
+            'id': self.id,
+            'nickname': self.nickname,
+            'created_at': self.created_at,
+            'last_played': self.last_played,
+            'games_played': self.games_played,
+            'games_won': self.games_won,
+            'games_lost': self.games_lost,
+            'games_draw': self.games_draw,
+            'current_level': self.current_level,
+            'experience': self.experience,
+        }
     
     @classmethod
     def from_dict(cls, data: Dict) -> 'PlayerProfile':
@@ -68,24 +118,43 @@ class ProfileManager:
     
     MAX_PROFILES = 5  # Máximo número de perfiles permitidos
     
-    def __init__(self, filepath: Path):
+    # Retardo para agrupar actualizaciones de perfil en ráfaga (ms)
+    SAVE_DELAY_MS = 500
+    
+    # Tiempo mínimo para volver a guardar al reactivar el mismo perfil (s)
+    ACTIVE_RESAVE_SECONDS = 1.0
+    
+    def __init__(
+        self,
+        filepath: Path,
+        scheduler: Optional[Callable[[int, Callable[[], None]], Any]] = None
+    ):
         """
         Inicializa el gestor de perfiles.
         
         Args:
             filepath: Ruta al archivo de perfiles
+            scheduler: Función tipo `root.after(ms, func)` para diferir
+                los guardados (opcional; sin ella son inmediatos)
         """
         self.filepath = filepath
         self._profiles: Dict[str, PlayerProfile] = {}
         self._active_profile_id: Optional[str] = None
+        self._scheduler = scheduler
+        self._dirty = False
+        self._save_pending = False
+        # Se incrementa con cada cambio en los perfiles (ver `version`)
+        self._version = 0
+        # Momento (reloj monótono) de la última activación que se guardó
+        self._activated_at = 0.0
         self._load()
     
     def _load(self):
         """Carga los perfiles desde el archivo."""
         if self.filepath.exists():
             try:
-                with open(self.filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                with open(self.filepath, 'rb') as f:
+                    data = _loads(f.read())
                     
                     # Cargar perfiles
                     profiles_data = data.get('profiles', {})
@@ -100,23 +169,46 @@ class ProfileManager:
     
     def _save(self):
         """Guarda los perfiles en el archivo."""
+        self._dirty = False
         try:
             self.filepath.parent.mkdir(parents=True, exist_ok=True)
             
+            for profile in self._profiles.values():
+                profile._format_last_played()
+            
+            # Los perfiles se pasan tal cual, sin construir un dict por perfil
             data = {
-                'profiles': {
-                    profile_id: profile.to_dict() 
-                    for profile_id, profile in self._profiles.items()
-                },
+                'profiles': self._profiles,
                 'active_profile_id': self._active_profile_id
             }
             
-            with open(self.filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Escribir a un temporal y renombrar: el archivo nunca queda a medias
+            tmp_path = self.filepath.with_suffix(self.filepath.suffix + '.tmp')
+            with open(tmp_path, 'wb') as f:
+                f.write(_dumps(data))
+            os.replace(tmp_path, self.filepath)
                 
         except IOError as e:
             print(f"Error guardando perfiles: {e}")
     
+    def _schedule_save(self):
+        """Programa un guardado, agrupando las solicitudes en ráfaga."""
+        self._dirty = True
+        
+        if self._scheduler is None:
+            self.flush()
+            return
+        
+        if not self._save_pending:
+            self._save_pending = True
+            self._scheduler(self.SAVE_DELAY_MS, self.flush)
+    
+    def flush(self):
+        """Guarda inmediatamente si hay cambios pendientes."""
+        self._save_pending = False
+        if self._dirty:
+            self._save()
+    
     def create_profile(self, nickname: str) -> Optional[PlayerProfile]:
         """
         Crea un nuevo perfil de jugador.
@@ -144,6 +236,7 @@ class ProfileManager:
         # Crear nuevo perfil
         profile = PlayerProfile.create_new(nickname)
         self._profiles[profile.id] = profile
+        self._version += 1
         self._save()
         
         return profile
@@ -167,9 +260,12 @@ class ProfileManager:
         Returns:
             Lista de perfiles
         """
+        for profile in self._profiles.values():
+            profile._format_last_played()
+        
         return sorted(
             self._profiles.values(),
-            key=lambda p: p.last_played,
+            key=attrgetter('last_played'),
             reverse=True
         )
     
@@ -189,6 +285,7 @@ class ProfileManager:
             if self._active_profile_id == profile_id:
                 self._active_profile_id = None
             
+            self._version += 1
             self._save()
             return True
         return False
@@ -203,12 +300,24 @@ class ProfileManager:
         Returns:
             True si se estableció, False si no existe el perfil
         """
-        if profile_id in self._profiles:
-            self._active_profile_id = profile_id
-            self._profiles[profile_id].update_last_played()
-            self._save()
+        profile = self._profiles.get(profile_id)
+        if profile is None:
+            return False
+        
+        # Reactivar el perfil que ya está activo justo después (p. ej. al
+        # volver a la pantalla) no merece reescribir el archivo
+        now = time.monotonic()
+        if (profile_id == self._active_profile_id
+                and now - self._activated_at < self.ACTIVE_RESAVE_SECONDS):
             return True
-        return False
+        
+        self._activated_at = now
+        self._active_profile_id = profile_id
+        profile.update_last_played()
+        self._version += 1
+        # Guardado agrupado: el formateo a ISO sale del clic
+        self._schedule_save()
+        return True
     
     def get_active_profile(self) -> Optional[PlayerProfile]:
         """
@@ -237,10 +346,19 @@ class ProfileManager:
             for key, value in kwargs.items():
                 if hasattr(profile, key):
                     setattr(profile, key, value)
-            self._save()
+            self._version += 1
+            self._schedule_save()
             return True
         return False
     
+    @property
+    def version(self) -> int:
+        """
+        Contador de cambios: crece al crear, eliminar, activar o actualizar
+        un perfil. Permite saber si hay que volver a pintar los perfiles.
+        """
+        return self._version
+    
     @property
     def profile_count(self) -> int:
         """Número de perfiles existentes."""
@@ -7,8 +7,47 @@ Gestiona la persistencia de configuraciones de la aplicación.
 """
 
 import json
+import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
+
+# orjson (opcional) serializa y parsea varias veces más rápido que json
+try:
+    import orjson
+    
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+    
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+    
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+class SettingsAttributes:
+
+    """
+    Vista de solo lectura de la configuración por atributos
+    (`settings.opts.volume`). Los valores por defecto salen de
+    SettingsManager.DEFAULTS, y una clave desconocida lanza AttributeError
+    en lugar de devolver None en silencio.
+    """
+    
+    __slots__ = ('_manager',)
+    
+    def __init__(self, manager: 'SettingsManager'):
+        self._manager = manager
+    
+    def __getattr__(self, name: str) -> Any:
+        manager = self._manager
+        if name not in manager.DEFAULTS and name not in manager._settings:
+            raise AttributeError(f"Configuración desconocida: {name}")
+        return manager.get(name)
+
 
 
 class SettingsManager:
@@ -28,18 +67,35 @@ class SettingsManager:
         "resolution": "1280x720",
         "text_size": "medium",
         "high_contrast": False,
+        "cache_effects_pcm": True,
     }
     
-    def __init__(self, filepath: Path):
+    # Retardo para agrupar escrituras en ráfaga, p. ej. al arrastrar un slider (ms)
+    SAVE_DELAY_MS = 500
+    
+    def __init__(
+        self,
+        filepath: Path,
+        scheduler: Optional[Callable[[int, Callable[[], None]], Any]] = None
+    ):
 
         """
         Inicializa el gestor de configuraciones.
         
         Args:
             filepath: Ruta al archivo de configuración
+            scheduler: Función tipo `root.after(ms, func)` para diferir
+                los guardados (opcional; sin ella son inmediatos)
         """
         self.filepath = filepath
         self._settings: Dict[str, Any] = {}
+        # Cambios sin confirmar (se guardan con commit_pending o se descartan)
+        self._pending: Dict[str, Any] = {}
+        self._scheduler = scheduler
+        self._dirty = False
+        self._save_pending = False
+        # Acceso por atributos: settings.opts.volume
+        self.opts = SettingsAttributes(self)
         self._load()
     
 
@@ -49,8 +105,8 @@ class SettingsManager:
 
         if self.filepath.exists():
             try:
-                with open(self.filepath, 'r', encoding='utf-8') as f:
-                    self._settings = json.load(f)
+                with open(self.filepath, 'rb') as f:
+                    self._settings = _loads(f.read())
             except (json.JSONDecodeError, IOError) as e:
                 print(f"Error cargando configuración: {e}")
                 self._settings = {}
@@ -66,12 +122,16 @@ class SettingsManager:
 
         """Guarda las configuraciones en el archivo."""
 
+        self._dirty = False
         try:
             # Asegurar que el directorio existe
             self.filepath.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(self.filepath, 'w', encoding='utf-8') as f:
-                json.dump(self._settings, f, indent=2, ensure_ascii=False)
+            # Escribir a un temporal y renombrar: el archivo nunca queda a medias
+            tmp_path = self.filepath.with_suffix(self.filepath.suffix + '.tmp')
+            with open(tmp_path, 'wb') as f:
+                f.write(_dumps(self._settings))
+            os.replace(tmp_path, self.filepath)
         except IOError as e:
             print(f"Error guardando configuración: {e}")
     
@@ -89,6 +149,8 @@ class SettingsManager:
             Valor de la configuración
         """
 
+        if key in self._pending:
+            return self._pending[key]
         return self._settings.get(key, default if default is not None else self.DEFAULTS.get(key))
     
 
@@ -102,8 +164,68 @@ class SettingsManager:
             value: Nuevo valor
         """
 
+        # Un valor confirmado reemplaza al pendiente de la misma clave
+        self._pending.pop(key, None)
+        
+        # Sin cambios: no hay nada que guardar
+        if key in self._settings and self._settings[key] == value:
+            return
+        
         self._settings[key] = value
-        self.save()  # Auto-guardar
+        self._dirty = True
+        self._schedule_save()  # Auto-guardar (agrupado)
+    
+    def set_pending(self, key: str, value: Any):
+
+        """
+        Establece un valor solo en memoria, sin programar ningún guardado.
+        get() ya lo devuelve; se persiste con commit_pending().
+        
+        Args:
+            key: Clave de la configuración
+            value: Nuevo valor
+        """
+
+        if self._settings.get(key) == value:
+            self._pending.pop(key, None)
+        else:
+            self._pending[key] = value
+    
+    def commit_pending(self):
+
+        """Confirma los valores pendientes y guarda una sola vez."""
+
+        if self._pending:
+            self._settings.update(self._pending)
+            self._pending.clear()
+            self._dirty = True
+        self.flush()
+    
+    def discard_pending(self):
+
+        """Descarta los valores pendientes sin tocar el archivo."""
+
+        self._pending.clear()
+    
+    def _schedule_save(self):
+
+        """Programa un guardado, agrupando las solicitudes en ráfaga."""
+
+        if self._scheduler is None:
+            self.flush()
+            return
+        
+        if not self._save_pending:
+            self._save_pending = True
+            self._scheduler(self.SAVE_DELAY_MS, self.flush)
+    
+    def flush(self):
+
+        """Guarda inmediatamente si hay cambios pendientes."""
+
+        self._save_pending = False
+        if self._dirty:
+            self.save()
     
     def reset(self, key: Optional[str] = None):
 
@@ -121,6 +243,25 @@ class SettingsManager:
             self._settings = self.DEFAULTS.copy()
         self.save()
     
+    def pop(self, key: str, default: Any = None) -> Any:
+
+        """
+        Elimina una clave de configuración y devuelve su valor.
+        
+        Args:
+            key: Clave de la configuración
+            default: Valor a devolver si no existe
+            
+        Returns:
+            Valor eliminado, o default
+        """
+
+        if key not in self._settings:
+            return default
+        value = self._settings.pop(key)
+        self.save()
+        return value
+    
     def get_all(self) -> Dict[str, Any]:
 
         """
@@ -130,4 +271,87 @@ class SettingsManager:
             Diccionario con todas las configuraciones
         """
         
-        return self._settings.copy()
+        return {**self._settings, **self._pending}
+
+
+
+class PlaylistConfigStore:
+
+    """
+    Almacén de la configuración de playlists.
+    Vive en su propio archivo JSON para que los cambios frecuentes de
+    configuración (volumen, idioma...) no reescriban las playlists.
+    """
+    
+    def __init__(self, filepath: Path, legacy_config: Optional[Dict[str, Any]] = None):
+
+        """
+        Inicializa el almacén de playlists.
+        
+        Args:
+            filepath: Ruta al archivo de playlists
+            legacy_config: Configuración previa (de settings.json) a migrar
+                si el archivo aún no existe
+        """
+
+        self.filepath = filepath
+        self._config: Dict[str, Any] = {}
+        self._load(legacy_config)
+    
+
+    def _load(self, legacy_config: Optional[Dict[str, Any]] = None):
+
+        """Carga la configuración desde el archivo."""
+
+        if self.filepath.exists():
+            try:
+                with open(self.filepath, 'rb') as f:
+                    self._config = _loads(f.read())
+            except (json.JSONDecodeError, IOError) as e:
+                print(f"Error cargando playlists: {e}")
+                self._config = {}
+        elif legacy_config:
+            # Migrar desde el formato anterior (todo en settings.json)
+            self._config = legacy_config
+            self.save()
+    
+
+    def save(self):
+
+        """Guarda la configuración en el archivo."""
+
+        try:
+            self.filepath.parent.mkdir(parents=True, exist_ok=True)
+            
+            # Escribir a un temporal y renombrar: el archivo nunca queda a medias
+            tmp_path = self.filepath.with_suffix(self.filepath.suffix + '.tmp')
+            with open(tmp_path, 'wb') as f:
+                f.write(_dumps(self._config))
+            os.replace(tmp_path, self.filepath)
+        except IOError as e:
+            print(f"Error guardando playlists: {e}")
+    
+
+    def get(self) -> Dict[str, Any]:
+
+        """
+        Obtiene la configuración de playlists.
+        
+        Returns:
+            Diccionario {categoría: configuración}
+        """
+
+        return self._config
+    
+
+    def set(self, config: Dict[str, Any]):
+
+        """
+        Reemplaza y guarda la configuración de playlists.
+        
+        Args:
+            config: Diccionario {categoría: configuración}
+        """
+
+        self._config = config
+        self.save()
@@ -7,8 +7,20 @@ Sistema de traducciones para soporte multiidioma.
 """
 
 import json
+import sys
+import threading
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
+
+# orjson (opcional) parsea varias veces más rápido que json
+try:
+    import orjson
+    
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+except ImportError:
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
 
 
 class I18nManager:
@@ -34,12 +46,28 @@ class I18nManager:
         self.localization_path = localization_path
         self._current_language = self.DEFAULT_LANGUAGE
         self._translations: Dict[str, Dict[str, str]] = {}
+        # Traducciones del idioma actual ya combinadas con las del idioma
+        # por defecto: get() resuelve con una sola búsqueda
+        self._active: Dict[str, str] = {}
         
         # Cargar traducciones por defecto
         self._load_default_translations()
         
-        # Intentar cargar desde archivos
-        self._load_translations()
+        # Intentar cargar desde archivos en segundo plano, solapando la
+        # lectura con la construcción de la ventana. El primer uso espera.
+        self._load_thread: Optional[threading.Thread] = threading.Thread(
+            target=self._load_translations,
+            name="i18n-load",
+            daemon=True
+        )
+        self._load_thread.start()
+    
+    def _finish_loading(self):
+        """Espera a que terminen de cargarse los archivos de traducción."""
+        if self._load_thread is not None:
+            self._load_thread.join()
+            self._load_thread = None
+            self._rebuild_active()
     
     def _load_default_translations(self):
         """Carga las traducciones por defecto embebidas."""
@@ -192,11 +220,23 @@ class I18nManager:
             filepath = self.localization_path / f"{lang_code}.json"
             if filepath.exists():
                 try:
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        self._translations[lang_code].update(json.load(f))
+                    with open(filepath, 'rb') as f:
+                        data = _loads(f.read())
+                    # Internar las claves leídas del archivo: las literales del
+                    # código ya lo están, y así get() compara por identidad
+                    self._translations[lang_code].update(
+                        (sys.intern(key), value) for key, value in data.items()
+                    )
                 except (json.JSONDecodeError, IOError) as e:
                     print(f"Error cargando traducciones de {lang_code}: {e}")
     
+    def _rebuild_active(self):
+        """Combina el idioma actual sobre el de por defecto (fallback)."""
+        self._active = {
+            **self._translations.get(self.DEFAULT_LANGUAGE, {}),
+            **self._translations.get(self._current_language, {}),
+        }
+    
     def set_language(self, language: str):
         """
         Establece el idioma actual.
@@ -206,6 +246,10 @@ class I18nManager:
         """
         if language in self.SUPPORTED_LANGUAGES:
             self._current_language = language
+            # Con la carga aún en curso, _finish_loading() combinará el
+            # idioma nuevo en el primer get(); no hace falta esperar aquí
+            if self._load_thread is None:
+                self._rebuild_active()
     
     def get_language(self) -> str:
         """
@@ -227,19 +271,24 @@ class I18nManager:
         Returns:
             Texto traducido
         """
-        translations = self._translations.get(self._current_language, {})
-        
-        if key in translations:
-            return translations[key]
-        
-        # Fallback al idioma por defecto
-        if self._current_language != self.DEFAULT_LANGUAGE:
-            default_translations = self._translations.get(self.DEFAULT_LANGUAGE, {})
-            if key in default_translations:
-                return default_translations[key]
+        if self._load_thread is not None:
+            self._finish_loading()
         
         # Si no hay traducción, devolver la clave o el default
-        return default if default is not None else key
+        return self._active.get(key, default if default is not None else key)
+    
+    def get_table(self) -> Dict[str, str]:
+        """
+        Obtiene la tabla de traducciones del idioma actual (ya combinada
+        con la del idioma por defecto), para resolver muchas claves
+        seguidas con `tabla.get(clave, clave)`. No debe modificarse.
+        
+        Returns:
+            Diccionario {clave: texto}
+        """
+        if self._load_thread is not None:
+            self._finish_loading()
+        return self._active
     
     def get_language_name(self, language: Optional[str] = None) -> str:
         """
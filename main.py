@@ -12,6 +12,14 @@ import sys
 import os
 from pathlib import Path
 
+# Versión mínima de Python (los dataclasses usan slots=True, desde 3.10)
+MIN_PYTHON = (3, 10)
+if sys.version_info < MIN_PYTHON:
+    sys.exit(
+        f"Chess with Kaelith necesita Python {MIN_PYTHON[0]}.{MIN_PYTHON[1]} o superior "
+        f"(detectado {sys.version_info.major}.{sys.version_info.minor})"
+    )
+
 # Asegurar que el directorio raíz está en el path
 ROOT_DIR = Path(__file__).parent
 sys.path.insert(0, str(ROOT_DIR))
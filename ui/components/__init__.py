@@ -11,6 +11,7 @@ from .widgets import (
     StyledSlider,
     StyledEntry,
     LanguageToggle,
+    SegmentedToggle,
     SemiTransparentFrame,
 )
 
@@ -19,5 +20,6 @@ __all__ = [
     'StyledSlider',
     'StyledEntry',
     'LanguageToggle',
+    'SegmentedToggle',
     'SemiTransparentFrame',
 ]
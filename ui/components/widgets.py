@@ -7,9 +7,10 @@ Componentes de interfaz reutilizables con estilo personalizado.
 """
 
 import tkinter as tk
+from tkinter import font as tkfont
 from tkinter import ttk
-from typing import Callable, Optional, Tuple
-from PIL import Image, ImageTk, ImageDraw, ImageFilter
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+from PIL import Image, ImageColor, ImageTk, ImageDraw, ImageFilter
 
 
 class StyledButton(tk.Canvas):
@@ -18,6 +19,33 @@ class StyledButton(tk.Canvas):
     Inspirado en la estética del bosque místico.
     """
     
+    # Paletas de colores según tipo (primario / secundario)
+    PALETTES = {
+        True: {
+            'bg': '#4a6741',
+            'bg_hover': '#5a7751',
+            'bg_pressed': '#3a5331',
+            'border': '#6b8b5e',
+            'text': '#f5f0e6',
+            'shadow': '#1a2318',
+        },
+        False: {
+            'bg': '#3d4a38',
+            'bg_hover': '#4d5a48',
+            'bg_pressed': '#2d3a28',
+            'border': '#5a6b55',
+            'text': '#e5e0d6',
+            'shadow': '#1a2318',
+        },
+    }
+    
+    # Imágenes ya renderizadas, compartidas entre botones iguales.
+    # Clave: (ancho, alto, primario, estado)
+    _IMAGE_CACHE: Dict[Tuple[int, int, bool, str], ImageTk.PhotoImage] = {}
+    
+    # Capas estáticas (sombra, brillo) reutilizadas entre estados y botones
+    _LAYER_CACHE: Dict[tuple, Image.Image] = {}
+    
     def __init__(
         self, 
         parent, 
@@ -60,29 +88,25 @@ class StyledButton(tk.Canvas):
         self._is_hovered = False
         self._is_pressed = False
         self._is_enabled = True
+        # Redibujado programado con after_idle (None si no hay ninguno)
+        self._render_job = None
         
         # Colores según tipo
-        if primary:
-            self.colors = {
-                'bg': '#4a6741',
-                'bg_hover': '#5a7751',
-                'bg_pressed': '#3a5331',
-                'border': '#6b8b5e',
-                'text': '#f5f0e6',
-                'shadow': '#1a2318',
-            }
-        else:
-            self.colors = {
-                'bg': '#3d4a38',
-                'bg_hover': '#4d5a48',
-                'bg_pressed': '#2d3a28',
-                'border': '#5a6b55',
-                'text': '#e5e0d6',
-                'shadow': '#1a2318',
-            }
-        
-        # Crear imagen del botón
-        self._create_button_image()
+        self.colors = dict(self.PALETTES[primary])
+        
+        # Items del canvas: se crean una vez y cada estado solo los reconfigura
+        self._image_item = self.create_image(0, 0, anchor='nw')
+        self._text_item = self.create_text(
+            self.width // 2,
+            self.height // 2,
+            text=self.text,
+            font=('Garamond', self.font_size, 'bold'),
+            anchor='center'
+        )
+        
+        # La imagen del botón se crea al mostrarse por primera vez: los
+        # botones de pantallas aún no visitadas no pagan el render
+        self._map_binding = self.bind('<Map>', self._on_first_map, add='+')
         
         # Bindings
         self.bind('<Enter>', self._on_enter)
@@ -90,108 +114,239 @@ class StyledButton(tk.Canvas):
         self.bind('<Button-1>', self._on_press)
         self.bind('<ButtonRelease-1>', self._on_release)
     
-    def _create_button_image(self):
-        """Crea la imagen del botón con efectos."""
-        # Determinar color según estado
+    def _state(self) -> str:
+        """Estado visual actual: 'disabled', 'pressed', 'hover' o 'normal'."""
         if not self._is_enabled:
-            bg_color = '#555555'
-            text_color = '#888888'
-        elif self._is_pressed:
-            bg_color = self.colors['bg_pressed']
-            text_color = self.colors['text']
-        elif self._is_hovered:
-            bg_color = self.colors['bg_hover']
-            text_color = self.colors['text']
-        else:
-            bg_color = self.colors['bg']
-            text_color = self.colors['text']
-        
-        # Crear imagen base con transparencia
-        img = Image.new('RGBA', (self.width, self.height), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
-        
-        # Dibujar sombra
-        shadow_offset = 3 if not self._is_pressed else 1
-        draw.rounded_rectangle(
-            [shadow_offset, shadow_offset, self.width - 2, self.height - 2],
-            radius=12,
-            fill=self.colors['shadow'] + '80'
-        )
+            return 'disabled'
+        if self._is_pressed:
+            return 'pressed'
+        if self._is_hovered:
+            return 'hover'
+        return 'normal'
+    
+    def _render_state(self):
+        """Muestra la imagen y el texto del botón según su estado."""
+        state = self._state()
+        text_color = '#888888' if state == 'disabled' else self.colors['text']
+        
+        # Reutilizar el render si otro botón igual ya lo generó
+        key = (self.width, self.height, self.primary, state)
+        photo = self._IMAGE_CACHE.get(key)
+        if photo is None:
+            photo = ImageTk.PhotoImage(self._render_image(state))
+            self._IMAGE_CACHE[key] = photo
+        self._button_image = photo
+        self.itemconfig(self._image_item, image=photo)
+        
+        # Actualizar texto (se desplaza hacia abajo al presionar)
+        text_y = self.height // 2 + (2 if state == 'pressed' else 0)
+        self.coords(self._text_item, self.width // 2, text_y)
+        self.itemconfig(self._text_item, fill=text_color)
+    
+    def _on_first_map(self, event):
+        """Renderiza el botón la primera vez que se muestra."""
+        self.unbind('<Map>', self._map_binding)
+        self._map_binding = None
+        self._render_state()
+    
+    def _request_render(self):
+        """
+        Programa un redibujado para el próximo ciclo ocioso de Tk.
+        Varios eventos seguidos (Enter/Leave en ráfaga) se agrupan en uno.
+        """
+        if self._render_job is None:
+            self._render_job = self.after_idle(self._do_render)
+    
+    def _do_render(self):
+        """Ejecuta el redibujado pendiente."""
+        self._render_job = None
+        self._render_state()
+    
+    def _render_image(self, state: str) -> Image.Image:
+        """
+        Dibuja el fondo del botón para un estado.
         
-        # Dibujar fondo del botón
-        y_offset = 2 if self._is_pressed else 0
-        draw.rounded_rectangle(
-            [2, y_offset, self.width - 4, self.height - 4 + y_offset],
-            radius=10,
-            fill=bg_color,
-            outline=self.colors['border'],
-            width=2
-        )
+        Args:
+            state: Estado visual (ver _state)
+            
+        Returns:
+            Imagen RGBA del botón (sin texto)
+        """
+        pressed = state == 'pressed'
+        bg_color = {
+            'disabled': '#555555',
+            'pressed': self.colors['bg_pressed'],
+            'hover': self.colors['bg_hover'],
+            'normal': self.colors['bg'],
+        }[state]
+        
+        # Partir de la sombra ya dibujada (imagen base con transparencia)
+        img = self._get_shadow_layer(
+            self.width, self.height, pressed, self.colors['shadow']
+        ).copy()
+        
+        # Fondo y borde del botón: colores sólidos pegados a través de las
+        # máscaras cacheadas (sin volver a trazar el rectángulo redondeado)
+        fill_mask, outline_mask = self._get_body_masks(self.width, self.height, pressed)
+        box = (0, 0, self.width, self.height)
+        img.paste(bg_color, box, fill_mask)
+        img.paste(self.colors['border'], box, outline_mask)
         
         # Efecto de brillo en la parte superior
-        if not self._is_pressed:
-            for i in range(8):
-                alpha = int(30 - i * 3)
-                draw.line(
-                    [(10 + i, 6 + i), (self.width - 12 - i, 6 + i)],
-                    fill=f'#ffffff{alpha:02x}',
-                    width=1
-                )
-        
-        self._button_image = ImageTk.PhotoImage(img)
-        
-        # Limpiar y redibujar
-        self.delete('all')
-        self.create_image(0, 0, image=self._button_image, anchor='nw')
-        
-        # Añadir texto
-        text_y = self.height // 2 + (2 if self._is_pressed else 0)
-        self.create_text(
-            self.width // 2,
-            text_y,
-            text=self.text,
-            fill=text_color,
-            font=('Garamond', self.font_size, 'bold'),
-            anchor='center'
-        )
+        if not pressed:
+            highlight, mask = self._get_highlight_layer(self.width, self.height)
+            img.paste(highlight, (0, 0), mask)
+        
+        return img
+    
+    @classmethod
+    def _get_shadow_layer(cls, width: int, height: int, pressed: bool, color: str) -> Image.Image:
+        """
+        Obtiene la capa de sombra del botón (cacheada).
+        
+        Args:
+            width: Ancho del botón
+            height: Alto del botón
+            pressed: Si el botón está presionado (sombra más corta)
+            color: Color de la sombra
+            
+        Returns:
+            Imagen RGBA con la sombra sobre fondo transparente
+        """
+        key = ('shadow', width, height, pressed, color)
+        layer = cls._LAYER_CACHE.get(key)
+        if layer is None:
+            layer = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+            shadow_offset = 3 if not pressed else 1
+            # Tupla RGBA (alfa 0x80) en lugar de la cadena '#rrggbb80'
+            ImageDraw.Draw(layer).rounded_rectangle(
+                [shadow_offset, shadow_offset, width - 2, height - 2],
+                radius=12,
+                fill=ImageColor.getrgb(color) + (0x80,)
+            )
+            cls._LAYER_CACHE[key] = layer
+        return layer
+    
+    @classmethod
+    def _get_body_masks(cls, width: int, height: int, pressed: bool) -> Tuple[Image.Image, Image.Image]:
+        """
+        Obtiene las máscaras del cuerpo del botón (cacheadas).
+        
+        Args:
+            width: Ancho del botón
+            height: Alto del botón
+            pressed: Si el botón está presionado (cuerpo desplazado)
+            
+        Returns:
+            Tupla (máscara L del relleno, máscara L del borde)
+        """
+        key = ('body', width, height, pressed)
+        cached = cls._LAYER_CACHE.get(key)
+        if cached is None:
+            # Trazar una sola vez con etiquetas: 1 = relleno, 2 = borde
+            labels = Image.new('L', (width, height), 0)
+            y_offset = 2 if pressed else 0
+            ImageDraw.Draw(labels).rounded_rectangle(
+                [2, y_offset, width - 4, height - 4 + y_offset],
+                radius=10,
+                fill=1,
+                outline=2,
+                width=2
+            )
+            cached = (
+                labels.point(lambda v: 255 if v == 1 else 0),
+                labels.point(lambda v: 255 if v == 2 else 0),
+            )
+            cls._LAYER_CACHE[key] = cached
+        return cached
+    
+    @classmethod
+    def _get_highlight_layer(cls, width: int, height: int) -> Tuple[Image.Image, Image.Image]:
+        """
+        Obtiene la capa de brillo superior del botón (cacheada).
+        
+        Args:
+            width: Ancho del botón
+            height: Alto del botón
+            
+        Returns:
+            Tupla (capa RGBA, máscara L) para pegar sobre el fondo
+        """
+        key = ('highlight', width, height)
+        cached = cls._LAYER_CACHE.get(key)
+        if cached is None:
+            # Degradado vertical de 8 filas (alfa 30 → 9), extendido a lo ancho
+            gradient = Image.new('L', (1, 8))
+            gradient.putdata(range(30, 6, -3))
+            layer = Image.new('RGBA', (width, height), (255, 255, 255, 0))
+            alpha = Image.new('L', (width, height), 0)
+            alpha.paste(gradient.resize((width, 8), Image.NEAREST), (0, 6))
+            layer.putalpha(alpha)
+            
+            # La franja se estrecha un píxel por lado en cada fila (trapecio)
+            mask = Image.new('L', (width, height), 0)
+            ImageDraw.Draw(mask).polygon(
+                [(10, 6), (width - 12, 6), (width - 19, 13), (17, 13)],
+                fill=255
+            )
+            cached = (layer, mask)
+            cls._LAYER_CACHE[key] = cached
+        return cached
     
     def _on_enter(self, event):
         """Maneja el evento de entrada del mouse."""
         if self._is_enabled:
             self._is_hovered = True
-            self._create_button_image()
+            self._request_render()
             self.configure(cursor='hand2')
     
     def _on_leave(self, event):
         """Maneja el evento de salida del mouse."""
         self._is_hovered = False
         self._is_pressed = False
-        self._create_button_image()
+        self._request_render()
         self.configure(cursor='')
     
     def _on_press(self, event):
         """Maneja el evento de presionar el botón."""
         if self._is_enabled:
             self._is_pressed = True
-            self._create_button_image()
+            self._request_render()
     
     def _on_release(self, event):
         """Maneja el evento de soltar el botón."""
         if self._is_enabled and self._is_pressed:
             self._is_pressed = False
-            self._create_button_image()
+            self._request_render()
             if self.command:
                 self.command()
     
     def set_text(self, text: str):
-        """Actualiza el texto del botón."""
+        """Actualiza el texto del botón (sin llamada a Tk si no cambia)."""
+        if text == self.text:
+            return
         self.text = text
-        self._create_button_image()
+        self.itemconfig(self._text_item, text=text)
     
     def set_enabled(self, enabled: bool):
-        """Habilita o deshabilita el botón."""
+        """
+        Habilita o deshabilita el botón.
+        La imagen deshabilitada sale de _IMAGE_CACHE (una por tamaño y tipo).
+        """
+        if enabled == self._is_enabled:
+            return
         self._is_enabled = enabled
-        self._create_button_image()
+        self._request_render()
+    
+    def destroy(self):
+        """
+        Cancela el redibujado pendiente antes de destruir (el comando del
+        botón puede destruirlo, p. ej. al navegar).
+        """
+        if self._render_job is not None:
+            self.after_cancel(self._render_job)
+            self._render_job = None
+        super().destroy()
 
 
 class StyledSlider(tk.Frame):
@@ -199,6 +354,9 @@ class StyledSlider(tk.Frame):
     Slider estilizado con etiqueta y valor.
     """
     
+    # Intervalo mínimo entre llamadas a command durante un arrastre (~60 Hz)
+    COMMAND_THROTTLE_MS = 16
+    
     def __init__(
         self,
         parent,
@@ -229,6 +387,9 @@ class StyledSlider(tk.Frame):
         self.command = command
         self.show_value = show_value
         self._value = tk.DoubleVar(value=initial)
+        self._last_val = float(initial)
+        self._command_timer = None
+        self._label_text = label
         
         # Contenedor con fondo semi-transparente
         self.container = tk.Frame(self, bg='#2a3328')
@@ -275,12 +436,23 @@ class StyledSlider(tk.Frame):
             self.value_label.pack(side=tk.RIGHT, padx=(10, 0))
     
     def _on_change(self, value):
-        """Maneja el cambio de valor."""
+        """
+        Maneja el cambio de valor.
+        La etiqueta se actualiza al momento; command se agrupa para no
+        dispararse en cada píxel del arrastre.
+        """
         val = float(value)
         if self.show_value:
             self.value_label.config(text=f"{int(val)}%")
+        self._last_val = val
+        if self.command and self._command_timer is None:
+            self._command_timer = self.after(self.COMMAND_THROTTLE_MS, self._fire_command)
+    
+    def _fire_command(self):
+        """Entrega a command el último valor del slider."""
+        self._command_timer = None
         if self.command:
-            self.command(val / 100)  # Normalizar a 0-1
+            self.command(self._last_val / 100)  # Normalizar a 0-1
     
     def get(self) -> float:
         """Obtiene el valor actual (0-1)."""
@@ -293,9 +465,17 @@ class StyledSlider(tk.Frame):
             self.value_label.config(text=f"{int(value * 100)}%")
     
     def set_label(self, text: str):
-        """Actualiza la etiqueta."""
-        if hasattr(self, 'label'):
+        """Actualiza la etiqueta (sin llamada a Tk si no cambia)."""
+        if hasattr(self, 'label') and text != self._label_text:
+            self._label_text = text
             self.label.config(text=text)
+    
+    def destroy(self):
+        """Cancela la llamada pendiente a command antes de destruir."""
+        if self._command_timer is not None:
+            self.after_cancel(self._command_timer)
+            self._command_timer = None
+        super().destroy()
 
 
 class StyledEntry(tk.Frame):
@@ -396,11 +576,137 @@ class StyledEntry(tk.Frame):
             self.entry.insert(0, text)
 
 
+class SegmentedToggle(tk.Canvas):
+    """
+    Selector segmentado (p. ej. Ventana | Completa) dibujado en un único
+    canvas: un rectángulo y un texto por opción, en lugar de un Label por
+    segmento. Cambiar la selección solo recolorea dos rectángulos.
+    """
+    
+    ACTIVE_BG = '#4a6741'
+    INACTIVE_BG = '#3a4338'
+    TEXT_COLOR = '#f5f0e6'
+    
+    def __init__(
+        self,
+        parent,
+        options: List[Tuple[Hashable, str]],
+        current: Hashable = None,
+        command: Optional[Callable[[Any], None]] = None,
+        font: tuple = ('Garamond', 11),
+        padx: int = 12,
+        pady: int = 6,
+        bg: str = '#2a3328',
+        **kwargs
+    ):
+        """
+        Crea el selector segmentado.
+        
+        Args:
+            parent: Widget padre
+            options: Pares (clave, texto) de cada segmento, en orden
+            current: Clave seleccionada inicialmente
+            command: Callback con la clave elegida al cambiar la selección
+            font: Fuente de los textos
+            padx: Margen horizontal del texto en cada segmento
+            pady: Margen vertical del texto en cada segmento
+            bg: Color de fondo del canvas
+        """
+        super().__init__(
+            parent, bg=bg, highlightthickness=0, bd=0, cursor='hand2', **kwargs
+        )
+        
+        self.command = command
+        self.padx = padx
+        self.pady = pady
+        self._font = tkfont.Font(font=font)
+        self._current = current
+        
+        # Por segmento: clave, texto, ids de rectángulo y texto en el canvas
+        self._keys = [key for key, _ in options]
+        self._labels = {key: label for key, label in options}
+        self._rects: Dict[Hashable, int] = {}
+        self._texts: Dict[Hashable, int] = {}
+        # Borde derecho de cada segmento (para localizar el clic)
+        self._edges: List[int] = []
+        
+        for key in self._keys:
+            fill = self.ACTIVE_BG if key == current else self.INACTIVE_BG
+            self._rects[key] = self.create_rectangle(0, 0, 0, 0, fill=fill, width=0)
+            self._texts[key] = self.create_text(
+                0, 0, text=self._labels[key], font=self._font,
+                fill=self.TEXT_COLOR, anchor='center'
+            )
+        self._layout()
+        
+        self.bind('<Button-1>', self._on_click)
+    
+    def _layout(self):
+        """Coloca los segmentos según el ancho de sus textos."""
+        height = self._font.metrics('linespace') + 2 * self.pady
+        x = 0
+        self._edges = []
+        for key in self._keys:
+            width = self._font.measure(self._labels[key]) + 2 * self.padx
+            self.coords(self._rects[key], x, 0, x + width, height)
+            self.coords(self._texts[key], x + width // 2, height // 2)
+            x += width
+            self._edges.append(x)
+        self.configure(width=x, height=height)
+    
+    def _on_click(self, event):
+        """Selecciona el segmento bajo el cursor."""
+        for key, edge in zip(self._keys, self._edges):
+            if event.x < edge:
+                self.set(key, notify=True)
+                return
+    
+    def set(self, key: Hashable, notify: bool = False):
+        """
+        Selecciona un segmento.
+        
+        Args:
+            key: Clave del segmento
+            notify: Llamar a command si la selección cambió
+        """
+        if key == self._current or key not in self._rects:
+            return
+        if self._current in self._rects:
+            self.itemconfig(self._rects[self._current], fill=self.INACTIVE_BG)
+        self.itemconfig(self._rects[key], fill=self.ACTIVE_BG)
+        self._current = key
+        if notify and self.command:
+            self.command(key)
+    
+    def get(self) -> Hashable:
+        """Obtiene la clave seleccionada."""
+        return self._current
+    
+    def set_labels(self, labels: Dict[Hashable, str]):
+        """
+        Actualiza los textos de los segmentos (p. ej. al cambiar de idioma).
+        
+        Args:
+            labels: Diccionario clave -> nuevo texto
+        """
+        changed = False
+        for key, label in labels.items():
+            if key in self._texts and self._labels[key] != label:
+                self._labels[key] = label
+                self.itemconfig(self._texts[key], text=label)
+                changed = True
+        if changed:
+            self._layout()
+
+
 class LanguageToggle(tk.Frame):
     """
     Toggle para cambio de idioma con banderas.
     """
     
+    ACTIVE_BG = '#4a6741'
+    INACTIVE_BG = '#3a4338'
+    
     def __init__(
         self,
         parent,
@@ -430,7 +736,7 @@ class LanguageToggle(tk.Frame):
             self.container,
             text="🇪🇸 ES",
             font=('Garamond', 11, 'bold'),
-            bg='#4a6741' if current_language == 'es' else '#3a4338',
+            bg=self.ACTIVE_BG if current_language == 'es' else self.INACTIVE_BG,
             fg='#f5f0e6',
             padx=12,
             pady=6,
@@ -442,7 +748,7 @@ class LanguageToggle(tk.Frame):
             self.container,
             text="🇬🇧 EN",
             font=('Garamond', 11, 'bold'),
-            bg='#4a6741' if current_language == 'en' else '#3a4338',
+            bg=self.ACTIVE_BG if current_language == 'en' else self.INACTIVE_BG,
             fg='#f5f0e6',
             padx=12,
             pady=6,
@@ -450,6 +756,8 @@ class LanguageToggle(tk.Frame):
         )
         self.en_btn.pack(side=tk.LEFT)
         
+        self._buttons = {'es': self.es_btn, 'en': self.en_btn}
+        
         # Bindings
         self.es_btn.bind('<Button-1>', lambda e: self._select('es'))
         self.en_btn.bind('<Button-1>', lambda e: self._select('en'))
@@ -457,11 +765,15 @@ class LanguageToggle(tk.Frame):
     def _select(self, language: str):
         """Selecciona un idioma."""
         if language != self._current:
+            previous = self._buttons.get(self._current)
             self._current = language
             
-            # Actualizar visual
-            self.es_btn.config(bg='#4a6741' if language == 'es' else '#3a4338')
-            self.en_btn.config(bg='#4a6741' if language == 'en' else '#3a4338')
+            # Actualizar visual: solo el botón saliente y el entrante
+            if previous is not None:
+                previous.configure(bg=self.INACTIVE_BG)
+            selected = self._buttons.get(language)
+            if selected is not None:
+                selected.configure(bg=self.ACTIVE_BG)
             
             if self.command:
                 self.command(language)
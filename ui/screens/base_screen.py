@@ -7,6 +7,7 @@ Clase base para todas las pantallas de la aplicación.
 """
 
 import tkinter as tk
+import traceback
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -23,6 +24,11 @@ class BaseScreen(tk.Frame):
     # Color de fondo por defecto (oscuro)
     BG_COLOR = '#1a2318'
     
+    # Retardos del redibujado del fondo al redimensionar (ms): uno rápido
+    # durante el arrastre y otro de calidad cuando los eventos se detienen
+    RESIZE_FAST_DELAY_MS = 50
+    RESIZE_FINAL_DELAY_MS = 300
+    
     def __init__(self, parent: tk.Widget, app: 'ChessWithKaelithApp', **kwargs):
         """
         Inicializa la pantalla base.
@@ -40,6 +46,13 @@ class BaseScreen(tk.Frame):
         self._screen_bg_label = None
         self._screen_bg_photo = None
         self._bg_initialized = False
+        # Tamaño con el que se pintó el fondo por última vez
+        self._last_bg_size = None
+        
+        # Debounce del redimensionado: último tamaño recibido y timers
+        self._resize_last_wh = None
+        self._resize_timer = None
+        self._resize_final_timer = None
         
         # Crear el label del background PRIMERO (pero sin imagen aún)
         self._create_background_label()
@@ -70,17 +83,28 @@ class BaseScreen(tk.Frame):
         # Enviar el background label a la capa más baja (detrás de todo)
         self._screen_bg_label.lower()
         
+        # La pantalla ocupará todo el contenedor: si este ya tiene tamaño,
+        # pintar ya el fondo compartido (normalmente en la caché de la app)
+        # en lugar de mostrar el color plano hasta la primera actualización
+        width = self.parent.winfo_width()
+        height = self.parent.winfo_height()
+        if width >= 10 and height >= 10:
+            photo = self.app.get_background_for_size(width, height)
+            if photo is not None:
+                self._screen_bg_photo = photo
+                self._screen_bg_label.configure(image=photo)
+        
         # Programar la actualización de la imagen
         # Usamos un delay más largo para asegurar que el widget tenga tamaño
         self.after(150, self._update_screen_background)
     
-    def _update_screen_background(self):
-        """Actualiza la imagen de fondo de esta pantalla."""
-        # Verificar que la imagen original existe
-        if not hasattr(self.app, '_original_bg') or self.app._original_bg is None:
-            print("DEBUG: _original_bg no disponible")
-            return
+    def _update_screen_background(self, fast: bool = False):
+        """
+        Actualiza la imagen de fondo de esta pantalla.
         
+        Args:
+            fast: Escalado rápido de menor calidad (durante un redimensionado)
+        """
         # Verificar que el label existe
         if self._screen_bg_label is None:
             print("DEBUG: _screen_bg_label no existe")
@@ -96,35 +120,15 @@ class BaseScreen(tk.Frame):
                 self.after(100, self._update_screen_background)
                 return
             
-            # Importar PIL
-            from PIL import Image, ImageTk
-            
-            # Obtener la imagen original
-            img = self.app._original_bg
-            
-            # Calcular dimensiones manteniendo aspecto (modo "cover")
-            img_ratio = img.width / img.height
-            win_ratio = width / height
-            
-            if win_ratio > img_ratio:
-                # Ventana más ancha que imagen
-                new_width = width
-                new_height = int(width / img_ratio)
-            else:
-                # Ventana más alta que imagen
-                new_height = height
-                new_width = int(height * img_ratio)
-            
-            # Redimensionar imagen
-            resized = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            
-            # Centrar y recortar para cubrir exactamente el área
-            left = (new_width - width) // 2
-            top = (new_height - height) // 2
-            cropped = resized.crop((left, top, left + width, top + height))
+            # Obtener el fondo escalado (cacheado por tamaño en la aplicación)
+            photo = self.app.get_background_for_size(width, height, fast=fast)
+            if photo is None:
+                print("DEBUG: _original_bg no disponible")
+                return
             
-            # Crear PhotoImage (IMPORTANTE: mantener referencia para evitar GC)
-            self._screen_bg_photo = ImageTk.PhotoImage(cropped)
+            # Mantener referencia para evitar GC
+            self._screen_bg_photo = photo
+            self._last_bg_size = (width, height)
             
             # Actualizar el label con la imagen
             self._screen_bg_label.configure(image=self._screen_bg_photo)
@@ -134,7 +138,6 @@ class BaseScreen(tk.Frame):
             
         except Exception as e:
             print(f"Error actualizando background de pantalla: {e}")
-            import traceback
             traceback.print_exc()
     
     def _on_screen_resize(self, event):
@@ -143,14 +146,43 @@ class BaseScreen(tk.Frame):
         if event.widget != self:
             return
         
-        # Actualizar background con debounce (evitar múltiples llamadas)
-        if hasattr(self, '_resize_timer'):
-            try:
-                self.after_cancel(self._resize_timer)
-            except:
-                pass
+        # Ignorar <Configure> espurios (p. ej. al reordenar hijos) que no
+        # cambian el tamaño ya pintado
+        size = (event.width, event.height)
+        if size == self._last_bg_size and self._screen_bg_photo is not None:
+            return
         
-        self._resize_timer = self.after(100, self._update_screen_background)
+        # Eventos repetidos con el mismo tamaño no reinician el debounce
+        if size == self._resize_last_wh and self._resize_final_timer is not None:
+            return
+        self._resize_last_wh = size
+        
+        # Actualizar background con debounce (evitar múltiples llamadas):
+        # un escalado rápido mientras se arrastra y el definitivo al soltar
+        self._cancel_resize_timers()
+        
+        self._resize_timer = self.after(
+            self.RESIZE_FAST_DELAY_MS, lambda: self._update_screen_background(fast=True)
+        )
+        self._resize_final_timer = self.after(
+            self.RESIZE_FINAL_DELAY_MS, self._finish_resize
+        )
+    
+    def _finish_resize(self):
+        """Redibujado definitivo cuando cesan los eventos de redimensionado."""
+        self._resize_final_timer = None
+        self._update_screen_background()
+    
+    def _cancel_resize_timers(self):
+        """Cancela los redibujados de fondo pendientes."""
+        for timer in (self._resize_timer, self._resize_final_timer):
+            if timer is not None:
+                try:
+                    self.after_cancel(timer)
+                except tk.TclError:
+                    pass
+        self._resize_timer = None
+        self._resize_final_timer = None
     
     def _build_ui(self):
         """
@@ -166,6 +198,35 @@ class BaseScreen(tk.Frame):
         """
         pass
     
+    def on_show(self, **kwargs):
+        """
+        Se llama cuando la pantalla, ya construida, vuelve a mostrarse.
+        Las subclases pueden sobrescribirlo para refrescar su estado.
+        
+        Args:
+            **kwargs: Argumentos de navegación
+        """
+        pass
+    
+    def on_hide(self):
+        """
+        Se llama justo antes de ocultar la pantalla al navegar a otra.
+        Las subclases pueden sobrescribirlo para pausar su actividad.
+        """
+        pass
+    
+    @classmethod
+    def prewarm(cls, app: 'ChessWithKaelithApp'):
+        """
+        Trabajo opcional que la aplicación ejecuta en un momento ocioso
+        antes de que la pantalla se construya (p. ej. cargar fuentes).
+        Las subclases pueden sobrescribirlo.
+        
+        Args:
+            app: Referencia a la aplicación principal
+        """
+        pass
+    
     def _on_language_change(self):
         """Callback cuando cambia el idioma."""
         self._update_texts()
@@ -194,20 +255,15 @@ class BaseScreen(tk.Frame):
     
     def destroy(self):
         """Destruye la pantalla y limpia recursos."""
-        # Cancelar timer de resize si existe
-        if hasattr(self, '_resize_timer'):
-            try:
-                self.after_cancel(self._resize_timer)
-            except:
-                pass
+        # Cancelar timers de resize si existen
+        self._cancel_resize_timers()
         
         # Limpiar referencia de imagen
         self._screen_bg_photo = None
         
-        # Desregistrar callback de idioma
-        try:
-            self.app.unregister_language_callback(self._on_language_change)
-        except:
-            pass
+        # Desregistrar callback de idioma. El registro es por referencia
+        # débil, así que una pantalla olvidada se descarta sola; esto solo
+        # adelanta la limpieza
+        self.app.unregister_language_callback(self._on_language_change)
         
         super().destroy()
\ No newline at end of file
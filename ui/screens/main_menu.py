@@ -7,14 +7,15 @@ Pantalla del menú principal con opciones de juego.
 """
 
 import tkinter as tk
-from typing import TYPE_CHECKING, Optional
+from functools import partial
+from tkinter import ttk
+from typing import TYPE_CHECKING, Dict, Optional
 
 from ui.screens.base_screen import BaseScreen
 from ui.components.widgets import (
     StyledButton,
     StyledSlider,
     LanguageToggle,
-    SemiTransparentFrame,
 )
 
 if TYPE_CHECKING:
@@ -22,82 +23,151 @@ if TYPE_CHECKING:
     from core.audio_manager import Track
 
 
-class MusicNotification(tk.Frame):
+# Estilos compartidos (creados una vez al importar el módulo)
+_MENU_BG = '#1a2318'
+_NOTIF_BG = '#2a3328'
+_NOTIF_ICON = {'font': ('Segoe UI Emoji', 18), 'fg': '#c4a574', 'bg': _NOTIF_BG}
+_NOTIF_CAPTION = {'font': ('Garamond', 9), 'fg': '#8b7355', 'bg': _NOTIF_BG}
+_NOTIF_TITLE = {'font': ('Garamond', 12, 'bold'), 'fg': '#f5f0e6', 'bg': _NOTIF_BG}
+
+
+def _effect_then_navigate(play_effect, navigate, effect_name: str, screen_name: str):
+    """
+    Manejador de los botones de navegación: reproduce un efecto y navega.
+    Se enlaza con partial() a funciones ya resueltas de la aplicación.
+    """
+    play_effect(effect_name)
+    navigate(screen_name)
+
+
+class MusicNotification(tk.Toplevel):
     """
     Notificación flotante que muestra la canción actual.
-    Se desvanece después de unos segundos.
+    Es una ventana sin decoración para poder desvanecerse con una
+    transparencia real (-alpha). Se reutiliza entre pistas: show()
+    actualiza los textos y la vuelve a mostrar.
     """
     
+    # Tiempo visible antes de empezar a desvanecerse (ms)
+    DISPLAY_MS = 4000
+    
+    # Desvanecimiento: número de pasos y duración de cada uno (ms)
+    FADE_STEPS = 20
+    FADE_STEP_MS = 50
+    
+    # Separación respecto a la esquina inferior derecha del área anclada (px)
+    MARGIN = 20
+    
     def __init__(self, parent, song_name: str, now_playing_text: str = "Reproduciendo", **kwargs):
-        super().__init__(parent, bg='#1a2318', **kwargs)
-        
-        self.song_name = song_name
-        self._fade_steps = 20
-        self._current_step = 0
-        
-        # Contenedor con borde redondeado simulado
-        container = tk.Frame(
-            self, 
-            bg='#2a3328',
+        # La propia ventana es el recuadro con borde; las etiquetas se
+        # colocan directamente en ella con grid (sin frames intermedios)
+        super().__init__(
+            parent,
+            bg=_NOTIF_BG,
             highlightbackground='#4a6741',
-            highlightthickness=1
+            highlightthickness=1,
+            **kwargs
         )
-        container.pack(padx=2, pady=2)
-        
-        inner = tk.Frame(container, bg='#2a3328')
-        inner.pack(padx=15, pady=10)
-        
-        # Icono de música
-        icon = tk.Label(
-            inner,
-            text="♪",
-            font=('Segoe UI Emoji', 18),
-            fg='#c4a574',
-            bg='#2a3328'
-        )
-        icon.pack(side=tk.LEFT, padx=(0, 12))
         
-        # Contenedor de texto
-        text_frame = tk.Frame(inner, bg='#2a3328')
-        text_frame.pack(side=tk.LEFT, fill=tk.Y)
+        # Sin barra de título, ligada a la ventana principal (no por encima
+        # de otras aplicaciones) y oculta hasta el primer show()
+        self.withdraw()
+        self.overrideredirect(True)
+        self._root_window = parent.winfo_toplevel()
+        self.transient(self._root_window)
+        
+        # Al minimizar la ventana principal, ocultarla también (una ventana
+        # sin decoración no la gestiona el gestor de ventanas)
+        self._unmap_binding = self._root_window.bind('<Unmap>', self._on_root_unmap, add='+')
+        
+        self.song_name = song_name
+        
+        # Icono de música (ocupa las dos filas de texto)
+        icon = tk.Label(self, text="♪", **_NOTIF_ICON)
+        icon.grid(row=0, column=0, rowspan=2, padx=(15, 12), pady=10)
         
         # Texto "Reproduciendo"
-        self.now_playing_label = tk.Label(
-            text_frame,
-            text=now_playing_text,
-            font=('Garamond', 9),
-            fg='#8b7355',
-            bg='#2a3328'
-        )
-        self.now_playing_label.pack(anchor='w')
+        self.now_playing_label = tk.Label(self, text=now_playing_text, **_NOTIF_CAPTION)
+        self.now_playing_label.grid(row=0, column=1, sticky='sw', padx=(0, 15), pady=(10, 0))
         
         # Nombre de la canción
-        self.name_label = tk.Label(
-            text_frame,
-            text=song_name,
-            font=('Garamond', 12, 'bold'),
-            fg='#f5f0e6',
-            bg='#2a3328'
-        )
-        self.name_label.pack(anchor='w')
+        self.name_label = tk.Label(self, text=song_name, **_NOTIF_TITLE)
+        self.name_label.grid(row=1, column=1, sticky='nw', padx=(0, 15), pady=(0, 10))
         
-        # Iniciar animación de desvanecimiento después de 4 segundos
-        self.after(4000, self._start_fade_out)
+        self._timer = None
+        self._fade_step = 0
+    
+    def show(self, song_name: str, now_playing_text: str, anchor: tk.Widget):
+        """
+        Actualiza los textos y muestra la notificación, opaca, en la esquina
+        inferior derecha de un widget.
+        
+        Args:
+            song_name: Nombre de la canción
+            now_playing_text: Texto "Reproduciendo" traducido
+            anchor: Widget en cuya esquina inferior derecha se coloca
+        """
+        self.song_name = song_name
+        self.name_label.config(text=song_name)
+        self.now_playing_label.config(text=now_playing_text)
+        
+        # Calcular el tamaño requerido con los textos nuevos y posicionar
+        self.update_idletasks()
+        x = anchor.winfo_rootx() + anchor.winfo_width() - self.winfo_reqwidth() - self.MARGIN
+        y = anchor.winfo_rooty() + anchor.winfo_height() - self.winfo_reqheight() - self.MARGIN
+        self.geometry(f"+{x}+{y}")
+        
+        self._cancel_timer()
+        self.wm_attributes('-alpha', 1.0)
+        self.deiconify()
+        self._timer = self.after(self.DISPLAY_MS, self._start_fade_out)
+    
+    def hide(self):
+        """Oculta la notificación de inmediato (sin destruirla)."""
+        self._cancel_timer()
+        self.withdraw()
     
     def _start_fade_out(self):
         """Inicia el desvanecimiento gradual."""
-        self._current_step = 0
-        self._fade_step()
+        self._fade_step = 0
+        self._fade_out_step()
     
-    def _fade_step(self):
-        """Un paso del desvanecimiento."""
-        self._current_step += 1
+    def _fade_out_step(self):
+        """Un paso del desvanecimiento: una llamada al gestor de ventanas."""
+        self._fade_step += 1
         
-        if self._current_step >= self._fade_steps:
-            self.destroy()
+        if self._fade_step >= self.FADE_STEPS:
+            self._timer = None
+            self.withdraw()
         else:
-            # Programar siguiente paso
-            self.after(50, self._fade_step)
+            self.wm_attributes('-alpha', 1 - self._fade_step / self.FADE_STEPS)
+            self._timer = self.after(self.FADE_STEP_MS, self._fade_out_step)
+    
+    def _on_root_unmap(self, event):
+        """Oculta la notificación cuando se minimiza la ventana principal."""
+        # El binding del toplevel también recibe los Unmap de sus hijos
+        if event.widget is self._root_window:
+            self.hide()
+    
+    def _cancel_timer(self):
+        """Cancela el temporizador pendiente (espera o desvanecimiento)."""
+        if self._timer is not None:
+            try:
+                self.after_cancel(self._timer)
+            except tk.TclError:
+                pass
+            self._timer = None
+    
+    def destroy(self):
+        """Cancela el temporizador pendiente y destruye la notificación."""
+        self._cancel_timer()
+        if self._unmap_binding is not None:
+            try:
+                self._root_window.unbind('<Unmap>', self._unmap_binding)
+            except tk.TclError:
+                pass
+            self._unmap_binding = None
+        super().destroy()
 
 
 class MainMenuScreen(BaseScreen):
@@ -106,13 +176,27 @@ class MainMenuScreen(BaseScreen):
     Muestra opciones de Jugar, Opciones, idioma y volumen.
     """
     
+    # Claves de los textos de la pantalla
+    _TEXT_KEYS = ('play', 'options', 'quit', 'language', 'volume', 'now_playing')
+    
+    # Textos ya resueltos por idioma (las traducciones no cambian en ejecución)
+    _text_cache: Dict[str, Dict[str, str]] = {}
+    
     def __init__(self, parent: tk.Widget, app: 'ChessWithKaelithApp', **kwargs):
         """Inicializa el menú principal."""
+        # Subsistemas usados por los manejadores de eventos, resueltos una vez
+        self._audio = app.audio
+        self._settings = app.settings
+        self._play_effect = app.play_effect
+        
         self._music_notification: Optional[MusicNotification] = None
         super().__init__(parent, app, **kwargs)
         
+        # Visibilidad mantenida por on_show/on_hide (sin consultar a Tk)
+        self._visible = True
+        
         # Registrar callback para cambios de pista
-        self.app.audio.register_track_change_callback(self._on_track_change)
+        self._audio.register_track_change_callback(self._on_track_change)
         
         # Solicitar música de menú (NO reinicia si ya está sonando)
         self.after(100, self._ensure_menu_music)
@@ -123,76 +207,82 @@ class MainMenuScreen(BaseScreen):
         Solo inicia nueva música si no hay ninguna o si es de otra categoría.
         """
         # request_music retorna None si ya está sonando la misma categoría
-        track_name = self.app.audio.request_music('menu')
+        track_name = self._audio.request_music('menu')
         
         if track_name:
             # Hubo cambio de pista, mostrar notificación
             self._show_music_notification(track_name)
     
+    def on_show(self, **kwargs):
+        """Refresca el estado al volver al menú principal."""
+        self._visible = True
+        # El volumen pudo cambiar desde la pantalla de opciones
+        if self.options_button is not None:
+            self.volume_slider.set(self._settings.get("volume", 0.7))
+        # Volviendo de otra pantalla la música del menú suele seguir sonando
+        if not self._audio.is_playing_category('menu'):
+            self.after(100, self._ensure_menu_music)
+    
+    def on_hide(self):
+        """Oculta la notificación (ventana aparte) al salir del menú."""
+        self._visible = False
+        if self._music_notification is not None:
+            self._music_notification.hide()
+    
     def _on_track_change(self, track: 'Track'):
         """Callback cuando cambia la pista de música."""
         # Solo mostrar si estamos visibles
-        if self.winfo_exists() and track.category == 'menu':
+        if self._visible and track.category == 'menu':
             self._show_music_notification(track.display_name)
     
     def _show_music_notification(self, song_name: str):
         """Muestra la notificación de música en la esquina inferior derecha."""
-        # Eliminar notificación anterior si existe
-        if self._music_notification:
-            try:
-                if self._music_notification.winfo_exists():
-                    self._music_notification.destroy()
-            except:
-                pass
+        now_playing = self._texts()['now_playing']
         
-        # Crear nueva notificación
-        now_playing = self.get_text('now_playing') if hasattr(self, 'get_text') else "Reproduciendo"
-        self._music_notification = MusicNotification(self, song_name, now_playing)
-        self._music_notification.place(relx=1.0, rely=1.0, anchor='se', x=-20, y=-20)
+        # La notificación se crea la primera vez y después solo se reutiliza
+        if self._music_notification is None:
+            self._music_notification = MusicNotification(self, song_name, now_playing)
+        
+        self._music_notification.show(song_name, now_playing, self)
     
     def _build_ui(self):
         """Construye la interfaz del menú principal."""
-        # Contenedor central con fondo semi-transparente
-        self.center_frame = SemiTransparentFrame(
-            self,
-            alpha=0.9,
-            color='#1a2318'
-        )
-        self.center_frame.place(relx=0.5, rely=0.5, anchor='center')
+        # Contenedor central de color plano. Se coloca al final, con sus
+        # hijos ya empaquetados: un solo cálculo de geometría
+        self.center_frame = tk.Frame(self, bg=_MENU_BG)
         
         # Padding interno
-        inner_frame = tk.Frame(self.center_frame, bg='#1a2318')
-        inner_frame.pack(padx=50, pady=40)
+        self._inner_frame = tk.Frame(self.center_frame, bg=_MENU_BG)
+        self._inner_frame.pack(padx=50, pady=40)
         
         # === TÍTULO ===
-        self.title_label = tk.Label(
-            inner_frame,
+        self.title_label = ttk.Label(
+            self._inner_frame,
             text="Chess with Kaelith",
-            font=('Palatino Linotype', 36, 'bold'),
-            fg='#c4a574',
-            bg='#1a2318'
+            style='Kaelith.Title.TLabel'
         )
         self.title_label.pack(pady=(0, 10))
         
         # Subtítulo decorativo
-        self.subtitle_label = tk.Label(
-            inner_frame,
+        self.subtitle_label = ttk.Label(
+            self._inner_frame,
             text="— ♔ —",
-            font=('Garamond', 18),
-            fg='#6b8b5e',
-            bg='#1a2318'
+            style='Kaelith.Subtitle.TLabel'
         )
         self.subtitle_label.pack(pady=(0, 30))
         
         # === BOTONES PRINCIPALES ===
-        buttons_frame = tk.Frame(inner_frame, bg='#1a2318')
-        buttons_frame.pack(pady=10)
+        self._buttons_frame = tk.Frame(self._inner_frame, bg=_MENU_BG)
+        self._buttons_frame.pack(pady=10)
         
         # Botón JUGAR (principal, más grande)
         self.play_button = StyledButton(
-            buttons_frame,
+            self._buttons_frame,
             text="Jugar",
-            command=self._on_play,
+            command=partial(
+                _effect_then_navigate, self._play_effect, self.app.navigate_to,
+                'button_play', 'profile_select'
+            ),
             width=320,
             height=70,
             font_size=22,
@@ -200,11 +290,25 @@ class MainMenuScreen(BaseScreen):
         )
         self.play_button.pack(pady=10)
         
+        self.center_frame.place(relx=0.5, rely=0.5, anchor='center')
+        
+        # El resto de controles se construye en el siguiente ciclo ocioso:
+        # la primera pintura solo espera al título y al botón principal
+        self.options_button: Optional[StyledButton] = None
+        self._secondary_job = self.after_idle(self._build_secondary_controls)
+    
+    def _build_secondary_controls(self):
+        """Construye los botones secundarios y los controles inferiores."""
+        self._secondary_job = None
+        
         # Botón OPCIONES (secundario, más pequeño)
         self.options_button = StyledButton(
-            buttons_frame,
+            self._buttons_frame,
             text="Opciones",
-            command=self._on_options,
+            command=partial(
+                _effect_then_navigate, self._play_effect, self.app.navigate_to,
+                'button_options', 'options'
+            ),
             width=240,
             height=50,
             font_size=16,
@@ -214,9 +318,9 @@ class MainMenuScreen(BaseScreen):
         
         # Botón SALIR
         self.quit_button = StyledButton(
-            buttons_frame,
+            self._buttons_frame,
             text="Salir",
-            command=self._on_quit,
+            command=self.app.quit,
             width=180,
             height=45,
             font_size=14,
@@ -225,27 +329,21 @@ class MainMenuScreen(BaseScreen):
         self.quit_button.pack(pady=8)
         
         # === SEPARADOR ===
-        separator = tk.Frame(inner_frame, bg='#4a6741', height=2)
+        separator = tk.Frame(self._inner_frame, bg='#4a6741', height=2)
         separator.pack(fill=tk.X, pady=25, padx=20)
         
         # === CONTROLES INFERIORES ===
-        controls_frame = tk.Frame(inner_frame, bg='#1a2318')
+        controls_frame = tk.Frame(self._inner_frame, bg=_MENU_BG)
         controls_frame.pack(fill=tk.X)
         
         # Frame izquierdo para idioma
-        left_frame = tk.Frame(controls_frame, bg='#1a2318')
+        left_frame = tk.Frame(controls_frame, bg=_MENU_BG)
         left_frame.pack(side=tk.LEFT, padx=10)
         
-        self.language_label = tk.Label(
-            left_frame,
-            text="Idioma",
-            font=('Garamond', 11),
-            fg='#8b7355',
-            bg='#1a2318'
-        )
+        self.language_label = ttk.Label(left_frame, text="Idioma", style='Kaelith.Small.TLabel')
         self.language_label.pack(anchor='w')
         
-        current_lang = self.app.settings.get("language", "es")
+        current_lang = self._settings.get("language", "es")
         self.language_toggle = LanguageToggle(
             left_frame,
             current_language=current_lang,
@@ -254,7 +352,7 @@ class MainMenuScreen(BaseScreen):
         self.language_toggle.pack(pady=5)
         
         # Frame derecho para volumen
-        right_frame = tk.Frame(controls_frame, bg='#1a2318')
+        right_frame = tk.Frame(controls_frame, bg=_MENU_BG)
         right_frame.pack(side=tk.RIGHT, padx=10)
         
         self.volume_slider = StyledSlider(
@@ -262,61 +360,68 @@ class MainMenuScreen(BaseScreen):
             label="Volumen",
             from_=0,
             to=100,
-            initial=self.app.settings.get("volume", 0.7) * 100,
+            initial=self._settings.get("volume", 0.7) * 100,
             command=self._on_volume_change,
             width=200
         )
         self.volume_slider.pack(pady=5)
         
         # === VERSIÓN ===
-        version_label = tk.Label(
-            inner_frame,
+        version_label = ttk.Label(
+            self._inner_frame,
             text="v0.1.0 - Alpha",
-            font=('Garamond', 9),
-            fg='#555555',
-            bg='#1a2318'
+            style='Kaelith.Version.TLabel'
         )
         version_label.pack(pady=(20, 0))
+        
+        self._update_texts()
+    
+    def _texts(self) -> Dict[str, str]:
+        """
+        Obtiene los textos de la pantalla para el idioma actual.
+        
+        Returns:
+            Diccionario clave -> texto traducido (memoizado por idioma)
+        """
+        language = self.app.i18n.get_language()
+        texts = self._text_cache.get(language)
+        if texts is None:
+            texts = {key: self.get_text(key) for key in self._TEXT_KEYS}
+            self._text_cache[language] = texts
+        return texts
     
     def _update_texts(self):
         """Actualiza los textos con el idioma actual."""
-        self.play_button.set_text(self.get_text('play'))
-        self.options_button.set_text(self.get_text('options'))
-        self.quit_button.set_text(self.get_text('quit'))
-        self.language_label.config(text=self.get_text('language'))
-        self.volume_slider.set_label(self.get_text('volume'))
-    
-    def _on_play(self):
-        """Maneja el clic en Jugar."""
-        self.app.play_effect('button_play')
-        self.navigate_to('profile_select')
-    
-    def _on_options(self):
-        """Maneja el clic en Opciones."""
-        self.app.play_effect('button_options')
-        self.navigate_to('options')
-    
-    def _on_quit(self):
-        """Maneja el clic en Salir."""
-        self.app.quit()
+        t = self._texts()
+        self.play_button.set_text(t['play'])
+        if self.options_button is None:
+            # Controles secundarios aún sin construir (_build_secondary_controls)
+            return
+        self.options_button.set_text(t['options'])
+        self.quit_button.set_text(t['quit'])
+        self.language_label.config(text=t['language'])
+        self.volume_slider.set_label(t['volume'])
     
     def _handle_language_toggle(self, language: str):
         """Maneja el cambio de idioma desde el toggle."""
-        self.app.play_effect('button_language')
+        self._play_effect('button_language')
         self.app.change_language(language)
     
     def _on_volume_change(self, value: float):
         """Maneja el cambio de volumen."""
-        self.app.settings.set("volume", value)
-        self.app.audio.set_master_volume(value)
+        self._settings.set("volume", value)
+        self._audio.set_master_volume(value)
     
     def destroy(self):
         """Limpia recursos al destruir la pantalla."""
-        # Desregistrar callback de cambio de pista
-        try:
-            self.app.audio.unregister_track_change_callback(self._on_track_change)
-        except:
-            pass
+        self._visible = False
+        
+        if self._secondary_job is not None:
+            self.after_cancel(self._secondary_job)
+            self._secondary_job = None
+        
+        # El callback de cambio de pista no hace falta desregistrarlo: el
+        # audio guarda una referencia débil que muere con la pantalla
         
         # NO detenemos la música - debe continuar entre pantallas
         super().destroy()
\ No newline at end of file
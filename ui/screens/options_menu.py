@@ -7,165 +7,290 @@ Pantalla de opciones con configuraciones de video, sonido y accesibilidad.
 """
 
 import tkinter as tk
+import tkinter.font as tkfont
+from functools import partial
 from tkinter import ttk
 from typing import TYPE_CHECKING
 
 from ui.screens.base_screen import BaseScreen
-from ui.components.widgets import StyledButton, StyledSlider, SemiTransparentFrame
+from ui.components.widgets import StyledButton, StyledSlider, SegmentedToggle, SemiTransparentFrame
 
 if TYPE_CHECKING:
     from core.app import ChessWithKaelithApp
 
 
+# Paleta de la pantalla de opciones
+_TAB_BG = '#1a2318'
+_ROW_BG = '#2a3328'
+_CONTROL_BG = '#3a4338'
+_HOVER_BG = '#4a5348'
+_ACTIVE_BG = '#4a6741'
+_ACCENT = '#c4a574'
+_TEXT_LIGHT = '#f5f0e6'
+_MUTED = '#666666'
+
+# Colocación de las filas "etiqueta | control" (las etiquetas usan los
+# estilos ttk Kaelith.*.TLabel definidos una vez por la aplicación)
+_ROW_LABEL_PACK = {'side': tk.LEFT, 'padx': 15, 'pady': 12}
+_ROW_CONTROL_PACK = {'side': tk.RIGHT, 'padx': 15, 'pady': 10}
+
+# Estilos de los botones de pestaña
+_TAB_ACTIVE_STYLE = {'bg': _ACTIVE_BG, 'fg': _TEXT_LIGHT}
+_TAB_INACTIVE_STYLE = {'bg': _ROW_BG, 'fg': _ACCENT}
+
+# Glifos de la pestaña de sonido y fuentes con las que se dibujan
+_EMOJI_FONT = ('Segoe UI Emoji', 14)
+_EMOJI_FONT_SMALL = ('Segoe UI Emoji', 12)
+GLYPH_PREV = "⏮"
+GLYPH_NEXT = "⏭"
+GLYPH_SHUFFLE = "🔀"
+GLYPH_REPEAT = "🔁"
+GLYPH_MUSIC = "♪"
+GLYPH_TICK = "✓"
+GLYPH_CROSS = "✗"
+
+# Resoluciones disponibles: texto del selector -> (ancho, alto)
+RESOLUTIONS = [
+    ('1280x720', (1280, 720)),
+    ('1366x768', (1366, 768)),
+    ('1600x900', (1600, 900)),
+    ('1920x1080', (1920, 1080)),
+]
+RESOLUTION_MAP = dict(RESOLUTIONS)
+
+# Bindtags compartidos por los botones de la barra de reproducción: cada
+# manejador se registra una vez y lee del widget lo que necesita
+_CLICK_TAG = 'KaelithClick'
+_HOVER_TAG = 'KaelithHover'
+
+
+def _on_control_click(event):
+    """Ejecuta la acción asociada al botón pulsado."""
+    event.widget._on_click()
+
+
+def _on_control_enter(event):
+    """Resalta el botón bajo el ratón."""
+    event.widget.config(bg=_HOVER_BG)
+
+
+def _on_control_leave(event):
+    """Quita el resaltado al salir el ratón."""
+    event.widget.config(bg=_CONTROL_BG)
+
+
+def _bind_control_classes(widget: tk.Misc):
+    """Registra (una sola vez por intérprete) los manejadores compartidos."""
+    if widget.bind_class(_CLICK_TAG):
+        return
+    widget.bind_class(_CLICK_TAG, '<Button-1>', _on_control_click)
+    widget.bind_class(_HOVER_TAG, '<Enter>', _on_control_enter)
+    widget.bind_class(_HOVER_TAG, '<Leave>', _on_control_leave)
+
+
 class OptionsTab(tk.Frame):
     """
     Contenedor base para cada pestaña de opciones.
     """
     
     def __init__(self, parent, app: 'ChessWithKaelithApp', **kwargs):
-        super().__init__(parent, bg='#1a2318', **kwargs)
+        super().__init__(parent, bg=_TAB_BG, **kwargs)
         self.app = app
+        # Último texto aplicado a cada widget (para omitir configs sin cambios)
+        self._applied_texts = {}
+        # Hay un cambio de idioma sin aplicar (pestaña oculta)
+        self._texts_dirty = False
+        # Idioma con el que se tradujeron los textos por última vez
+        self._texts_language = None
     
     def get_text(self, key: str) -> str:
         return self.app.get_text(key)
     
+    def _apply_texts(self, pairs):
+        """
+        Aplica textos traducidos, configurando solo los widgets cuyo
+        texto cambió desde la última vez.
+        
+        Args:
+            pairs: Pares (widget, clave de traducción)
+        """
+        applied = self._applied_texts
+        texts = self.app.get_text_table()
+        for widget, key in pairs:
+            text = texts.get(key, key)
+            if applied.get(widget) != text:
+                widget.config(text=text)
+                applied[widget] = text
+    
+    def _build_rows(self, rows):
+        """
+        Construye filas "etiqueta a la izquierda, control a la derecha"
+        a partir de su descripción.
+        
+        Args:
+            rows: Tuplas (atributo de la etiqueta, clave de traducción,
+                texto inicial, método que crea el control en la fila)
+        """
+        for label_attr, _, text, build_control in rows:
+            row = tk.Frame(self, bg=_ROW_BG)
+            row.pack(fill=tk.X, pady=10, padx=10)
+            
+            label = ttk.Label(row, text=text, style='Kaelith.Row.TLabel')
+            label.pack(**_ROW_LABEL_PACK)
+            setattr(self, label_attr, label)
+            
+            getattr(self, build_control)(row).pack(**_ROW_CONTROL_PACK)
+    
+    def _apply_row_texts(self, rows):
+        """Traduce las etiquetas de las filas creadas con _build_rows."""
+        self._apply_texts((getattr(self, label_attr), key) for label_attr, key, _, _ in rows)
+    
     def update_texts(self):
-        """Actualiza textos. Sobrescribir en subclases."""
+        """Actualiza los textos si el idioma cambió desde la última vez."""
+        language = self.app.i18n.get_language()
+        if language == self._texts_language:
+            return
+        self._texts_language = language
+        self._translate()
+    
+    def _translate(self):
+        """Aplica los textos del idioma actual. Sobrescribir en subclases."""
+        pass
+    
+    def reload_settings(self):
+        """Vuelve a leer los ajustes en los controles. Sobrescribir en subclases."""
         pass
+    
+    def invalidate_texts(self):
+        """Marca los textos como pendientes; se aplican al volver a mostrarla."""
+        self._texts_dirty = True
+    
+    def refresh_texts(self):
+        """Aplica los textos pendientes, si los hay."""
+        if self._texts_dirty:
+            self._texts_dirty = False
+            self.update_texts()
 
 
 class VideoTab(OptionsTab):
     """Pestaña de opciones de video."""
     
+    # Filas: (etiqueta, clave de traducción, texto inicial, creador del control)
+    ROWS = (
+        ('fullscreen_label', 'fullscreen', "Pantalla completa", '_build_fullscreen_toggle'),
+        ('resolution_label', 'resolution', "Resolución", '_build_resolution_picker'),
+    )
+    
     def __init__(self, parent, app: 'ChessWithKaelithApp', **kwargs):
         super().__init__(parent, app, **kwargs)
         self._build_ui()
     
     def _build_ui(self):
         """Construye la UI de opciones de video."""
-        # === PANTALLA COMPLETA ===
-        fullscreen_frame = tk.Frame(self, bg='#2a3328')
-        fullscreen_frame.pack(fill=tk.X, pady=10, padx=10)
-        
-        self.fullscreen_label = tk.Label(
-            fullscreen_frame,
-            text="Pantalla completa",
-            font=('Garamond', 13),
-            fg='#c4a574',
-            bg='#2a3328'
+        self._build_rows(self.ROWS)
+    
+    def _build_fullscreen_toggle(self, row: tk.Frame) -> tk.Widget:
+        """Crea el toggle de pantalla completa."""
+        self.fullscreen_toggle = SegmentedToggle(
+            row,
+            options=[(False, "Ventana"), (True, "Completa")],
+            current=self.app.settings.opts.fullscreen,
+            command=self._set_fullscreen
         )
-        self.fullscreen_label.pack(side=tk.LEFT, padx=15, pady=12)
-        
-        # Toggle para pantalla completa
-        toggle_frame = tk.Frame(fullscreen_frame, bg='#2a3328')
-        toggle_frame.pack(side=tk.RIGHT, padx=15, pady=10)
-        
-        self._fullscreen_var = tk.BooleanVar(
-            value=self.app.settings.get("fullscreen", False)
+        return self.fullscreen_toggle
+    
+    def _build_resolution_picker(self, row: tk.Frame) -> tk.Widget:
+        """Crea el selector de resolución (Menubutton + Menu)."""
+        self._resolution_var = tk.StringVar(
+            value=self.app.settings.opts.resolution
         )
         
-        self.windowed_btn = tk.Label(
-            toggle_frame,
-            text="Ventana",
+        self.resolution_button = tk.Menubutton(
+            row,
+            textvariable=self._resolution_var,
             font=('Garamond', 11),
-            bg='#3a4338',
-            fg='#f5f0e6',
-            padx=12,
-            pady=6,
+            fg=_TEXT_LIGHT,
+            bg=_CONTROL_BG,
+            activebackground=_HOVER_BG,
+            activeforeground=_TEXT_LIGHT,
+            relief='flat',
+            width=10,
+            pady=4,
             cursor='hand2'
         )
-        self.windowed_btn.pack(side=tk.LEFT)
         
-        self.fullscreen_btn = tk.Label(
-            toggle_frame,
-            text="Completa",
+        menu = tk.Menu(
+            self.resolution_button,
+            tearoff=0,
             font=('Garamond', 11),
-            bg='#3a4338',
-            fg='#f5f0e6',
-            padx=12,
-            pady=6,
-            cursor='hand2'
+            fg=_TEXT_LIGHT,
+            bg=_ROW_BG,
+            activebackground=_ACTIVE_BG,
+            activeforeground=_TEXT_LIGHT,
+            selectcolor=_ACCENT
         )
-        self.fullscreen_btn.pack(side=tk.LEFT)
-        
-        self._update_fullscreen_toggle()
-        
-        self.windowed_btn.bind('<Button-1>', lambda e: self._set_fullscreen(False))
-        self.fullscreen_btn.bind('<Button-1>', lambda e: self._set_fullscreen(True))
-        
-        # === RESOLUCIÓN ===
-        resolution_frame = tk.Frame(self, bg='#2a3328')
-        resolution_frame.pack(fill=tk.X, pady=10, padx=10)
-        
-        self.resolution_label = tk.Label(
-            resolution_frame,
-            text="Resolución",
-            font=('Garamond', 13),
-            fg='#c4a574',
-            bg='#2a3328'
-        )
-        self.resolution_label.pack(side=tk.LEFT, padx=15, pady=12)
-        
-        # Dropdown de resoluciones
-        self._resolution_var = tk.StringVar(
-            value=self.app.settings.get("resolution", "1280x720")
-        )
-        
-        resolutions = ["1280x720", "1366x768", "1600x900", "1920x1080"]
-        
-        self.resolution_dropdown = ttk.Combobox(
-            resolution_frame,
-            textvariable=self._resolution_var,
-            values=resolutions,
-            state='readonly',
-            width=12,
-            font=('Garamond', 11)
-        )
-        self.resolution_dropdown.pack(side=tk.RIGHT, padx=15, pady=10)
-        self.resolution_dropdown.bind('<<ComboboxSelected>>', self._on_resolution_change)
+        for name, _ in RESOLUTIONS:
+            menu.add_radiobutton(
+                label=name,
+                value=name,
+                variable=self._resolution_var,
+                command=self._on_resolution_change
+            )
+        self.resolution_button['menu'] = menu
+        return self.resolution_button
     
-    def _update_fullscreen_toggle(self):
-        """Actualiza el visual del toggle de pantalla completa."""
-        is_fullscreen = self._fullscreen_var.get()
-        self.windowed_btn.config(bg='#4a6741' if not is_fullscreen else '#3a4338')
-        self.fullscreen_btn.config(bg='#4a6741' if is_fullscreen else '#3a4338')
+    def reload_settings(self):
+        """Sincroniza los controles con los ajustes guardados."""
+        self.fullscreen_toggle.set(self.app.settings.opts.fullscreen)
+        self._resolution_var.set(self.app.settings.opts.resolution)
     
     def _set_fullscreen(self, fullscreen: bool):
-        """Establece el modo de pantalla."""
-        self._fullscreen_var.set(fullscreen)
-        self._update_fullscreen_toggle()
-        self.app.set_fullscreen(fullscreen)
+        """Establece el modo de pantalla (el toggle ya se actualizó)."""
+        # Se guarda al Aplicar; la ventana cambia ya como vista previa
+        self.app.settings.set_pending("fullscreen", fullscreen)
+        self.app.apply_fullscreen(fullscreen)
     
-    def _on_resolution_change(self, event):
+    def _on_resolution_change(self):
         """Maneja el cambio de resolución."""
         resolution = self._resolution_var.get()
-        self.app.settings.set("resolution", resolution)
+        self.app.settings.set_pending("resolution", resolution)
         
         # Aplicar resolución si no está en pantalla completa
-        if not self._fullscreen_var.get():
-            width, height = map(int, resolution.split('x'))
+        if not self.fullscreen_toggle.get():
+            width, height = RESOLUTION_MAP[resolution]
             self.app.root.geometry(f"{width}x{height}")
     
-    def update_texts(self):
+    def _translate(self):
         """Actualiza los textos."""
-        self.fullscreen_label.config(text=self.get_text('fullscreen'))
-        self.windowed_btn.config(text=self.get_text('windowed'))
-        self.fullscreen_btn.config(text=self.get_text('fullscreen'))
-        self.resolution_label.config(text=self.get_text('resolution'))
+        self._apply_row_texts(self.ROWS)
+        texts = self.app.get_text_table()
+        self.fullscreen_toggle.set_labels({
+            False: texts.get('windowed', 'windowed'),
+            True: texts.get('fullscreen', 'fullscreen'),
+        })
 
 
 class SoundTab(OptionsTab):
     """Pestaña de opciones de sonido con control de playlist."""
     
+    # Método del gestor de audio que aplica cada ajuste de volumen
+    VOLUME_SETTERS = {
+        'volume': 'set_master_volume',
+        'music_volume': 'set_music_volume',
+        'effects_volume': 'set_effects_volume',
+    }
+    
     def __init__(self, parent, app: 'ChessWithKaelithApp', **kwargs):
         super().__init__(parent, app, **kwargs)
+        # La playlist del menú es el mismo objeto durante toda la sesión
+        self._menu_playlist = self.app.audio.get_playlist('menu')
         self._build_ui()
     
     def _build_ui(self):
         """Construye la UI de opciones de sonido."""
         
         # === SECCIÓN DE VOLÚMENES ===
-        volume_section = tk.Frame(self, bg='#1a2318')
+        volume_section = tk.Frame(self, bg=_TAB_BG)
         volume_section.pack(fill=tk.X, pady=(0, 10))
         
         # Volumen general
@@ -174,8 +299,8 @@ class SoundTab(OptionsTab):
             label="Volumen general",
             from_=0,
             to=100,
-            initial=self.app.settings.get("volume", 0.7) * 100,
-            command=self._on_general_volume_change,
+            initial=self.app.settings.opts.volume * 100,
+            command=partial(self._on_volume_change, 'volume'),
             width=280
         )
         self.general_slider.pack(fill=tk.X, pady=5, padx=10)
@@ -186,8 +311,8 @@ class SoundTab(OptionsTab):
             label="Música",
             from_=0,
             to=100,
-            initial=self.app.settings.get("music_volume", 0.7) * 100,
-            command=self._on_music_volume_change,
+            initial=self.app.settings.opts.music_volume * 100,
+            command=partial(self._on_volume_change, 'music_volume'),
             width=280
         )
         self.music_slider.pack(fill=tk.X, pady=5, padx=10)
@@ -198,145 +323,130 @@ class SoundTab(OptionsTab):
             label="Efectos",
             from_=0,
             to=100,
-            initial=self.app.settings.get("effects_volume", 0.8) * 100,
-            command=self._on_effects_volume_change,
+            initial=self.app.settings.opts.effects_volume * 100,
+            command=partial(self._on_volume_change, 'effects_volume'),
             width=280
         )
         self.effects_slider.pack(fill=tk.X, pady=5, padx=10)
         
         # === SEPARADOR ===
-        separator = tk.Frame(self, bg='#4a6741', height=1)
+        separator = tk.Frame(self, bg=_ACTIVE_BG, height=1)
         separator.pack(fill=tk.X, pady=10, padx=20)
         
         # === SECCIÓN DE MÚSICA DEL MENÚ ===
-        music_section = tk.Frame(self, bg='#2a3328')
+        music_section = tk.Frame(self, bg=_ROW_BG)
         music_section.pack(fill=tk.X, pady=5, padx=10)
         
-        music_inner = tk.Frame(music_section, bg='#2a3328')
+        music_inner = tk.Frame(music_section, bg=_ROW_BG)
         music_inner.pack(fill=tk.X, padx=15, pady=10)
         
         # Título de sección
-        self.music_title = tk.Label(
+        self.music_title = ttk.Label(
             music_inner,
-            text="♪ Música del Menú",
-            font=('Garamond', 12, 'bold'),
-            fg='#c4a574',
-            bg='#2a3328'
+            text=f"{GLYPH_MUSIC} Música del Menú",
+            style='Kaelith.Section.TLabel'
         )
         self.music_title.pack(anchor='w')
         
         # Pista actual
-        current_frame = tk.Frame(music_inner, bg='#2a3328')
+        current_frame = tk.Frame(music_inner, bg=_ROW_BG)
         current_frame.pack(fill=tk.X, pady=(8, 5))
         
-        self.current_track_label = tk.Label(
-            current_frame,
-            text="Canción actual:",
-            font=('Garamond', 10),
-            fg='#8b7355',
-            bg='#2a3328'
+        self.current_track_label = ttk.Label(
+            current_frame, text="Canción actual:", style='Kaelith.Caption.TLabel'
         )
         self.current_track_label.pack(side=tk.LEFT)
         
         track = self.app.audio.get_current_track()
         track_name = track.display_name if track else "---"
         
-        self.track_name_label = tk.Label(
+        self.track_name_label = ttk.Label(
             current_frame,
             text=track_name,
-            font=('Garamond', 10, 'bold'),
-            fg='#f5f0e6',
-            bg='#2a3328'
+            style='Kaelith.Value.TLabel'
         )
         self.track_name_label.pack(side=tk.LEFT, padx=(5, 0))
         
-        # Controles de reproducción
-        controls_frame = tk.Frame(music_inner, bg='#2a3328')
+        # Controles de reproducción (clic y resaltado vía bindtags compartidos)
+        _bind_control_classes(self)
+        controls_frame = tk.Frame(music_inner, bg=_ROW_BG)
         controls_frame.pack(fill=tk.X, pady=5)
         
         # Botón anterior
         self.prev_btn = tk.Label(
             controls_frame,
-            text="⏮",
-            font=('Segoe UI Emoji', 14),
-            fg='#c4a574',
-            bg='#3a4338',
+            text=GLYPH_PREV,
+            font=_EMOJI_FONT,
+            fg=_ACCENT,
+            bg=_CONTROL_BG,
             padx=10,
             pady=3,
             cursor='hand2'
         )
         self.prev_btn.pack(side=tk.LEFT, padx=2)
-        self.prev_btn.bind('<Button-1>', lambda e: self._on_previous())
-        self.prev_btn.bind('<Enter>', lambda e: self.prev_btn.config(bg='#4a5348'))
-        self.prev_btn.bind('<Leave>', lambda e: self.prev_btn.config(bg='#3a4338'))
+        self._bind_control(self.prev_btn, self._on_previous, hover=True)
         
         # Botón siguiente
         self.next_btn = tk.Label(
             controls_frame,
-            text="⏭",
-            font=('Segoe UI Emoji', 14),
-            fg='#c4a574',
-            bg='#3a4338',
+            text=GLYPH_NEXT,
+            font=_EMOJI_FONT,
+            fg=_ACCENT,
+            bg=_CONTROL_BG,
             padx=10,
             pady=3,
             cursor='hand2'
         )
         self.next_btn.pack(side=tk.LEFT, padx=2)
-        self.next_btn.bind('<Button-1>', lambda e: self._on_next())
-        self.next_btn.bind('<Enter>', lambda e: self.next_btn.config(bg='#4a5348'))
-        self.next_btn.bind('<Leave>', lambda e: self.next_btn.config(bg='#3a4338'))
+        self._bind_control(self.next_btn, self._on_next, hover=True)
         
         # Espaciador
-        tk.Frame(controls_frame, bg='#2a3328', width=20).pack(side=tk.LEFT)
+        tk.Frame(controls_frame, bg=_ROW_BG, width=20).pack(side=tk.LEFT)
         
         # Toggle Shuffle
-        playlist = self.app.audio.get_playlist('menu')
+        playlist = self._menu_playlist
         shuffle_on = playlist.shuffle if playlist else False
         
         self.shuffle_btn = tk.Label(
             controls_frame,
-            text="🔀",
-            font=('Segoe UI Emoji', 12),
-            fg='#c4a574' if shuffle_on else '#666666',
-            bg='#4a6741' if shuffle_on else '#3a4338',
+            text=GLYPH_SHUFFLE,
+            font=_EMOJI_FONT_SMALL,
+            fg=_ACCENT if shuffle_on else _MUTED,
+            bg=_ACTIVE_BG if shuffle_on else _CONTROL_BG,
             padx=8,
             pady=3,
             cursor='hand2'
         )
         self.shuffle_btn.pack(side=tk.LEFT, padx=2)
-        self.shuffle_btn.bind('<Button-1>', lambda e: self._toggle_shuffle())
+        self._bind_control(self.shuffle_btn, self._toggle_shuffle)
         
         # Toggle Repeat
         repeat_on = playlist.repeat if playlist else True
         
         self.repeat_btn = tk.Label(
             controls_frame,
-            text="🔁",
-            font=('Segoe UI Emoji', 12),
-            fg='#c4a574' if repeat_on else '#666666',
-            bg='#4a6741' if repeat_on else '#3a4338',
+            text=GLYPH_REPEAT,
+            font=_EMOJI_FONT_SMALL,
+            fg=_ACCENT if repeat_on else _MUTED,
+            bg=_ACTIVE_BG if repeat_on else _CONTROL_BG,
             padx=8,
             pady=3,
             cursor='hand2'
         )
         self.repeat_btn.pack(side=tk.LEFT, padx=2)
-        self.repeat_btn.bind('<Button-1>', lambda e: self._toggle_repeat())
+        self._bind_control(self.repeat_btn, self._toggle_repeat)
         
         # === LISTA DE PISTAS ===
-        tracks_frame = tk.Frame(music_inner, bg='#2a3328')
+        tracks_frame = tk.Frame(music_inner, bg=_ROW_BG)
         tracks_frame.pack(fill=tk.X, pady=(10, 5))
         
-        self.playlist_label = tk.Label(
-            tracks_frame,
-            text="Lista de reproducción:",
-            font=('Garamond', 10),
-            fg='#8b7355',
-            bg='#2a3328'
+        self.playlist_label = ttk.Label(
+            tracks_frame, text="Lista de reproducción:", style='Kaelith.Caption.TLabel'
         )
         self.playlist_label.pack(anchor='w')
         
         # Contenedor de pistas
-        self.tracks_container = tk.Frame(tracks_frame, bg='#2a3328')
+        self.tracks_container = tk.Frame(tracks_frame, bg=_ROW_BG)
         self.tracks_container.pack(fill=tk.X, pady=5)
         
         self._build_track_list()
@@ -344,83 +454,106 @@ class SoundTab(OptionsTab):
         # Registrar callback para actualizar cuando cambie la pista
         self.app.audio.register_track_change_callback(self._on_track_change)
     
-    def _build_track_list(self):
-        """Construye la lista de pistas con toggles."""
-        # Limpiar contenedor
-        for widget in self.tracks_container.winfo_children():
-            widget.destroy()
+    def _bind_control(self, widget: tk.Widget, action, hover: bool = False):
+        """
+        Asocia un botón de la barra de reproducción a los bindtags
+        compartidos en lugar de crear closures propias por widget.
         
-        playlist = self.app.audio.get_playlist('menu')
+        Args:
+            widget: Label que actúa como botón
+            action: Acción a ejecutar al hacer clic
+            hover: Aplicar el resaltado al pasar el ratón
+        """
+        widget._on_click = action
+        tags = (_CLICK_TAG, _HOVER_TAG) if hover else (_CLICK_TAG,)
+        widget.bindtags(tags + widget.bindtags())
+    
+    def _build_track_list(self):
+        """
+        Construye o sincroniza la lista de pistas: un único Treeview con
+        una fila por pista (marca + nombre). Si ya existe se reutiliza,
+        actualizando, moviendo, añadiendo o quitando solo las filas
+        necesarias en lugar de destruirlo y recrearlo.
+        """
+        playlist = self._menu_playlist
         if not playlist:
             return
         
-        self.track_toggles = []
-        
-        for track in playlist.tracks:
-            track_row = tk.Frame(self.tracks_container, bg='#2a3328')
-            track_row.pack(fill=tk.X, pady=2)
-            
-            # Checkbox simulado
-            toggle = tk.Label(
-                track_row,
-                text="✓" if track.enabled else "✗",
-                font=('Arial', 10),
-                fg='#6b8b5e' if track.enabled else '#666666',
-                bg='#2a3328',
-                width=2,
-                cursor='hand2'
-            )
-            toggle.pack(side=tk.LEFT)
-            toggle.bind('<Button-1>', lambda e, t=track, tog=toggle: self._toggle_track(t, tog))
-            
-            # Nombre de la pista
-            name = tk.Label(
-                track_row,
-                text=track.display_name,
-                font=('Garamond', 10),
-                fg='#f5f0e6' if track.enabled else '#666666',
-                bg='#2a3328',
-                anchor='w'
+        view = getattr(self, 'tracks_view', None)
+        if view is None:
+            view = self.tracks_view = ttk.Treeview(
+                self.tracks_container,
+                columns=('enabled', 'name'),
+                show='',
+                selectmode='none',
+                style='Kaelith.Tracks.Treeview'
             )
-            name.pack(side=tk.LEFT, padx=(5, 0), fill=tk.X, expand=True)
+            view.column('enabled', width=28, stretch=False, anchor='center')
+            view.column('name', anchor='w')
+            view.tag_configure('off', foreground=_MUTED)
+            view.pack(fill=tk.X)
             
-            self.track_toggles.append((track, toggle, name))
+            # Un único manejador para toda la lista
+            view.bind('<Button-1>', self._on_tracks_click)
+        
+        # Pistas por iid (su nombre de archivo)
+        previous = getattr(self, '_tracks_by_iid', {})
+        self._tracks_by_iid = {}
+        for index, track in enumerate(playlist.tracks):
+            iid = track.filename
+            values = (GLYPH_TICK if track.enabled else GLYPH_CROSS, track.display_name)
+            tags = () if track.enabled else ('off',)
+            if iid in previous:
+                view.item(iid, values=values, tags=tags)
+                view.move(iid, '', index)
+            else:
+                view.insert('', index, iid=iid, values=values, tags=tags)
+            self._tracks_by_iid[iid] = track
+        
+        # Quitar las filas de pistas que ya no están
+        stale = [iid for iid in previous if iid not in self._tracks_by_iid]
+        if stale:
+            view.delete(*stale)
+        view.configure(height=len(playlist.tracks))
+    
+    def _on_tracks_click(self, event):
+        """Alterna la pista cuya marca se pulsó."""
+        if self.tracks_view.identify_column(event.x) != '#1':
+            return
+        track = self._tracks_by_iid.get(self.tracks_view.identify_row(event.y))
+        if track is not None:
+            self._toggle_track(track)
     
-    def _toggle_track(self, track, toggle_label):
+    def _toggle_track(self, track):
         """Alterna el estado de una pista."""
-        track.enabled = not track.enabled
-        toggle_label.config(
-            text="✓" if track.enabled else "✗",
-            fg='#6b8b5e' if track.enabled else '#666666'
+        # set_track_enabled invalida la playlist y persiste la configuración
+        self.app.audio.set_track_enabled('menu', track.filename, not track.enabled)
+        self.tracks_view.item(
+            track.filename,
+            values=(GLYPH_TICK if track.enabled else GLYPH_CROSS, track.display_name),
+            tags=() if track.enabled else ('off',)
         )
-        # Actualizar nombre
-        for t, tog, name in self.track_toggles:
-            if t == track:
-                name.config(fg='#f5f0e6' if track.enabled else '#666666')
-                break
-        
-        self.app.audio.save_playlist_settings()
     
     def _toggle_shuffle(self):
         """Alterna modo aleatorio."""
-        playlist = self.app.audio.get_playlist('menu')
+        playlist = self._menu_playlist
         if playlist:
             new_state = not playlist.shuffle
             self.app.audio.set_shuffle('menu', new_state)
             self.shuffle_btn.config(
-                fg='#c4a574' if new_state else '#666666',
-                bg='#4a6741' if new_state else '#3a4338'
+                fg=_ACCENT if new_state else _MUTED,
+                bg=_ACTIVE_BG if new_state else _CONTROL_BG
             )
     
     def _toggle_repeat(self):
         """Alterna modo repetición."""
-        playlist = self.app.audio.get_playlist('menu')
+        playlist = self._menu_playlist
         if playlist:
             new_state = not playlist.repeat
             self.app.audio.set_repeat('menu', new_state)
             self.repeat_btn.config(
-                fg='#c4a574' if new_state else '#666666',
-                bg='#4a6741' if new_state else '#3a4338'
+                fg=_ACCENT if new_state else _MUTED,
+                bg=_ACTIVE_BG if new_state else _CONTROL_BG
             )
     
     def _on_previous(self):
@@ -442,167 +575,102 @@ class SoundTab(OptionsTab):
         if hasattr(self, 'track_name_label') and self.track_name_label.winfo_exists():
             self.track_name_label.config(text=track.display_name)
     
-    def _on_general_volume_change(self, value: float):
-        self.app.settings.set("volume", value)
-        self.app.audio.set_master_volume(value)
-    
-    def _on_music_volume_change(self, value: float):
-        self.app.settings.set("music_volume", value)
-        self.app.audio.set_music_volume(value)
-    
-    def _on_effects_volume_change(self, value: float):
-        self.app.settings.set("effects_volume", value)
-        self.app.audio.set_effects_volume(value)
-    
-    def update_texts(self):
+    def _on_volume_change(self, key: str, value: float):
+        """
+        Callback común de los tres sliders de volumen.
+        
+        Args:
+            key: Clave del ajuste ('volume', 'music_volume', 'effects_volume')
+            value: Nuevo volumen (0-1)
+        """
+        # Se aplica al momento y se guarda al pulsar Aplicar
+        self.app.settings.set_pending(key, value)
+        getattr(self.app.audio, self.VOLUME_SETTERS[key])(value)
+    
+    def reload_settings(self):
+        """Sincroniza los sliders con los volúmenes guardados."""
+        self.general_slider.set(self.app.settings.opts.volume)
+        self.music_slider.set(self.app.settings.opts.music_volume)
+        self.effects_slider.set(self.app.settings.opts.effects_volume)
+    
+    def _translate(self):
         """Actualiza los textos."""
-        self.general_slider.set_label(self.get_text('general_volume'))
-        self.music_slider.set_label(self.get_text('music_volume'))
-        self.effects_slider.set_label(self.get_text('effects_volume'))
-        self.current_track_label.config(text=self.get_text('current_track') + ":")
-        self.playlist_label.config(text=self.get_text('playlist') + ":")
-    
-    def destroy(self):
-        """Limpia recursos."""
-        try:
-            self.app.audio.unregister_track_change_callback(self._on_track_change)
-        except:
-            pass
-        super().destroy()
+        texts = self.app.get_text_table()
+        self.general_slider.set_label(texts.get('general_volume', 'general_volume'))
+        self.music_slider.set_label(texts.get('music_volume', 'music_volume'))
+        self.effects_slider.set_label(texts.get('effects_volume', 'effects_volume'))
+        for widget, key in (
+            (self.current_track_label, 'current_track'),
+            (self.playlist_label, 'playlist'),
+        ):
+            text = texts.get(key, key) + ":"
+            if self._applied_texts.get(widget) != text:
+                widget.config(text=text)
+                self._applied_texts[widget] = text
 
 
 class AccessibilityTab(OptionsTab):
     """Pestaña de opciones de accesibilidad."""
     
+    # Filas: (etiqueta, clave de traducción, texto inicial, creador del control)
+    ROWS = (
+        ('text_size_label', 'text_size', "Tamaño de texto", '_build_size_toggle'),
+        ('contrast_label', 'high_contrast', "Alto contraste", '_build_contrast_toggle'),
+    )
+    
     def __init__(self, parent, app: 'ChessWithKaelithApp', **kwargs):
         super().__init__(parent, app, **kwargs)
         self._build_ui()
     
     def _build_ui(self):
         """Construye la UI de opciones de accesibilidad."""
-        # === TAMAÑO DE TEXTO ===
-        text_size_frame = tk.Frame(self, bg='#2a3328')
-        text_size_frame.pack(fill=tk.X, pady=10, padx=10)
-        
-        self.text_size_label = tk.Label(
-            text_size_frame,
-            text="Tamaño de texto",
-            font=('Garamond', 13),
-            fg='#c4a574',
-            bg='#2a3328'
-        )
-        self.text_size_label.pack(side=tk.LEFT, padx=15, pady=12)
-        
-        # Botones de tamaño
-        sizes_frame = tk.Frame(text_size_frame, bg='#2a3328')
-        sizes_frame.pack(side=tk.RIGHT, padx=15, pady=10)
-        
-        self._text_size_var = tk.StringVar(
-            value=self.app.settings.get("text_size", "medium")
-        )
-        
-        self.size_buttons = {}
-        for size in ['small', 'medium', 'large']:
-            btn = tk.Label(
-                sizes_frame,
-                text=size.capitalize(),
-                font=('Garamond', 11),
-                bg='#3a4338',
-                fg='#f5f0e6',
-                padx=10,
-                pady=6,
-                cursor='hand2'
-            )
-            btn.pack(side=tk.LEFT)
-            btn.bind('<Button-1>', lambda e, s=size: self._set_text_size(s))
-            self.size_buttons[size] = btn
-        
-        self._update_text_size_buttons()
-        
-        # === ALTO CONTRASTE ===
-        contrast_frame = tk.Frame(self, bg='#2a3328')
-        contrast_frame.pack(fill=tk.X, pady=10, padx=10)
-        
-        self.contrast_label = tk.Label(
-            contrast_frame,
-            text="Alto contraste",
-            font=('Garamond', 13),
-            fg='#c4a574',
-            bg='#2a3328'
-        )
-        self.contrast_label.pack(side=tk.LEFT, padx=15, pady=12)
-        
-        # Toggle de contraste
-        toggle_frame = tk.Frame(contrast_frame, bg='#2a3328')
-        toggle_frame.pack(side=tk.RIGHT, padx=15, pady=10)
-        
-        self._contrast_var = tk.BooleanVar(
-            value=self.app.settings.get("high_contrast", False)
-        )
-        
-        self.contrast_off_btn = tk.Label(
-            toggle_frame,
-            text="Off",
-            font=('Garamond', 11),
-            bg='#3a4338',
-            fg='#f5f0e6',
-            padx=12,
-            pady=6,
-            cursor='hand2'
+        self._build_rows(self.ROWS)
+    
+    def _build_size_toggle(self, row: tk.Frame) -> tk.Widget:
+        """Crea el selector de tamaño de texto."""
+        self.size_toggle = SegmentedToggle(
+            row,
+            options=[(size, size.capitalize()) for size in ('small', 'medium', 'large')],
+            current=self.app.settings.opts.text_size,
+            command=self._set_text_size,
+            padx=10
         )
-        self.contrast_off_btn.pack(side=tk.LEFT)
-        
-        self.contrast_on_btn = tk.Label(
-            toggle_frame,
-            text="On",
-            font=('Garamond', 11),
-            bg='#3a4338',
-            fg='#f5f0e6',
-            padx=12,
-            pady=6,
-            cursor='hand2'
+        return self.size_toggle
+    
+    def _build_contrast_toggle(self, row: tk.Frame) -> tk.Widget:
+        """Crea el toggle de alto contraste."""
+        self.contrast_toggle = SegmentedToggle(
+            row,
+            options=[(False, "Off"), (True, "On")],
+            current=self.app.settings.opts.high_contrast,
+            command=self._set_contrast
         )
-        self.contrast_on_btn.pack(side=tk.LEFT)
-        
-        self._update_contrast_toggle()
-        
-        self.contrast_off_btn.bind('<Button-1>', lambda e: self._set_contrast(False))
-        self.contrast_on_btn.bind('<Button-1>', lambda e: self._set_contrast(True))
+        return self.contrast_toggle
     
-    def _update_text_size_buttons(self):
-        """Actualiza el visual de los botones de tamaño."""
-        current = self._text_size_var.get()
-        for size, btn in self.size_buttons.items():
-            btn.config(bg='#4a6741' if size == current else '#3a4338')
+    def reload_settings(self):
+        """Sincroniza los selectores con los ajustes guardados."""
+        self.size_toggle.set(self.app.settings.opts.text_size)
+        self.contrast_toggle.set(self.app.settings.opts.high_contrast)
     
     def _set_text_size(self, size: str):
-        """Establece el tamaño de texto."""
-        self._text_size_var.set(size)
-        self._update_text_size_buttons()
-        self.app.settings.set("text_size", size)
-    
-    def _update_contrast_toggle(self):
-        """Actualiza el toggle de contraste."""
-        is_on = self._contrast_var.get()
-        self.contrast_off_btn.config(bg='#4a6741' if not is_on else '#3a4338')
-        self.contrast_on_btn.config(bg='#4a6741' if is_on else '#3a4338')
+        """Establece el tamaño de texto (el selector ya se actualizó)."""
+        self.app.settings.set_pending("text_size", size)
     
     def _set_contrast(self, enabled: bool):
-        """Establece el alto contraste."""
-        self._contrast_var.set(enabled)
-        self._update_contrast_toggle()
-        self.app.settings.set("high_contrast", enabled)
+        """Establece el alto contraste (el toggle ya se actualizó)."""
+        self.app.settings.set_pending("high_contrast", enabled)
     
-    def update_texts(self):
+    def _translate(self):
         """Actualiza los textos."""
-        self.text_size_label.config(text=self.get_text('text_size'))
-        self.contrast_label.config(text=self.get_text('high_contrast'))
-        self.contrast_off_btn.config(text=self.get_text('off'))
-        self.contrast_on_btn.config(text=self.get_text('on'))
-        
-        # Actualizar botones de tamaño
-        for size, btn in self.size_buttons.items():
-            btn.config(text=self.get_text(size))
+        self._apply_row_texts(self.ROWS)
+        texts = self.app.get_text_table()
+        self.contrast_toggle.set_labels({
+            False: texts.get('off', 'off'),
+            True: texts.get('on', 'on'),
+        })
+        self.size_toggle.set_labels({
+            size: texts.get(size, size) for size in ('small', 'medium', 'large')
+        })
 
 
 class OptionsMenuScreen(BaseScreen):
@@ -615,7 +683,14 @@ class OptionsMenuScreen(BaseScreen):
         """Inicializa la pantalla de opciones."""
         self.tabs = {}
         self.tab_buttons = {}
+        # Último estilo aplicado a cada botón de pestaña
+        self._tab_button_styles = {}
         self._current_tab = 'video'
+        # Pantalla visible y cambio de idioma pendiente mientras estaba oculta
+        self._visible = True
+        self._texts_dirty = False
+        # Idioma con el que se tradujo la pantalla por última vez
+        self._texts_language = None
         super().__init__(parent, app, **kwargs)
     
     def _build_ui(self):
@@ -624,25 +699,23 @@ class OptionsMenuScreen(BaseScreen):
         self.main_frame = SemiTransparentFrame(
             self,
             alpha=0.92,
-            color='#1a2318'
+            color=_TAB_BG
         )
         self.main_frame.place(relx=0.5, rely=0.5, anchor='center')
         
-        inner = tk.Frame(self.main_frame, bg='#1a2318')
+        inner = tk.Frame(self.main_frame, bg=_TAB_BG)
         inner.pack(padx=40, pady=30)
         
         # === TÍTULO ===
-        self.title_label = tk.Label(
+        self.title_label = ttk.Label(
             inner,
             text="Opciones",
-            font=('Palatino Linotype', 28, 'bold'),
-            fg='#c4a574',
-            bg='#1a2318'
+            style='Kaelith.Heading.TLabel'
         )
         self.title_label.pack(pady=(0, 20))
         
         # === PESTAÑAS ===
-        tabs_frame = tk.Frame(inner, bg='#1a2318')
+        tabs_frame = tk.Frame(inner, bg=_TAB_BG)
         tabs_frame.pack(fill=tk.X, pady=(0, 15))
         
         for tab_key in ['video', 'sound', 'accessibility']:
@@ -650,35 +723,38 @@ class OptionsMenuScreen(BaseScreen):
                 tabs_frame,
                 text=tab_key.capitalize(),
                 font=('Garamond', 12, 'bold'),
-                bg='#2a3328',
-                fg='#c4a574',
                 padx=20,
                 pady=10,
-                cursor='hand2'
+                cursor='hand2',
+                **_TAB_INACTIVE_STYLE
             )
+            self._tab_button_styles[btn] = _TAB_INACTIVE_STYLE
             btn.pack(side=tk.LEFT, padx=2)
-            btn.bind('<Button-1>', lambda e, k=tab_key: self._switch_tab(k))
+            btn.bind('<Button-1>', self._on_tab_click)
+            btn._tab_key = tab_key
             self.tab_buttons[tab_key] = btn
         
         # === CONTENEDOR DE CONTENIDO ===
-        self.content_frame = tk.Frame(inner, bg='#1a2318', width=450, height=420)
+        self.content_frame = tk.Frame(inner, bg=_TAB_BG, width=450, height=420)
         self.content_frame.pack(fill=tk.BOTH, expand=True)
         self.content_frame.pack_propagate(False)
         
-        # Crear pestañas
-        self.tabs['video'] = VideoTab(self.content_frame, self.app)
-        self.tabs['sound'] = SoundTab(self.content_frame, self.app)
-        self.tabs['accessibility'] = AccessibilityTab(self.content_frame, self.app)
+        # Las pestañas se construyen la primera vez que se muestran
+        self._tab_factories = {
+            'video': VideoTab,
+            'sound': SoundTab,
+            'accessibility': AccessibilityTab,
+        }
         
         # Mostrar pestaña inicial
         self._switch_tab('video')
         
         # === SEPARADOR ===
-        separator = tk.Frame(inner, bg='#4a6741', height=2)
+        separator = tk.Frame(inner, bg=_ACTIVE_BG, height=2)
         separator.pack(fill=tk.X, pady=20, padx=10)
         
         # === BOTONES ===
-        buttons_frame = tk.Frame(inner, bg='#1a2318')
+        buttons_frame = tk.Frame(inner, bg=_TAB_BG)
         buttons_frame.pack(fill=tk.X)
         
         # Botón Descartar (izquierda)
@@ -717,55 +793,148 @@ class OptionsMenuScreen(BaseScreen):
         )
         self.back_button.pack(side=tk.RIGHT, padx=5)
     
+    def _get_tab(self, tab_key: str) -> OptionsTab:
+        """
+        Obtiene una pestaña, construyéndola si aún no existe.
+        
+        Args:
+            tab_key: Clave de la pestaña ('video', 'sound', 'accessibility')
+            
+        Returns:
+            La pestaña, ya con los textos del idioma actual
+        """
+        tab = self.tabs.get(tab_key)
+        if tab is None:
+            tab = self._tab_factories[tab_key](self.content_frame, self.app)
+            tab.update_texts()
+            # Todas las pestañas ocupan el mismo sitio; se cambia de una a
+            # otra por orden de apilamiento, sin recalcular la geometría
+            tab.place(x=0, y=0, relwidth=1, relheight=1)
+            self.tabs[tab_key] = tab
+        return tab
+    
+    @classmethod
+    def prewarm(cls, app: 'ChessWithKaelithApp'):
+        """
+        Resuelve de antemano las fuentes de los glifos de la pestaña de
+        sonido: medir el texto obliga a Tk a cargar la fuente emoji y sus
+        sustitutas, que de otro modo se cargarían al abrir las opciones.
+        """
+        for font, text in (
+            (_EMOJI_FONT, GLYPH_PREV + GLYPH_NEXT),
+            (_EMOJI_FONT_SMALL, GLYPH_SHUFFLE + GLYPH_REPEAT),
+            (('Garamond', 10), GLYPH_TICK + GLYPH_CROSS),
+            (('Garamond', 12, 'bold'), GLYPH_MUSIC),
+        ):
+            tkfont.Font(root=app.root, font=font).measure(text)
+    
+    def _on_tab_click(self, event):
+        """Manejador compartido por los botones de pestaña."""
+        self._switch_tab(event.widget._tab_key)
+    
     def _switch_tab(self, tab_key: str):
         """Cambia a una pestaña específica."""
-        # Ocultar todas las pestañas
-        for tab in self.tabs.values():
-            tab.pack_forget()
-        
-        # Mostrar la pestaña seleccionada
-        self.tabs[tab_key].pack(fill=tk.BOTH, expand=True)
+        # Traer al frente la pestaña seleccionada (con los textos que
+        # tuviera pendientes); las demás quedan debajo, tapadas
+        tab = self._get_tab(tab_key)
+        tab.refresh_texts()
+        tab.lift()
         self._current_tab = tab_key
         
-        # Actualizar visual de botones
+        # Actualizar visual de botones: solo los que cambian de estado
         for key, btn in self.tab_buttons.items():
-            if key == tab_key:
-                btn.config(bg='#4a6741', fg='#f5f0e6')
-            else:
-                btn.config(bg='#2a3328', fg='#c4a574')
+            self._set_tab_button_style(btn, key == tab_key)
+    
+    def _set_tab_button_style(self, btn: tk.Label, active: bool):
+        """Aplica el estilo activo/inactivo, omitiendo el config si no cambia."""
+        style = _TAB_ACTIVE_STYLE if active else _TAB_INACTIVE_STYLE
+        if self._tab_button_styles.get(btn) is not style:
+            btn.config(**style)
+            self._tab_button_styles[btn] = style
+    
+    def on_show(self, **kwargs):
+        """Sincroniza los controles al volver a la pantalla."""
+        self._visible = True
+        if self._texts_dirty:
+            self._update_texts()
+        
+        # El volumen general también se ajusta desde el menú principal
+        sound_tab = self.tabs.get('sound')
+        if sound_tab is not None:
+            sound_tab.general_slider.set(self.app.settings.opts.volume)
+    
+    def on_hide(self):
+        """Marca la pantalla como oculta."""
+        self._visible = False
+    
+    def _on_language_change(self):
+        """Callback de idioma: si la pantalla está oculta, lo aplaza a on_show."""
+        if self._visible:
+            self._update_texts()
+        else:
+            self._texts_dirty = True
     
     def _update_texts(self):
-        """Actualiza los textos."""
-        self.title_label.config(text=self.get_text('options'))
-        self.discard_button.set_text(self.get_text('discard'))
-        self.apply_button.set_text(self.get_text('apply'))
-        self.back_button.set_text(self.get_text('back'))
+        """Actualiza los textos (nada que hacer si el idioma no cambió)."""
+        self._texts_dirty = False
+        language = self.app.i18n.get_language()
+        if language == self._texts_language:
+            return
+        self._texts_language = language
+        
+        texts = self.app.get_text_table()
+        self.title_label.config(text=texts.get('options', 'options'))
+        self.discard_button.set_text(texts.get('discard', 'discard'))
+        self.apply_button.set_text(texts.get('apply', 'apply'))
+        self.back_button.set_text(texts.get('back', 'back'))
         
         # Actualizar botones de pestañas
-        self.tab_buttons['video'].config(text=self.get_text('video'))
-        self.tab_buttons['sound'].config(text=self.get_text('sound'))
-        self.tab_buttons['accessibility'].config(text=self.get_text('accessibility'))
+        for key, btn in self.tab_buttons.items():
+            btn.config(text=texts.get(key, key))
         
-        # Actualizar contenido de pestañas
-        for tab in self.tabs.values():
-            tab.update_texts()
+        # Actualizar la pestaña visible; las demás, al volver a mostrarse
+        for key, tab in self.tabs.items():
+            if key == self._current_tab:
+                tab.update_texts()
+            else:
+                tab.invalidate_texts()
     
     def _on_discard(self):
         """Descarta los cambios y recarga las opciones."""
         self.app.play_effect('button_discard')
-        # Recargar configuración desde archivo
-        self.app.settings._load()
-        # Aplicar volúmenes guardados
-        self.app.audio.set_master_volume(self.app.settings.get("volume", 0.7))
-        self.app.audio.set_music_volume(self.app.settings.get("music_volume", 0.7))
-        self.app.audio.set_effects_volume(self.app.settings.get("effects_volume", 0.8))
-        # Recargar la pantalla
-        self.navigate_to('options')
+        opts = self.app.settings.opts
+        shown_resolution = opts.resolution
+        shown_fullscreen = opts.fullscreen
+        # Olvidar los cambios sin aplicar, volúmenes incluidos (no hace
+        # falta releer el archivo)
+        self.app.settings.discard_pending()
+        # Volver a los volúmenes guardados
+        self.app.audio.set_master_volume(opts.volume)
+        self.app.audio.set_music_volume(opts.music_volume)
+        self.app.audio.set_effects_volume(opts.effects_volume)
+        # Y al modo de pantalla y la resolución guardados, si se había
+        # cambiado la ventana
+        fullscreen_changed = opts.fullscreen != shown_fullscreen
+        if fullscreen_changed:
+            self.app.apply_fullscreen(opts.fullscreen)
+        saved_size = RESOLUTION_MAP.get(opts.resolution)
+        window_changed = fullscreen_changed or opts.resolution != shown_resolution
+        if window_changed and saved_size and not opts.fullscreen:
+            width, height = saved_size
+            self.app.root.geometry(f"{width}x{height}")
+        # Devolver los controles ya construidos a los valores guardados
+        self._reload_from_settings()
+    
+    def _reload_from_settings(self):
+        """Sincroniza en sitio las pestañas construidas con los ajustes."""
+        for tab in self.tabs.values():
+            tab.reload_settings()
     
     def _on_apply(self):
         """Aplica y guarda los cambios."""
         self.app.play_effect('button_apply')
-        self.app.settings.save()
+        # Único punto de guardado de los cambios pendientes de las pestañas
+        self.app.settings.commit_pending()
     
     def _on_back(self):
         """Vuelve al menú principal."""
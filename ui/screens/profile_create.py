@@ -7,6 +7,7 @@ Pantalla para crear nuevos perfiles de jugador.
 """
 
 import tkinter as tk
+from tkinter import ttk
 from typing import TYPE_CHECKING
 
 from ui.screens.base_screen import BaseScreen
@@ -48,12 +49,10 @@ class ProfileCreateScreen(BaseScreen):
         
 
         # === TÍTULO ===
-        self.title_label = tk.Label(
+        self.title_label = ttk.Label(
             inner,
             text="Nuevo Perfil",
-            font=('Palatino Linotype', 28, 'bold'),
-            fg='#c4a574',
-            bg='#1a2318'
+            style='Kaelith.Heading.TLabel'
         )
         self.title_label.pack(pady=(0, 10))
 
@@ -69,12 +68,10 @@ class ProfileCreateScreen(BaseScreen):
         
 
         # === INSTRUCCIONES ===
-        self.instruction_label = tk.Label(
+        self.instruction_label = ttk.Label(
             inner,
             text="Introduce tu apodo",
-            font=('Garamond', 14),
-            fg='#8b7355',
-            bg='#1a2318'
+            style='Kaelith.Prompt.TLabel'
         )
         self.instruction_label.pack(pady=(0, 15))
         
@@ -89,12 +86,10 @@ class ProfileCreateScreen(BaseScreen):
         
 
         # Mensaje de error (oculto inicialmente)
-        self.error_label = tk.Label(
+        self.error_label = ttk.Label(
             inner,
             text="",
-            font=('Garamond', 11),
-            fg='#cc4444',
-            bg='#1a2318'
+            style='Kaelith.Error.TLabel'
         )
         self.error_label.pack(pady=5)
         
@@ -139,13 +134,22 @@ class ProfileCreateScreen(BaseScreen):
         self.nickname_entry.entry.bind('<Return>', lambda e: self._on_create())
     
 
+    def on_show(self, **kwargs):
+        """Limpia el formulario al volver a la pantalla."""
+        self.nickname_entry.clear()
+        self._clear_error()
+    
+
     def _update_texts(self):
         """Actualiza los textos."""
-        self.title_label.config(text=self.get_text('new_profile'))
-        self.instruction_label.config(text=self.get_text('enter_nickname'))
-        self.nickname_entry.set_placeholder(self.get_text('nickname_placeholder'))
-        self.create_button.set_text(self.get_text('create'))
-        self.cancel_button.set_text(self.get_text('cancel'))
+        texts = self.app.get_text_table()
+        self.title_label.config(text=texts.get('new_profile', 'new_profile'))
+        self.instruction_label.config(text=texts.get('enter_nickname', 'enter_nickname'))
+        self.nickname_entry.set_placeholder(
+            texts.get('nickname_placeholder', 'nickname_placeholder')
+        )
+        self.create_button.set_text(texts.get('create', 'create'))
+        self.cancel_button.set_text(texts.get('cancel', 'cancel'))
 
     
     def _show_error(self, message: str):
@@ -162,17 +166,15 @@ class ProfileCreateScreen(BaseScreen):
         """Maneja la creación del perfil."""
         self._clear_error()
         
-        nickname = self.nickname_entry.get().strip()
+        # Recortar a 20 caracteres en la misma pasada (el slice no copia
+        # si ya es más corto). StyledEntry.get() descarta el placeholder.
+        nickname = self.nickname_entry.get().strip()[:20]
         
 
         # Validar nickname
         if not nickname:
             self._show_error(self.get_text('nickname_empty'))
             return
-        
-        
-        if len(nickname) > 20:
-            nickname = nickname[:20]
 
         
         # Intentar crear perfil
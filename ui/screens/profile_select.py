@@ -7,7 +7,7 @@ Pantalla para seleccionar o crear perfiles de jugador.
 """
 
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import messagebox, ttk
 from typing import TYPE_CHECKING, Optional
 
 from ui.screens.base_screen import BaseScreen
@@ -18,6 +18,54 @@ if TYPE_CHECKING:
     from core.app import ChessWithKaelithApp
 
 
+# Etiqueta de eventos compartida por todas las tarjetas: los manejadores se
+# registran una sola vez y cada widget sabe a qué tarjeta pertenece
+_CARD_TAG = 'KaelithProfileCard'
+_DELETE_TAG = 'KaelithProfileDelete'
+
+
+def _on_card_enter(event):
+    """Hover enter sobre cualquier parte de una tarjeta."""
+    event.widget._profile_card._on_enter(event)
+
+
+def _on_card_leave(event):
+    """Hover leave sobre cualquier parte de una tarjeta."""
+    event.widget._profile_card._on_leave(event)
+
+
+def _on_card_click(event):
+    """Click sobre cualquier parte de una tarjeta."""
+    event.widget._profile_card._on_click(event)
+
+
+def _on_delete_click(event):
+    """Click sobre el botón eliminar de una tarjeta."""
+    return event.widget._profile_card._on_delete_click(event)
+
+
+def _on_delete_enter(event):
+    """Resalta el botón eliminar."""
+    event.widget.tk.call(event.widget._w, 'configure', '-fg', '#cc4444')
+
+
+def _on_delete_leave(event):
+    """Quita el resaltado del botón eliminar."""
+    event.widget.tk.call(event.widget._w, 'configure', '-fg', '#666666')
+
+
+def _bind_card_class(widget: tk.Misc):
+    """Registra (una sola vez por intérprete) los manejadores de tarjeta."""
+    if widget.bind_class(_CARD_TAG):
+        return
+    widget.bind_class(_CARD_TAG, '<Enter>', _on_card_enter)
+    widget.bind_class(_CARD_TAG, '<Leave>', _on_card_leave)
+    widget.bind_class(_CARD_TAG, '<Button-1>', _on_card_click)
+    widget.bind_class(_DELETE_TAG, '<Button-1>', _on_delete_click)
+    widget.bind_class(_DELETE_TAG, '<Enter>', _on_delete_enter)
+    widget.bind_class(_DELETE_TAG, '<Leave>', _on_delete_leave)
+
+
 class ProfileCard(tk.Frame):
 
     """
@@ -53,12 +101,10 @@ class ProfileCard(tk.Frame):
         self.texts = texts or {}
         
         self._is_hovered = False
+        self._hover_pending = False
+        # Últimos valores pintados, para no reconfigurar labels sin cambios
+        self._shown = None
         self._build_ui()
-        
-        # Bindings
-        self.bind('<Enter>', self._on_enter)
-        self.bind('<Leave>', self._on_leave)
-        self.bind('<Button-1>', self._on_click)
     
 
     def _build_ui(self):
@@ -68,126 +114,123 @@ class ProfileCard(tk.Frame):
         self.configure(
             highlightbackground='#4a6741',
             highlightthickness=2,
-            highlightcolor='#6b8b5e'
+            highlightcolor='#6b8b5e',
+            # El cursor solo se ve con el ratón encima: se fija una vez
+            cursor='hand2',
+            # Márgenes internos en el propio marco: sin contenedor extra
+            padx=15,
+            pady=12
         )
         
 
-        # Contenedor interno
-        inner = tk.Frame(self, bg='#2a3328')
-        inner.pack(fill=tk.BOTH, expand=True, padx=15, pady=12)
-        
-
-        # Fila superior: Nombre y nivel
-        top_row = tk.Frame(inner, bg='#2a3328')
-        top_row.pack(fill=tk.X)
+        # Una sola rejilla sobre la tarjeta en lugar de marcos anidados:
+        # icono | nombre y nivel | eliminar, y debajo partidas | victorias
+        self.columnconfigure(1, weight=1)
         
 
         # Icono de perfil
         icon_label = tk.Label(
-            top_row,
+            self,
             text="👤",
             font=('Segoe UI Emoji', 24),
             bg='#2a3328',
             fg='#c4a574'
         )
-        icon_label.pack(side=tk.LEFT, padx=(0, 10))
-        
-
-        # Info del perfil
-        info_frame = tk.Frame(top_row, bg='#2a3328')
-        info_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        icon_label.grid(row=0, column=0, rowspan=2, padx=(0, 10))
         
 
         # Nickname
-        self.name_label = tk.Label(
-            info_frame,
+        self.name_label = ttk.Label(
+            self,
             text=self.profile.nickname,
-            font=('Garamond', 16, 'bold'),
-            fg='#f5f0e6',
-            bg='#2a3328',
+            style='Kaelith.CardName.TLabel',
             anchor='w'
         )
-        self.name_label.pack(fill=tk.X)
+        self.name_label.grid(row=0, column=1, sticky='ew')
         
 
         # Estadísticas
-        level_text = self.texts.get('level', 'Nivel')
-        stats_text = f"{level_text} {self.profile.current_level}"
-        self.stats_label = tk.Label(
-            info_frame,
-            text=stats_text,
-            font=('Garamond', 11),
-            fg='#8b7355',
-            bg='#2a3328',
+        self.stats_label = ttk.Label(
+            self,
+            style='Kaelith.CardStats.TLabel',
             anchor='w'
         )
-        self.stats_label.pack(fill=tk.X)
+        self.stats_label.grid(row=1, column=1, sticky='ew')
         
 
         # Botón eliminar
         self.delete_btn = tk.Label(
-            top_row,
+            self,
             text="✕",
             font=('Arial', 14, 'bold'),
             fg='#666666',
             bg='#2a3328',
             cursor='hand2'
         )
-        self.delete_btn.pack(side=tk.RIGHT, padx=5)
-        self.delete_btn.bind('<Button-1>', self._on_delete_click)
-        self.delete_btn.bind('<Enter>', lambda e: self.delete_btn.config(fg='#cc4444'))
-        self.delete_btn.bind('<Leave>', lambda e: self.delete_btn.config(fg='#666666'))
+        self.delete_btn.grid(row=0, column=2, rowspan=2, sticky='e', padx=5)
         
 
         # Fila inferior: Partidas
-        bottom_row = tk.Frame(inner, bg='#2a3328')
-        bottom_row.pack(fill=tk.X, pady=(8, 0))
+        self.games_label = ttk.Label(self, style='Kaelith.CardGames.TLabel')
+        self.games_label.grid(row=2, column=0, columnspan=2, sticky='w', pady=(8, 0))
         
 
-        games_text = self.texts.get('games_played', 'Partidas')
-        wins_text = self.texts.get('wins', 'Victorias')
+        self.wins_label = ttk.Label(self, style='Kaelith.CardWins.TLabel')
+        self.wins_label.grid(row=2, column=2, sticky='e', pady=(8, 0))
         
 
-        games_label = tk.Label(
-            bottom_row,
-            text=f"🎮 {games_text}: {self.profile.games_played}",
-            font=('Garamond', 10),
-            fg='#6b8b5e',
-            bg='#2a3328'
-        )
-        games_label.pack(side=tk.LEFT)
-        
-
-        wins_label = tk.Label(
-            bottom_row,
-            text=f"🏆 {wins_text}: {self.profile.games_won}",
-            font=('Garamond', 10),
-            fg='#c4a574',
-            bg='#2a3328'
-        )
-        wins_label.pack(side=tk.RIGHT)
+        self._refresh_labels()
         
 
-        # Hacer que los labels internos también disparen el evento
-        for widget in [inner, top_row, info_frame, self.name_label, 
-                       self.stats_label, bottom_row, games_label, wins_label, icon_label]:
-            widget.bind('<Enter>', self._on_enter)
-            widget.bind('<Leave>', self._on_leave)
-            widget.bind('<Button-1>', self._on_click)
+        # La tarjeta y sus widgets internos disparan los mismos eventos a
+        # través de la etiqueta compartida (sin binds por widget)
+        _bind_card_class(self)
+        for widget in [self, self.name_label, self.stats_label, self.games_label,
+                       self.wins_label, icon_label]:
+            widget._profile_card = self
+            tags = widget.bindtags()
+            widget.bindtags((tags[0], _CARD_TAG) + tags[1:])
+        self.delete_btn._profile_card = self
+        tags = self.delete_btn.bindtags()
+        self.delete_btn.bindtags((tags[0], _DELETE_TAG) + tags[1:])
     
 
     def _on_enter(self, event):
         """Hover enter."""
-        self._is_hovered = True
-        self.configure(highlightbackground='#6b8b5e')
-        self.configure(cursor='hand2')
+        self._set_hover(True)
     
 
     def _on_leave(self, event):
         """Hover leave."""
-        self._is_hovered = False
-        self.configure(highlightbackground='#4a6741')
-        self.configure(cursor='')
+        self._set_hover(False)
+    
+
+    def _set_hover(self, hovered: bool):
+        """
+        Registra el estado de hover y lo aplica en el siguiente idle: al
+        moverse entre widgets internos de la misma tarjeta llegan pares
+        Leave/Enter que así se anulan sin tocar el borde.
+        
+        Args:
+            hovered: Si el ratón está sobre la tarjeta
+        """
+        self._hover_target = hovered
+        if not self._hover_pending:
+            self._hover_pending = True
+            self.after_idle(self._apply_hover)
+    
+
+    def _apply_hover(self):
+        """Aplica el estado de hover pendiente (solo si ha cambiado)."""
+        self._hover_pending = False
+        if self._hover_target == self._is_hovered:
+            return
+        self._is_hovered = self._hover_target
+        # Llamada directa a Tcl: evita el reparto de opciones de configure()
+        self.tk.call(
+            self._w, 'configure',
+            '-highlightbackground', '#6b8b5e' if self._is_hovered else '#4a6741'
+        )
     
 
     def _on_click(self, event):
@@ -197,18 +240,64 @@ class ProfileCard(tk.Frame):
     
 
     def _on_delete_click(self, event):
-        """Click en eliminar."""
-        event.widget.master.master.master  # Stop propagation
+        """Click en eliminar (devuelve "break" para no propagar el click)."""
         if self.on_delete:
             self.on_delete(self.profile)
         return "break"
     
 
+    @staticmethod
+    def build_prefixes(texts: dict) -> tuple:
+        """
+        Construye los prefijos fijos de las estadísticas (comunes a todas
+        las tarjetas de un mismo idioma).
+        
+        Args:
+            texts: Diccionario de textos traducidos
+            
+        Returns:
+            Tupla (nivel, partidas, victorias)
+        """
+        return (
+            f"{texts.get('level', 'Nivel')} ",
+            f"🎮 {texts.get('games_played', 'Partidas')}: ",
+            f"🏆 {texts.get('wins', 'Victorias')}: ",
+        )
+    
+
+    def _refresh_labels(self):
+        """Pinta los datos del perfil, tocando solo los labels que cambian."""
+        prefixes = self.texts.get('prefixes') or ProfileCard.build_prefixes(self.texts)
+        level_prefix, games_prefix, wins_prefix = prefixes
+        shown = (
+            self.profile.nickname,
+            level_prefix + str(self.profile.current_level),
+            games_prefix + str(self.profile.games_played),
+            wins_prefix + str(self.profile.games_won),
+        )
+        previous = self._shown or (None,) * len(shown)
+        labels = (self.name_label, self.stats_label, self.games_label, self.wins_label)
+        for label, text, old_text in zip(labels, shown, previous):
+            if text != old_text:
+                label.config(text=text)
+        self._shown = shown
+    
+
+    def update_profile(self, profile: PlayerProfile):
+        """
+        Reutiliza la tarjeta para otro perfil (o el mismo con nuevos datos).
+        
+        Args:
+            profile: Datos del perfil
+        """
+        self.profile = profile
+        self._refresh_labels()
+    
+
     def update_texts(self, texts: dict):
         """Actualiza los textos."""
         self.texts = texts
-        level_text = self.texts.get('level', 'Nivel')
-        self.stats_label.config(text=f"{level_text} {self.profile.current_level}")
+        self._refresh_labels()
 
 
 class ProfileSelectScreen(BaseScreen):
@@ -221,7 +310,11 @@ class ProfileSelectScreen(BaseScreen):
 
     def __init__(self, parent: tk.Widget, app: 'ChessWithKaelithApp', **kwargs):
         """Inicializa la pantalla de selección de perfil."""
+        # Tarjetas creadas; las sobrantes quedan ocultas para reutilizarse
         self.profile_cards = []
+        self._visible_cards = 0
+        # Versión de los perfiles ya pintada (None: nunca se han cargado)
+        self._profiles_version = None
         super().__init__(parent, app, **kwargs)
     
 
@@ -243,12 +336,10 @@ class ProfileSelectScreen(BaseScreen):
 
         
         # === TÍTULO ===
-        self.title_label = tk.Label(
+        self.title_label = ttk.Label(
             inner,
             text="Seleccionar Perfil",
-            font=('Palatino Linotype', 28, 'bold'),
-            fg='#c4a574',
-            bg='#1a2318'
+            style='Kaelith.Heading.TLabel'
         )
         self.title_label.pack(pady=(0, 25))
         
@@ -258,8 +349,12 @@ class ProfileSelectScreen(BaseScreen):
         self.profiles_frame.pack(fill=tk.BOTH, expand=True)
         
 
-        # Cargar perfiles
-        self._load_profiles()
+        # Mensaje si no hay perfiles (se muestra u oculta en _load_profiles)
+        self.no_profiles_label = ttk.Label(
+            self.profiles_frame,
+            style='Kaelith.Prompt.TLabel',
+            padding=(0, 30)
+        )
         
 
         # === SEPARADOR ===
@@ -296,81 +391,112 @@ class ProfileSelectScreen(BaseScreen):
             primary=False
         )
         self.back_button.pack(side=tk.RIGHT, padx=5)
+        
+
+        # Cargar perfiles (después de crear el botón, cuyo estado depende de ellos)
+        self._load_profiles()
 
     
     def _load_profiles(self):
 
         """Carga y muestra los perfiles existentes."""
 
-        # Limpiar tarjetas existentes
-        for card in self.profile_cards:
-            card.destroy()
-        self.profile_cards.clear()
-        
-        # Limpiar contenedor
-        for widget in self.profiles_frame.winfo_children():
-            widget.destroy()
+        # Sin cambios desde la última carga: las tarjetas ya están al día
+        # (los cambios de idioma los aplica _update_texts)
+        version = self.app.profiles.version
+        if version == self._profiles_version:
+            return
+        self._profiles_version = version
         
         profiles = self.app.profiles.get_all_profiles()
+        texts = self.app.get_text_table()
         
         if not profiles:
             # Mensaje si no hay perfiles
-            self.no_profiles_label = tk.Label(
-                self.profiles_frame,
-                text=self.get_text('no_profiles'),
-                font=('Garamond', 14),
-                fg='#8b7355',
-                bg='#1a2318',
-                pady=30
-            )
+            self.no_profiles_label.config(text=texts.get('no_profiles', 'no_profiles'))
             self.no_profiles_label.pack()
 
         else:
-            # Mostrar perfiles
-            texts = {
-                'level': self.get_text('level'),
-                'games_played': self.get_text('games_played'),
-                'wins': self.get_text('wins'),
-            }
-            
-            for profile in profiles:
+            self.no_profiles_label.pack_forget()
+        
+
+        # Reutilizar las tarjetas existentes en orden y crear solo las que
+        # falten (textos resueltos una vez para todas las tarjetas)
+        card_texts = self._card_texts(texts)
+        for index, profile in enumerate(profiles):
+            if index < len(self.profile_cards):
+                card = self.profile_cards[index]
+                card.texts = card_texts
+                card.update_profile(profile)
+                if index >= self._visible_cards:
+                    card.pack(fill=tk.X, pady=6, padx=5)
+            else:
                 card = ProfileCard(
                     self.profiles_frame,
                     profile=profile,
                     on_select=self._on_profile_select,
                     on_delete=self._on_profile_delete,
-                    texts=texts
+                    texts=card_texts
                 )
                 card.pack(fill=tk.X, pady=6, padx=5)
                 self.profile_cards.append(card)
         
 
+        # Ocultar las sobrantes (siempre al final, así el orden se mantiene)
+        for card in self.profile_cards[len(profiles):self._visible_cards]:
+            card.pack_forget()
+        self._visible_cards = len(profiles)
+        
+
         # Actualizar estado del botón crear
-        if not self.app.profiles.can_create_profile:
-            self.create_button.set_enabled(False)
+        self.create_button.set_enabled(self.app.profiles.can_create_profile)
+    
+
+    def on_show(self, **kwargs):
+        """Recarga los perfiles al volver a la pantalla."""
+        self._load_profiles()
+    
+
+    @staticmethod
+    def _card_texts(texts: dict) -> dict:
+
+        """
+        Extrae los textos que usan las tarjetas de perfil.
+        
+        Args:
+            texts: Tabla de textos del idioma actual
+            
+        Returns:
+            Diccionario con los textos de las tarjetas (y sus prefijos ya
+            compuestos, compartidos por todas)
+        """
+
+        card_texts = {key: texts.get(key, key) for key in ('level', 'games_played', 'wins')}
+        card_texts['prefixes'] = ProfileCard.build_prefixes(card_texts)
+        return card_texts
     
 
     def _update_texts(self):
 
         """Actualiza los textos."""
 
-        self.title_label.config(text=self.get_text('select_profile'))
-        self.create_button.set_text(self.get_text('create_profile'))
-        self.back_button.set_text(self.get_text('back'))
+        texts = self.app.get_text_table()
+        self.title_label.config(text=texts.get('select_profile', 'select_profile'))
+        self.create_button.set_text(texts.get('create_profile', 'create_profile'))
+        self.back_button.set_text(texts.get('back', 'back'))
 
         
-        # Actualizar mensaje si no hay perfiles
-        if hasattr(self, 'no_profiles_label'):
-            self.no_profiles_label.config(text=self.get_text('no_profiles'))
+        # Actualizar mensaje solo si está visible (_load_profiles lo
+        # reescribe al volver a mostrarlo)
+        if not self._visible_cards:
+            self.no_profiles_label.config(text=texts.get('no_profiles', 'no_profiles'))
         
-        # Actualizar tarjetas
-        texts = {
-            'level': self.get_text('level'),
-            'games_played': self.get_text('games_played'),
-            'wins': self.get_text('wins'),
-        }
-        for card in self.profile_cards:
-            card.update_texts(texts)
+        # Actualizar tarjetas visibles (las ocultas se repintan al reutilizarse)
+        card_texts = self._card_texts(texts)
+        for card in self.profile_cards[:self._visible_cards]:
+            card.update_texts(card_texts)
+        for card in self.profile_cards[self._visible_cards:]:
+            card.texts = card_texts
     
 
     def _on_profile_select(self, profile: PlayerProfile):